@@ -0,0 +1,582 @@
+"""Gemini client setup, AI responses and answer evaluation for every page."""
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import streamlit as st
+
+from app_state import SCORE_KEYS, record_score, save_user_data
+from evaluation import build_batch_prompt, build_evaluation_prompt, parse_batch_response, parse_score, split_batches
+from llm_backends import create_backend, selected_backend_name
+from llm_engine import EngineError, get_request_engine
+from message_cards import CardTemplate
+from prompt_builder import enforce_budget
+from response_cache import get_response_cache, make_cache_key
+
+# Gemini model used for every request (also part of the response cache key)
+GEMINI_MODEL_NAME = os.getenv('GEMINI_MODEL', 'gemini-1.5-pro')
+
+def initialize_gemini_client():
+    """Initialize Gemini API client"""
+    st.sidebar.header("🔑 API Configuration")
+    
+    # Demo mode toggle
+    demo_mode = st.sidebar.checkbox("🎭 Demo Mode (No API Key Required)", value=st.session_state.demo_mode)
+    st.session_state.demo_mode = demo_mode
+    
+    if demo_mode:
+        st.sidebar.success("✅ Demo mode enabled - using sample responses")
+        return "demo"
+    
+    # Offline stand-in backend for load tests and benchmarks
+    if selected_backend_name() == "local":
+        st.session_state.gemini_client = create_backend(GEMINI_MODEL_NAME)
+        st.sidebar.info("🧪 Local stand-in LLM backend active (LLM_BACKEND=local)")
+        return st.session_state.gemini_client
+    
+    # Try to get API key from environment variable first
+    env_api_key = os.getenv('GEMINI_API_KEY')
+    
+    if env_api_key:
+        st.sidebar.success("✅ API Key loaded from environment")
+        try:
+            st.session_state.gemini_client = create_backend(GEMINI_MODEL_NAME, env_api_key)
+            st.sidebar.success("✅ Gemini connected successfully!")
+            return st.session_state.gemini_client
+        except Exception as e:
+            st.sidebar.error(f"Error with environment API key: {e}")
+    
+    # Fallback to manual input
+    api_key = st.sidebar.text_input("Enter Gemini API Key (optional)", type="password", 
+                                   help="Get your free API key from Google AI Studio")
+    
+    if api_key:
+        # Test the API key
+        if st.sidebar.button("🔍 Test API Key"):
+            test_result = test_gemini_api_key(api_key)
+            if test_result["success"]:
+                st.sidebar.success("✅ API Key is working!")
+            else:
+                st.sidebar.error(f"❌ API Test Failed: {test_result['error']}")
+        
+        try:
+            st.session_state.gemini_client = create_backend(GEMINI_MODEL_NAME, api_key)
+            st.sidebar.success("✅ Gemini connected successfully!")
+            return st.session_state.gemini_client
+        except Exception as e:
+            st.sidebar.error(f"Error initializing Gemini: {e}")
+            return None
+    
+    if not env_api_key and not api_key:
+        st.sidebar.info("💡 Add your API key to .env file or enter it manually")
+    
+    return None
+
+def test_gemini_api_key(api_key: str) -> dict:
+    """Test if the Gemini API key is valid and working (results are cached per key)"""
+    try:
+        backend = create_backend(GEMINI_MODEL_NAME, api_key)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    return backend.check(get_request_engine().call)
+
+def build_ai_prompt(prompt: str, context: str = "", is_interviewer: bool = False, mode: Optional[str] = None) -> str:
+    """Build the full Gemini prompt for the interviewer or coach persona"""
+    # Evaluation prompts carry their own instructions and response format
+    if mode == 'evaluation':
+        return prompt
+    if is_interviewer:
+        return f"""
+        You are a senior Amazon Software Development Engineer II interviewer. You are professional, thorough, and realistic. 
+        
+        Context: {context}
+        
+        Candidate's response: {prompt}
+        
+        As an Amazon interviewer, you should:
+        1. Ask probing follow-up questions to test deeper understanding
+        2. Challenge assumptions and explore edge cases
+        3. Evaluate the candidate's problem-solving approach
+        4. Test their ability to think about trade-offs and optimizations
+        5. Assess communication skills and technical depth
+        6. Stay in character as a real interviewer - be encouraging but maintain professional standards
+        7. Ask questions that would typically come up in a real Amazon SDE II interview
+        
+        Respond naturally as if you're in a real interview room. Keep responses focused and ask specific follow-up questions.
+        """
+    else:
+        return f"""
+    You are an expert Amazon SDE II interview coach. You provide detailed, constructive feedback and guidance.
+    
+    Context: {context}
+    
+    User: {prompt}
+    
+    Provide a comprehensive response that includes:
+    1. Direct answer to the question/request
+    2. Specific feedback and suggestions
+    3. Areas for improvement
+        4. Actionable advice for Amazon interviews
+        """
+
+def format_ai_error(error_msg: str) -> str:
+    """Turn a Gemini exception message into user-facing troubleshooting text"""
+    if "API_KEY_INVALID" in error_msg or "invalid" in error_msg.lower() or "404" in error_msg or "models/gemini-pro" in error_msg:
+        return f"""🔴 **API Key Issue**
+
+**Error:** {error_msg}
+
+**Quick Fix:**
+1. Go to [Google AI Studio](https://makersuite.google.com/app/apikey)
+2. **Delete your current key**
+3. **Create a new API key**
+4. **Copy the ENTIRE key** (should be ~40 characters)
+5. Paste it here
+
+**Demo Mode:** Enable in sidebar for immediate testing!
+
+**Common Issues:**
+- Key is truncated/incomplete
+- Key is expired
+- Wrong API endpoint"""
+    
+    elif "quota" in error_msg.lower() or "limit" in error_msg.lower():
+        return f"""🔴 **API Quota Exceeded**
+
+**Error:** {error_msg}
+
+**Solutions:**
+1. Check your quota at [Google AI Studio](https://makersuite.google.com/)
+2. Wait for quota reset (daily limits)
+3. Consider upgrading your plan
+4. Use Demo Mode for now
+
+**Demo Mode:** Available in sidebar!"""
+    
+    else:
+        return f"""🔴 **API Error**
+
+**Error:** {error_msg}
+
+**Troubleshooting:**
+1. Verify your API key is correct
+2. Check internet connection
+3. Try Demo Mode for immediate testing
+
+**Demo Mode:** Enable in sidebar to continue!"""
+
+def format_busy_error(error_msg: str) -> str:
+    """User-facing text for requests shed by the request engine under load"""
+    return f"""🟡 **High Demand Right Now**
+
+**Details:** {error_msg}
+
+Many candidates are practicing at the same time, so your request was queued and could not be served in time.
+
+**What to do:**
+1. Wait a few seconds and submit again
+2. Use Demo Mode for uninterrupted practice
+
+Your work so far has been kept."""
+
+def get_ai_response(prompt: str, context: str = "", is_interviewer: bool = False, stream: bool = False,
+                    mode: Optional[str] = None):
+    """Get response from Gemini API or demo mode
+
+    With stream=True a generator of text chunks is returned instead of a string.
+    mode picks the prompt budget (default 'interviewer' or 'coach'); 'evaluation'
+    prompts are also sent without the coach persona.
+    """
+    if stream:
+        return stream_ai_response(prompt, context, is_interviewer, mode)
+    
+    prompt, context = enforce_budget(prompt, context, mode or ('interviewer' if is_interviewer else 'coach'))
+    
+    # Demo mode responses
+    if st.session_state.demo_mode or st.session_state.gemini_client == "demo":
+        return get_demo_response(prompt, is_interviewer)
+    
+    if not st.session_state.gemini_client:
+        return "Please configure Gemini API key in the sidebar or enable demo mode."
+    
+    try:
+        return generate_ai_text(st.session_state.gemini_client, prompt, context, is_interviewer, mode)
+    except EngineError as e:
+        return format_busy_error(str(e))
+    except Exception as e:
+        return format_ai_error(str(e))
+
+def generate_ai_text(client, prompt: str, context: str = "", is_interviewer: bool = False,
+                     mode: Optional[str] = None) -> str:
+    """Cached, engine-routed Gemini call that raises on failure
+
+    It does not touch session state, so background prefetch threads can use it.
+    """
+    # Serve repeated requests from the shared response cache
+    response_cache = get_response_cache()
+    cache_key = make_cache_key(prompt, context, is_interviewer, client.cache_namespace, mode)
+    cached_response = response_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    response = get_request_engine().call(client.generate_content, build_ai_prompt(prompt, context, is_interviewer, mode))
+    response_cache.set(cache_key, response.text)
+    return response.text
+
+def stream_ai_response(prompt: str, context: str = "", is_interviewer: bool = False,
+                       mode: Optional[str] = None) -> Iterator[str]:
+    """Yield the AI response in chunks as Gemini generates them"""
+    prompt, context = enforce_budget(prompt, context, mode or ('interviewer' if is_interviewer else 'coach'))
+    
+    if st.session_state.demo_mode or st.session_state.gemini_client == "demo":
+        yield get_demo_response(prompt, is_interviewer)
+        return
+    
+    if not st.session_state.gemini_client:
+        yield "Please configure Gemini API key in the sidebar or enable demo mode."
+        return
+    
+    response_cache = get_response_cache()
+    cache_key = make_cache_key(prompt, context, is_interviewer, st.session_state.gemini_client.cache_namespace, mode)
+    cached_response = response_cache.get(cache_key)
+    if cached_response is not None:
+        yield cached_response
+        return
+    
+    chunks = []
+    try:
+        response = get_request_engine().stream(
+            st.session_state.gemini_client.generate_content,
+            build_ai_prompt(prompt, context, is_interviewer, mode),
+            stream=True
+        )
+        for chunk in response:
+            if chunk.text:
+                chunks.append(chunk.text)
+                yield chunk.text
+    except EngineError as e:
+        yield ("\n\n" if chunks else "") + format_busy_error(str(e))
+        return
+    except Exception as e:
+        # Keep any partial answer and append the troubleshooting text
+        yield ("\n\n" if chunks else "") + format_ai_error(str(e))
+        return
+    
+    # Only complete answers are cached
+    response_cache.set(cache_key, "".join(chunks))
+
+def render_streamed_message(css_class: str, speaker: str, chunks: Iterator[str]) -> str:
+    """Render a chat bubble that fills in as chunks arrive and return the full text"""
+    placeholder = st.empty()
+    template = CardTemplate(css_class, speaker)
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        placeholder.markdown(template.render(text), unsafe_allow_html=True)
+    return text
+
+def get_demo_response(prompt: str, is_interviewer: bool = False) -> str:
+    """Get demo responses for interview simulation"""
+    prompt_lower = prompt.lower()
+    
+    if is_interviewer:
+        # Simulate realistic interviewer responses
+        if "hash map" in prompt_lower or "two sum" in prompt_lower or "array" in prompt_lower:
+            return """Great! I can see you understand the hash map approach. Let me dive deeper into your solution:
+
+1. **Edge Case**: What happens if there are duplicate numbers in the array? Walk me through your logic.
+
+2. **Optimization**: You mentioned O(n) time complexity. If the array was sorted, could we optimize this further? What would be the trade-offs?
+
+3. **Space Complexity**: Can you think of a way to solve this without using the extra hash map space?
+
+4. **Scale**: How would your solution perform with an array of 10 million integers?
+
+Also, I noticed you mentioned returning indices. What if the problem asked for the actual values instead of indices? Would that change your approach?"""
+        
+        elif "system design" in prompt_lower or "url" in prompt_lower or "design" in prompt_lower:
+            return """Good start on the architecture! I'd like to explore some specific areas deeper:
+
+1. **Database Design**: You mentioned using a database. Would you choose SQL or NoSQL? Walk me through your table schema.
+
+2. **URL Encoding**: What happens when you get hash collisions? How would you handle that at scale?
+
+3. **Caching Strategy**: Where would you implement caching in your system? What would you cache and why?
+
+4. **Scale**: If we need to handle 100 million URL shortenings per day, how would your design change?
+
+5. **Analytics**: How would you track click metrics? What if a URL goes viral and gets millions of clicks in an hour?
+
+Can you also walk me through the entire flow when a user clicks on a shortened URL?"""
+        
+        elif "behavioral" in prompt_lower or "customer" in prompt_lower or "ownership" in prompt_lower:
+            return """Thank you for sharing that example. I can see you demonstrated strong ownership principles.
+
+Let me ask some follow-up questions to understand the depth of your experience:
+
+1. **Impact Measurement**: How did you quantify the success of your decision? What metrics did you track?
+
+2. **Stakeholder Management**: You mentioned pushback from the business team. How specifically did you handle that resistance?
+
+3. **Learning**: Looking back, what would you do differently? What did this experience teach you about balancing customer needs with business constraints?
+
+4. **Long-term**: How has this experience influenced your decision-making in subsequent similar situations?
+
+5. **Scale**: Have you faced similar decisions at a larger scale? How did your approach evolve?
+
+I'm particularly interested in the specific actions YOU took versus what your team did."""
+        
+        elif "palindrome" in prompt_lower or "dynamic programming" in prompt_lower:
+            return """Interesting approach! Let me challenge your solution a bit:
+
+1. **Algorithm Choice**: You mentioned expand around centers. Why did you choose that over dynamic programming? What are the trade-offs?
+
+2. **Space Optimization**: Your current solution uses O(1) space. Could you optimize it further for very long strings?
+
+3. **Edge Cases**: How does your solution handle empty strings, single characters, or strings with no palindromes?
+
+4. **Performance**: What's the worst-case scenario for your algorithm? Can you give me an example input?
+
+5. **Alternative**: Have you heard of Manacher's algorithm? How would it compare to your approach?
+
+Can you code up the expand around centers approach and walk me through it step by step?"""
+        
+        else:
+            return """That's a solid response! Let me probe deeper to understand your thinking process:
+
+1. **Alternative Approaches**: What other solutions did you consider? Why did you choose this one?
+
+2. **Trade-offs**: Every solution has trade-offs. What are the downsides of your approach?
+
+3. **Edge Cases**: Walk me through some edge cases. How would your solution handle them?
+
+4. **Optimization**: If you had to optimize this for production at Amazon scale, what would you change?
+
+5. **Testing**: How would you test this solution? What test cases would you write?
+
+I'm also curious - what questions do you have for me about this problem or about working at Amazon?"""
+    
+    else:
+        # Regular coaching responses
+        if "system design" in prompt_lower:
+            return """🎯 **System Design Interview Framework**
+
+**Amazon's Approach (45-60 minutes):**
+
+**1. Requirements Clarification (5-10 min)**
+- Ask about scale: DAU, QPS, data volume
+- Functional requirements: core features
+- Non-functional: availability, consistency, latency
+
+**2. High-Level Design (10-15 min)**
+- Draw major components
+- Show data flow
+- Discuss API design
+
+**3. Deep Dive (20-25 min)**
+- Database schema and choice (SQL vs NoSQL)
+- Detailed component design
+- Key algorithms and data structures
+
+**4. Scale & Optimize (10-15 min)**
+- Identify bottlenecks
+- Caching strategies
+- Load balancing
+- Monitoring and alerting
+
+**Pro Tips for Amazon:**
+- Start simple, then scale
+- Discuss trade-offs for every decision
+- Think about failure scenarios
+- Consider operational aspects (monitoring, deployment)
+- Be ready for deep technical questions"""
+        
+        elif "behavioral" in prompt_lower or "leadership" in prompt_lower:
+            return """⭐ **Amazon Leadership Principles Mastery**
+
+**STAR Method Structure:**
+- **Situation (20%)**: Context and background
+- **Task (20%)**: Your specific responsibility
+- **Action (40%)**: What YOU did (most critical part)
+- **Result (20%)**: Quantifiable outcomes and learning
+
+**Top Principles for SDE II:**
+
+**1. Customer Obsession**
+- Put customer needs first, even when difficult
+- Use data to understand customer impact
+- Think long-term customer value
+
+**2. Ownership**
+- Take end-to-end responsibility
+- Act on behalf of the entire company
+- Never say "that's not my job"
+
+**3. Dive Deep**
+- Get into technical details
+- Question assumptions with data
+- Stay connected to the details
+
+**4. Deliver Results**
+- Focus on key inputs and deliver quality results
+- Rise above setbacks and obstacles
+- Take accountability for outcomes
+
+**Interview Tips:**
+- Prepare 2-3 detailed stories per principle
+- Practice with specific metrics and outcomes
+- Be ready for deep follow-up questions
+- Show growth and learning from experiences"""
+        
+        elif "coding" in prompt_lower or "dsa" in prompt_lower:
+            return """💻 **Amazon Coding Interview Strategy**
+
+**Common Patterns at Amazon:**
+1. **Array/String manipulation** (Two pointers, sliding window)
+2. **Tree/Graph traversal** (DFS, BFS, tree problems)
+3. **Dynamic Programming** (Optimization problems)
+4. **System Design coding** (OOP design questions)
+
+**Interview Process (45 min):**
+1. **Problem Understanding (5 min)**
+   - Ask clarifying questions
+   - Confirm input/output format
+   - Discuss constraints and edge cases
+
+2. **Approach Discussion (10 min)**
+   - Explain your approach before coding
+   - Discuss time/space complexity
+   - Consider multiple solutions
+
+3. **Coding (20 min)**
+   - Write clean, readable code
+   - Think out loud
+   - Handle edge cases
+
+4. **Testing & Optimization (10 min)**
+   - Test with examples
+   - Look for bugs
+   - Optimize if needed
+
+**Amazon-Specific Tips:**
+- Focus on clean, production-ready code
+- Explain your thought process clearly
+- Consider scalability and edge cases
+- Be prepared for follow-up questions about optimization"""
+        
+        else:
+            return """🤖 **Demo Mode Active - Gemini API Simulation**
+
+I'm currently providing demo responses to showcase the interview simulation capabilities.
+
+**🎯 What I Can Help With:**
+
+**Live Interview Simulation:**
+- Act as a real Amazon interviewer
+- Ask follow-up questions based on your responses
+- Challenge your assumptions and probe deeper
+- Test edge cases and optimizations
+
+**Interview Preparation:**
+- System design frameworks and patterns
+- Coding interview strategies and common problems
+- Behavioral question preparation with STAR method
+- Amazon Leadership Principles deep-dive
+
+**🔑 To Unlock Full AI Power:**
+1. Get a free Gemini API key from [Google AI Studio](https://makersuite.google.com/app/apikey)
+2. Enter it in the sidebar
+3. Experience truly dynamic, personalized interview coaching!
+
+**💡 Try asking:**
+- "Help me practice the Two Sum problem"
+- "How should I approach system design questions?"
+- "Give me a Customer Obsession behavioral question"
+
+Ready for the most realistic interview practice available! 🚀"""
+
+def evaluate_answer(question: dict, answer: str, category: str) -> dict:
+    """Evaluate user's answer using AI"""
+    # Built within the evaluation budget, so the format instructions are never cut
+    ai_feedback = get_ai_response(build_evaluation_prompt(question, answer, category), mode='evaluation')
+    
+    # Parse AI response to extract score
+    score = parse_score(ai_feedback)
+    if score is None:
+        score = 5
+    
+    return {
+        'score': score,
+        'feedback': ai_feedback,
+        'timestamp': datetime.now()
+    }
+
+def evaluate_answers_batch(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Evaluate many answers with as few AI calls as possible
+
+    Each item is a dict with 'question', 'answer' and 'category'. Items are
+    split into batches that fit the token budget; results come back in input
+    order with 'score' set to None and 'error' describing any item that was
+    not scored, either because its section could not be parsed or because the
+    AI request for its batch failed.
+    """
+    results = []
+    for batch in split_batches(items):
+        ai_feedback, request_error = request_batch_evaluation(batch)
+        timestamp = datetime.now()
+        if request_error is not None:
+            # The request itself failed: report why, rather than a missing section per item
+            parsed_items = [{'score': None, 'feedback': "", 'error': request_error}] * len(batch)
+        else:
+            parsed_items = parse_batch_response(ai_feedback, len(batch))
+        for item, parsed in zip(batch, parsed_items):
+            results.append({
+                'category': item['category'],
+                'score': parsed['score'],
+                'feedback': parsed['feedback'],
+                'error': parsed['error'],
+                'timestamp': timestamp
+            })
+    return results
+
+def request_batch_evaluation(batch: List[Dict[str, Any]]):
+    """(response text, None) for one batch, or (None, error) when the request fails"""
+    if st.session_state.demo_mode or st.session_state.gemini_client == "demo":
+        return get_demo_batch_evaluation(batch), None
+    
+    if not st.session_state.gemini_client:
+        return None, "Please configure Gemini API key in the sidebar or enable demo mode"
+    
+    prompt, _ = enforce_budget(build_batch_prompt(batch), "", 'evaluation')
+    try:
+        return generate_ai_text(st.session_state.gemini_client, prompt, mode='evaluation'), None
+    except EngineError as e:
+        return None, f"The AI service is busy ({e}); try again in a few seconds"
+    except Exception as e:
+        return None, f"AI request failed: {e}"
+
+def get_demo_batch_evaluation(batch: List[Dict[str, Any]]) -> str:
+    """Demo batch response with one scored section per item, in the batch format"""
+    sections = []
+    for number, item in enumerate(batch, start=1):
+        # Longer, more detailed answers score a little higher in demo mode
+        score = min(8, 4 + len(item['answer'].split()) // 40)
+        sections.append(f"""### Item {number}
+Score: {score}/10
+Strengths: Clear structure and a direct answer to the {item['category']} question.
+Weaknesses: Trade-offs, edge cases and measurable impact could be covered in more depth.
+Suggestions: State complexity and assumptions up front, then walk through one concrete example.
+Amazon Focus: Tie the answer back to Dive Deep and Deliver Results.""")
+    return "\n\n".join(sections)
+
+def record_evaluation_scores(results: List[Dict[str, Any]]) -> int:
+    """Append successfully parsed scores to performance_data; returns how many were recorded"""
+    recorded = 0
+    for result in results:
+        if result['score'] is None or result['category'] not in SCORE_KEYS:
+            continue
+        record_score(result['category'], result['score'], result['timestamp'])
+        recorded += 1
+    if recorded:
+        save_user_data()
+    return recorded
@@ -0,0 +1,27 @@
+"""Pages of the app, each in its own module and imported on first use.
+
+PAGES maps a navigation label to the module and function that renders it.
+A cold start imports only the page that is opened, and Python caches the
+module afterwards, so later reruns do not re-execute page definitions.
+"""
+import importlib
+from typing import Callable, Dict, Tuple
+
+PAGES: Dict[str, Tuple[str, str]] = {
+    "🏠 Dashboard": ("dashboard", "show_dashboard"),
+    "🎪 Live Interview": ("live_interview", "show_live_interview_page"),
+    "💬 AI Chat Coach": ("chat_coach", "show_chat_coach"),
+    "📝 Mock Interview": ("mock_interview", "show_mock_interview"),
+    "📈 Progress Tracking": ("progress", "show_progress_tracking"),
+    "📚 Resources": ("resources", "show_resources"),
+    "📦 Export / Import": ("export_import", "show_data_transfer"),
+}
+
+
+def load(module: str, function: str) -> Callable[[], None]:
+    return getattr(importlib.import_module(f"{__name__}.{module}"), function)
+
+
+def page_renderer(label: str) -> Callable[[], None]:
+    """Render function for a navigation label, importing its module if needed"""
+    return load(*PAGES[label])
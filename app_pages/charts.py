@@ -0,0 +1,135 @@
+"""DataFrames and Plotly figures for the dashboard, progress and live interview pages.
+
+pandas and Plotly are imported here, so only pages that draw charts load them.
+Long series are downsampled before plotting (see downsample.py).
+"""
+import os
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from app_state import cached_view
+from downsample import aggregate_buckets, lttb
+
+# Points per line series and time buckets per bar chart sent to the browser
+CHART_MAX_POINTS = int(os.getenv('CHART_MAX_POINTS', '400'))
+CHART_MAX_BARS = int(os.getenv('CHART_MAX_BARS', '60'))
+
+DateRange = Optional[Tuple[date, date]]
+
+def in_date_range(timestamp: Any, date_range: DateRange) -> bool:
+    if date_range is None:
+        return True
+    return isinstance(timestamp, datetime) and date_range[0] <= timestamp.date() <= date_range[1]
+
+def downsample_series(series: Dict[str, List[tuple]], x_column: str,
+                      date_range: DateRange = None) -> Tuple[List[Dict[str, Any]], int]:
+    """Plot rows for each type's (timestamp, score) points, LTTB-reduced; also the points in range"""
+    rows = []
+    total = 0
+    for score_type, points in series.items():
+        points = [point for point in points if in_date_range(point[0], date_range)]
+        total += len(points)
+        for timestamp, score in lttb(points, CHART_MAX_POINTS):
+            rows.append({x_column: timestamp, 'Score': score, 'Type': score_type})
+    return rows, total
+
+def build_date_bounds() -> Optional[Tuple[date, date]]:
+    """First and last day with a score or interview session"""
+    timestamps = [value for value in st.session_state.performance_data['timestamps'] if isinstance(value, datetime)]
+    timestamps += [session['timestamp'] for session in st.session_state.interview_sessions
+                   if isinstance(session.get('timestamp'), datetime)]
+    if not timestamps:
+        return None
+    return min(timestamps).date(), max(timestamps).date()
+
+def build_dashboard_trend_chart():
+    """Line chart of every category's scores over time, or None without scores"""
+    performance_data = st.session_state.performance_data
+    series = {'DSA': [], 'System Design': [], 'Behavioral': []}
+    for i, timestamp in enumerate(performance_data['timestamps']):
+        if i < len(performance_data['dsa_scores']):
+            series['DSA'].append((timestamp, performance_data['dsa_scores'][i]))
+        if i < len(performance_data['system_design_scores']):
+            series['System Design'].append((timestamp, performance_data['system_design_scores'][i]))
+        if i < len(performance_data['behavioral_scores']):
+            series['Behavioral'].append((timestamp, performance_data['behavioral_scores'][i]))
+    
+    df_data, _ = downsample_series(series, 'Date')
+    if not df_data:
+        return None
+    df = pd.DataFrame(df_data)
+    fig = px.line(df, x='Date', y='Score', color='Type', title="Performance Progress Over Time")
+    fig.update_layout(height=350, yaxis_range=[0, 10])
+    return fig
+
+def build_skill_radar_chart(averages: Dict[str, float]):
+    skills = ['DSA', 'System Design', 'Behavioral']
+    scores = [averages[skill] for skill in skills]
+    
+    fig = go.Figure(data=go.Scatterpolar(
+        r=scores,
+        theta=skills,
+        fill='toself',
+        name='Your Skills'
+    ))
+    fig.update_layout(
+        height=350,
+        polar=dict(radialaxis=dict(range=[0, 10])),
+        title="Skill Breakdown"
+    )
+    return fig
+
+def build_score_progression_chart(date_range: DateRange = None):
+    """Score progression line chart for the progress page (None without scores), points shown and points in range"""
+    performance_data = st.session_state.performance_data
+    timestamps = performance_data['timestamps']
+    series = {
+        'DSA': [(timestamps[i], score) for i, score in enumerate(performance_data['dsa_scores'])],
+        'System Design': [(timestamps[i], score) for i, score in enumerate(performance_data['system_design_scores'])
+                          if i < len(timestamps)],
+        'Behavioral': [(timestamps[i], score) for i, score in enumerate(performance_data['behavioral_scores'])
+                       if i < len(timestamps)]
+    }
+    
+    rows, total = downsample_series(series, 'Timestamp', date_range)
+    if not rows:
+        return None, 0, total
+    df = pd.DataFrame(rows)
+    
+    fig = px.line(df, x='Timestamp', y='Score', color='Type', 
+                 title="Score Progression Over Time")
+    fig.update_layout(height=400, yaxis_range=[0, 10])
+    return fig, len(rows), total
+
+def get_sessions_frame():
+    """Hot interview sessions as a DataFrame, shared by the progress and live interview pages"""
+    return cached_view('sessions_df', ('sessions',), lambda: pd.DataFrame(st.session_state.interview_sessions))
+
+def build_sessions_table():
+    sessions_df = get_sessions_frame().copy()
+    sessions_df['timestamp'] = sessions_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
+    return sessions_df[['timestamp', 'type', 'duration', 'questions_asked', 'responses']]
+
+def build_session_summary() -> Dict[str, float]:
+    sessions_df = get_sessions_frame()
+    return {
+        'avg_duration': sessions_df['duration'].mean(),
+        'total_questions': sessions_df['questions_asked'].sum(),
+        'avg_responses': sessions_df['responses'].mean()
+    }
+
+def build_session_duration_chart(date_range: DateRange = None):
+    """Session durations as bars, averaged per time bucket when there are more than CHART_MAX_BARS"""
+    sessions = [session for session in st.session_state.interview_sessions
+                if in_date_range(session.get('timestamp'), date_range)]
+    rows, unit = aggregate_buckets(sessions, 'timestamp', 'type', 'duration', CHART_MAX_BARS)
+    if not rows:
+        return None
+    title = "Interview Session Durations" + (f" (average per {unit})" if unit else "")
+    return px.bar(pd.DataFrame(rows), x='timestamp', y='duration', 
+                  color='type', title=title, hover_data=['count'] if unit else None)
@@ -0,0 +1,101 @@
+"""💬 AI Chat Coach, with the archived conversation browser."""
+from datetime import datetime
+
+import streamlit as st
+
+from ai_assistant import get_ai_response, render_streamed_message
+from app_state import CHAT_PAGE_SIZE, get_message_window
+from message_cards import CARD_TEMPLATES, render_cards
+from question_bank import COACH_CONTEXT, COACH_SUGGESTIONS
+from user_store import get_user_store
+
+def show_chat_coach():
+    """AI Chat Coach with Gemini"""
+    st.header("💬 AI Interview Coach (Powered by Gemini)")
+    st.markdown("""
+    <div style="background: rgba(33, 150, 243, 0.1); padding: 1rem; border-radius: 10px; margin: 1rem 0;">
+        <strong>🤖 Your Personal AI Coach</strong><br>
+        Get personalized guidance, practice specific problems, and receive expert feedback for your Amazon SDE II interview.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Chat interface: only the latest page is rendered, older ones on request
+    visible_messages = get_message_window(
+        st.session_state.chat_history, "coach", CHAT_PAGE_SIZE, can_fetch=True
+    )
+    cards = render_cards(visible_messages, roles=('user', 'assistant'))
+    if cards:
+        st.markdown("\n\n".join(cards), unsafe_allow_html=True)
+    
+    # Chat input
+    user_input = st.chat_input("Ask your AI coach anything about Amazon interviews...")
+    
+    if user_input:
+        stream_coach_reply(user_input)
+    
+    show_conversation_archive()
+    
+    # Suggested questions
+    st.subheader("💡 Popular Questions")
+    cols = st.columns(2)
+    for i, suggestion in enumerate(COACH_SUGGESTIONS):
+        with cols[i % 2]:
+            if st.button(suggestion, key=f"suggestion_{i}", use_container_width=True):
+                stream_coach_reply(suggestion)
+
+def show_conversation_archive():
+    """Search and open conversations that moved to the compressed archive"""
+    archive = get_user_store(st.session_state.user_id).archive
+    if not archive.index()['conversations']:
+        return
+    
+    with st.expander("🗄️ Archived Conversations"):
+        query = st.text_input("Search archived conversations", key="archive_query")
+        matches = archive.search(query)
+        if not matches:
+            st.caption("No archived conversations match.")
+            return
+        
+        entries = {f"{entry['title']} · {entry['messages']} messages": entry for entry in matches}
+        entry = entries[st.selectbox("Conversation", list(entries), key="archive_choice")]
+        if st.button("📂 Open", key="archive_open"):
+            st.session_state.archive_open = entry['id']
+        
+        if st.session_state.get('archive_open') != entry['id']:
+            st.caption(entry['preview'])
+            return
+        
+        try:
+            messages = archive.open(entry['id'])
+        except Exception as e:
+            st.error(f"Error opening archived conversation: {e}")
+            return
+        speakers = {'user': "You", 'interviewer': "🎯 Interviewer", 'assistant': "🤖 AI Coach"}
+        for message in messages:
+            st.markdown(f"**{speakers.get(message['role'], message['role'])}:** {message['content']}")
+
+def stream_coach_reply(user_message: str):
+    """Add a coach exchange to chat history, streaming the reply as it arrives"""
+    # Add user message to history
+    st.session_state.chat_history.append({
+        'role': 'user',
+        'content': user_message,
+        'timestamp': datetime.now()
+    })
+    
+    st.markdown(CARD_TEMPLATES['user'].render(user_message), unsafe_allow_html=True)
+    
+    # Stream AI response; it is added to history once complete
+    ai_response = render_streamed_message(
+        "ai-message",
+        "🤖 AI Coach",
+        get_ai_response(user_message, COACH_CONTEXT, stream=True)
+    )
+    
+    st.session_state.chat_history.append({
+        'role': 'assistant',
+        'content': ai_response,
+        'timestamp': datetime.now()
+    })
+    
+    st.rerun()
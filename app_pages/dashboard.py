@@ -0,0 +1,101 @@
+"""🏠 Dashboard: headline metrics, quick starts and performance charts."""
+import streamlit as st
+
+import score_stats
+from app_pages.charts import build_dashboard_trend_chart, build_skill_radar_chart
+from app_state import SCORE_KEYS, cached_view, get_score_stats
+
+def show_dashboard():
+    """Enhanced dashboard with live interview metrics"""
+    st.header("📊 Interview Preparation Dashboard")
+    
+    # Calculate metrics from the running aggregates
+    averages = {category: score_stats.mean(get_score_stats(category)) for category in SCORE_KEYS}
+    total_questions = score_stats.count(st.session_state.score_stats.get(score_stats.OVERALL))
+    total_sessions = len(st.session_state.interview_sessions) + st.session_state.archived_sessions
+    
+    # Metrics row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Calculate readiness score
+    if total_questions > 0:
+        overall_score = (sum(averages.values()) / 3) * 10
+    else:
+        overall_score = 0
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>🎯 Readiness Score</h3>
+            <h2>{overall_score:.0f}%</h2>
+            <p>{'Ready to ace it!' if overall_score >= 80 else 'Good progress!' if overall_score >= 60 else 'Keep practicing!'}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        study_hours = st.session_state.session_count * 0.5
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>⏱️ Practice Time</h3>
+            <h2>{study_hours:.1f}h</h2>
+            <p>Total time invested</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>📝 Questions Solved</h3>
+            <h2>{total_questions}</h2>
+            <p>Across all categories</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>🎪 Live Sessions</h3>
+            <h2>{total_sessions}</h2>
+            <p>Interview simulations</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Quick actions - updated to highlight live interview
+    st.subheader("🚀 Quick Start Your Practice")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if st.button("💻 DSA Practice", use_container_width=True):
+            st.session_state.quick_start = "dsa"
+            # Navigate to mock interview page
+    
+    with col2:
+        if st.button("🏗️ System Design", use_container_width=True):
+            st.session_state.quick_start = "system_design"
+    
+    with col3:
+        if st.button("🎭 Behavioral Prep", use_container_width=True):
+            st.session_state.quick_start = "behavioral"
+    
+    with col4:
+        if st.button("🎪 Live Interview", use_container_width=True, type="primary"):
+            from app_pages.live_interview import show_live_interview_page
+            show_live_interview_page()
+    
+    # Performance visualization
+    if total_questions > 0:
+        st.subheader("📈 Performance Analytics")
+        
+    col1, col2 = st.columns(2)
+    
+    with col1:
+            # Create performance trend chart
+            if st.session_state.performance_data['timestamps']:
+                fig = cached_view('dashboard_trend', ('scores',), build_dashboard_trend_chart)
+                if fig is not None:
+                    st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Skill breakdown radar chart
+        fig = cached_view('skill_radar', ('scores',), lambda: build_skill_radar_chart(averages))
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,63 @@
+"""📦 Export / Import of practice history (see data_transfer.py)."""
+import streamlit as st
+
+import data_transfer
+from app_state import load_user_data, save_user_data
+from write_behind import get_write_behind
+
+def export_history(user_id: str, export_format: str):
+    """Temporary export file for the download button, written when the download is clicked
+
+    It runs outside the script thread, so it takes the profile as an argument.
+    """
+    # Everything queued must be on disk before it is read back
+    get_write_behind().flush(timeout=10.0)
+    return data_transfer.export_to_file([user_id], export_format)
+
+def show_data_transfer():
+    """Download the current profile's history or import exported/cohort files"""
+    st.header("📦 Export / Import Practice History")
+    st.markdown(
+        "Export chat messages, scores and interview sessions as one flat file, or import a file in the same "
+        "format. For very large cohorts use the command line: `python data_transfer.py --help`."
+    )
+    
+    st.subheader("⬇️ Export")
+    formats = ["csv", "jsonl"] + (["parquet"] if data_transfer.pyarrow is not None else [])
+    export_format = st.radio("Format", formats, horizontal=True, key="export_format")
+    # Queue anything unsaved now; the export itself only runs when the download is clicked
+    save_user_data()
+    user_id = st.session_state.user_id
+    st.download_button(
+        f"Download {export_format.upper()}",
+        lambda: export_history(user_id, export_format),
+        file_name=f"{user_id}.{export_format}",
+        key="download_export",
+        on_click="ignore"
+    )
+    
+    st.subheader("⬆️ Import")
+    st.caption(
+        f"Rows without a profile column are added to **{st.session_state.user_id}**; other rows go to the profile they name. "
+        "Records a profile already has are skipped, so importing the same file twice is safe."
+    )
+    uploaded = st.file_uploader("History file", type=list(data_transfer.FORMATS), key="import_file")
+    if uploaded is not None and st.button("Import", key="run_import", type="primary"):
+        # Queued writes must be on disk before import checks what is already stored
+        save_user_data()
+        get_write_behind().flush(timeout=10.0)
+        try:
+            fmt = data_transfer.format_for_path(uploaded.name)
+            counts = data_transfer.import_rows(
+                data_transfer.read_rows(uploaded, fmt),
+                default_profile=st.session_state.user_id
+            )
+        except Exception as e:
+            st.error(f"Error importing data: {e}")
+            return
+        st.success(
+            f"✅ Imported {counts['imported']} records into {counts['profiles']} profile(s)"
+            + (f"; skipped {counts['duplicates']} already stored" if counts['duplicates'] else "")
+            + (f"; skipped {counts['skipped']} invalid rows" if counts['skipped'] else "")
+        )
+        load_user_data()
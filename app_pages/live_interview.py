@@ -0,0 +1,602 @@
+"""🎪 Live Interview: round picker, the live interview itself and its summary."""
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+import interview_state
+from ai_assistant import generate_ai_text, get_ai_response, render_streamed_message
+from app_state import cached_view, fragment, get_message_window, record_session, save_user_data
+from message_cards import CARD_TEMPLATES, render_cards
+from prefetch import get_prefetcher
+from prompt_builder import (MIN_CONTEXT_TOKENS, PROMPT_BUDGETS, build_feedback_context, build_interview_context,
+                            estimate_tokens, question_brief)
+from question_bank import (BEHAVIORAL_QUESTIONS, COACH_CONTEXT, COACH_SUGGESTIONS, DSA_QUESTIONS, QUESTION_BANKS,
+                           ROUND_CATEGORIES, SYSTEM_DESIGN_QUESTIONS)
+from response_cache import get_response_cache, make_cache_key
+
+def start_live_interview():
+    """Start a live interview session with real-time interaction"""
+    st.session_state.live_interview_mode = True
+    st.session_state.interview_timer = datetime.now()
+    st.session_state.follow_up_count = 0
+    st.session_state.current_interview_questions = []
+    st.session_state.interview_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.session_state.interview_summary = {}
+    st.session_state.interview_state = interview_state.IDLE
+    st.session_state.last_interview = None
+    st.session_state.prefetched_turn = None
+    st.session_state.prefetched_openings = 0
+    st.session_state.session_count += 1
+
+def advance_interview(event: str) -> bool:
+    """Apply a live interview event; False (state unchanged) if it doesn't apply now"""
+    state = interview_state.next_state(st.session_state.interview_state, event)
+    if state is None:
+        return False
+    st.session_state.interview_state = state
+    return True
+
+def get_interview_turns() -> List[Dict[str, Any]]:
+    """Messages exchanged in the current live interview"""
+    return [
+        msg for msg in st.session_state.chat_history
+        if msg.get('interview_id') == st.session_state.interview_id
+    ]
+
+def get_next_question(category: str) -> dict:
+    """Question that "Next Question" will show for this category"""
+    bank = QUESTION_BANKS[category]
+    return bank[(st.session_state.session_count + 1) % len(bank)]
+
+def get_opening_prefetch_key(category: str, question: dict) -> str:
+    """Prefetch key for the interviewer's opening turn on a question"""
+    return f"{st.session_state.interview_id}:opening:{category}:{question['question']}"
+
+# Longest wait, in seconds, for a prefetched opening turn that is still generating
+OPENING_PREFETCH_WAIT = float(os.getenv('PREFETCH_OPENING_WAIT', '15'))
+# Speculative opening turns per interview (0 turns interview prefetching off)
+MAX_PREFETCHED_OPENINGS = int(os.getenv('PREFETCH_MAX_OPENINGS', '3'))
+
+def build_opening_request(category: str, question: dict):
+    """(prompt, context) asking the interviewer to open a new question"""
+    opening_prompt = "I'm ready for the next question."
+    opening_context = f"""
+    Interview Type: {category}
+    {question_brief(question, category)}
+    Open this new question for the candidate: restate it in your own words, set expectations briefly,
+    and invite clarifying questions. Do not ask follow-up questions yet.
+    """
+    return opening_prompt, opening_context
+
+def schedule_interview_prefetch():
+    """Prefetch the next question's opening turn and warm the coach's fixed answers
+
+    Runs once per question turn: later reruns while the candidate types (or
+    the timer ticks) find the turn already scheduled and return at once. Each
+    interview speculates on at most MAX_PREFETCHED_OPENINGS openings, and the
+    coach is warmed once per session, so speculation has a fixed quota cost.
+    """
+    client = st.session_state.gemini_client
+    if st.session_state.demo_mode or not client or client == "demo":
+        return
+    turn = (st.session_state.interview_id, st.session_state.session_count, st.session_state.current_category)
+    if st.session_state.prefetched_turn == turn:
+        return
+    st.session_state.prefetched_turn = turn
+    
+    prefetcher = get_prefetcher()
+    if st.session_state.prefetched_openings < MAX_PREFETCHED_OPENINGS:
+        category = st.session_state.current_category
+        next_question = get_next_question(category)
+        opening_prompt, opening_context = build_opening_request(category, next_question)
+        if prefetcher.prefetch(
+            get_opening_prefetch_key(category, next_question),
+            lambda: generate_ai_text(client, opening_prompt, opening_context, is_interviewer=True)
+        ):
+            st.session_state.prefetched_openings += 1
+    
+    if st.session_state.coach_warmed:
+        return
+    st.session_state.coach_warmed = True
+    response_cache = get_response_cache()
+    for suggestion in COACH_SUGGESTIONS:
+        if not response_cache.has(make_cache_key(suggestion, COACH_CONTEXT, False, client.cache_namespace)):
+            prefetcher.warm(
+                f"coach:{suggestion}",
+                lambda suggestion=suggestion: generate_ai_text(client, suggestion, COACH_CONTEXT)
+            )
+
+def take_opening_turn(category: str, question: dict) -> str:
+    """The interviewer's opening for a question: prefetched if possible, generated otherwise
+
+    A prefetch still in flight is waited for (up to OPENING_PREFETCH_WAIT
+    seconds) rather than duplicated; a missing or failed one is replaced by a
+    regular request, so every question gets an opening whatever the timing.
+    """
+    prefetcher = get_prefetcher()
+    opening_key = get_opening_prefetch_key(category, question)
+    with st.spinner("🎯 Interviewer is preparing the next question..."):
+        opening = prefetcher.take(opening_key, wait=OPENING_PREFETCH_WAIT)
+        prefetcher.cancel(opening_key)
+        if not opening:
+            opening = get_ai_response(*build_opening_request(category, question), is_interviewer=True)
+    return opening
+
+# Seconds between server-rendered timer updates; 0 (the default) runs the clock in the browser instead
+INTERVIEW_TIMER_TICK = float(os.getenv('INTERVIEW_TIMER_TICK', '0'))
+# Iframe height for the browser-side timer, which carries its own copy of the .timer-display style
+TIMER_HEIGHT = 84
+
+def conduct_live_interview():
+    """Conduct live interview with follow-up questions
+    
+    Each region is a fragment, so typing or clicking a control reruns only
+    that region (the timer ticks in the browser and reruns nothing); changes other regions depend on
+    (a submitted response, the next question) rerun the whole app.
+    """
+    st.markdown("""
+    <div class="live-interview-mode">
+        <h3>🎪 Live Interview Mode - Amazon SDE II Simulation</h3>
+        <p>You're now in a realistic Amazon interview. The AI will act as your senior interviewer with follow-up questions.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    show_interview_timer()
+    show_interview_question()
+    show_response_composer()
+    show_interview_transcript()
+    show_interview_controls()
+
+def show_interview_timer():
+    """Elapsed interview time, counted by the browser unless INTERVIEW_TIMER_TICK is set"""
+    if not st.session_state.interview_timer:
+        return
+    if INTERVIEW_TIMER_TICK:
+        show_server_interview_timer()
+    else:
+        elapsed = datetime.now() - st.session_state.interview_timer
+        components.html(interview_timer_html(int(elapsed.total_seconds())), height=TIMER_HEIGHT)
+
+@fragment(run_every=INTERVIEW_TIMER_TICK or None)
+def show_server_interview_timer():
+    """Elapsed interview time, rerun on the server every INTERVIEW_TIMER_TICK seconds"""
+    elapsed = datetime.now() - st.session_state.interview_timer
+    minutes = elapsed.seconds // 60
+    seconds = elapsed.seconds % 60
+    st.markdown(f"""
+    <div class="timer-display">
+        ⏱️ Interview Time: {minutes:02d}:{seconds:02d}
+    </div>
+    """, unsafe_allow_html=True)
+
+def interview_timer_html(elapsed_seconds: int) -> str:
+    """Timer for a components.html iframe, counting up in the browser from elapsed_seconds"""
+    return f"""<div id="timer" style="background: linear-gradient(135deg, #ff6b6b 0%, #ee5a52 100%);
+    padding: 1rem 2rem; border-radius: 15px; text-align: center; color: white; font-size: 1.5rem;
+    font-weight: bold; font-family: 'Source Sans Pro', sans-serif;"></div>
+<script>
+(function () {{
+    // Counted from the browser's own clock, so server and browser clocks never need to agree
+    const started = Date.now() - {elapsed_seconds} * 1000;
+    const timer = document.getElementById("timer");
+    function tick() {{
+        const elapsed = Math.floor((Date.now() - started) / 1000);
+        const minutes = String(Math.floor(elapsed / 60)).padStart(2, "0");
+        const seconds = String(elapsed % 60).padStart(2, "0");
+        timer.textContent = "⏱️ Interview Time: " + minutes + ":" + seconds;
+    }}
+    tick();
+    setInterval(tick, 1000);
+}})();
+</script>"""
+
+@fragment
+def show_interview_question():
+    """Round selector and question card"""
+    # Interview type selection
+    interview_type = st.selectbox(
+        "Select Interview Round",
+        ["DSA Coding Round", "System Design Round", "Behavioral Round"],
+        key="live_interview_type"
+    )
+    
+    # Generate initial question if none exists or category changed
+    if not st.session_state.current_question or st.session_state.current_category != ROUND_CATEGORIES[interview_type]:
+        if interview_type == "DSA Coding Round":
+            question_idx = st.session_state.session_count % len(DSA_QUESTIONS)
+            question = DSA_QUESTIONS[question_idx]
+            st.session_state.current_question = question
+            st.session_state.current_category = "DSA"
+            
+        elif interview_type == "System Design Round":
+            question_idx = st.session_state.session_count % len(SYSTEM_DESIGN_QUESTIONS)
+            question = SYSTEM_DESIGN_QUESTIONS[question_idx]
+            st.session_state.current_question = question
+            st.session_state.current_category = "System Design"
+            
+        else:  # Behavioral
+            question_idx = st.session_state.session_count % len(BEHAVIORAL_QUESTIONS)
+            question = BEHAVIORAL_QUESTIONS[question_idx]
+            st.session_state.current_question = question
+            st.session_state.current_category = "Behavioral"
+        
+        # Reset follow-up count for new question
+        st.session_state.follow_up_count = 0
+    
+    # Display current question
+    question = st.session_state.current_question
+    
+    if st.session_state.current_category == "DSA":
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🎯 Coding Question: {question['topic']} ({question['difficulty']})</h4>
+            <p><strong>Interviewer:</strong> "{question['question']}"</p>
+            <p><em>Take your time to understand the problem. Feel free to ask any clarifying questions before you start coding.</em></p>
+            <p><strong>Hints available:</strong> {', '.join(question['hints'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    elif st.session_state.current_category == "System Design":
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🏗️ System Design Challenge</h4>
+            <p><strong>Interviewer:</strong> "{question['question']}"</p>
+            <p><em>Let's start by clarifying the requirements. What questions do you have about the scope and scale?</em></p>
+            <p><strong>Focus Areas:</strong> {', '.join(question['focus_areas'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    else:  # Behavioral
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🎭 Behavioral Question: {question['principle']}</h4>
+            <p><strong>Interviewer:</strong> "{question['question']}"</p>
+            <p><em>Please structure your response using the STAR method - Situation, Task, Action, Result.</em></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+@fragment
+def show_response_composer():
+    """Recording toggle, response box and submit; a submitted turn reruns the app to update the transcript"""
+    question = st.session_state.current_question
+    
+    # Voice recording simulation section
+    st.subheader("🎤 Response Options")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🎤 Simulate Voice Recording", type="secondary", key="voice_sim"):
+            if not advance_interview('start_recording'):
+                advance_interview('stop_recording')
+    
+    with col2:
+        if st.button("📝 Text Response", type="secondary", key="text_mode"):
+            advance_interview('stop_recording')
+    
+    # Recording simulation display
+    if st.session_state.interview_state == interview_state.RECORDING:
+        st.markdown("""
+        <div class="recording-sim">
+            🔴 VOICE RECORDING SIMULATION
+            <div class="voice-wave">
+                <span></span><span></span><span></span><span></span><span></span>
+            </div>
+            <p>In the full version, this would capture your voice response!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Response input
+    st.subheader("💬 Your Response")
+    response = st.text_area(
+        "Share your solution, approach, or answer:",
+        height=200,
+        placeholder="Type your response here... Explain your thinking process clearly.",
+        key="interview_response"
+    )
+    
+    # The candidate is answering: prepare the predictable next turns in the background
+    if response:
+        schedule_interview_prefetch()
+    
+    # Submit response button
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col2:
+        submit_clicked = st.button("📤 Submit Response", type="primary", key="submit_response", use_container_width=True)
+    
+    if submit_clicked and response:
+        # Get interviewer's follow-up response; the context gives way to the answer before it is ever cut
+        context_budget = max(PROMPT_BUDGETS['interviewer'] - estimate_tokens(response), MIN_CONTEXT_TOKENS)
+        context, st.session_state.interview_summary = build_interview_context(
+            st.session_state.current_category,
+            question,
+            st.session_state.follow_up_count,
+            get_interview_turns(),
+            st.session_state.interview_summary,
+            budget=context_budget
+        )
+        
+        st.markdown(CARD_TEMPLATES['user'].render(response), unsafe_allow_html=True)
+        
+        # Stream the interviewer's reply; history is only updated once it completes
+        advance_interview('submit')
+        try:
+            interviewer_response = render_streamed_message(
+                "interviewer-message",
+                "🎯 Interviewer",
+                get_ai_response(response, context, is_interviewer=True, stream=True)
+            )
+        except BaseException:
+            # Includes Streamlit stopping the script for a new rerun mid-stream
+            advance_interview('ai_failed')
+            raise
+        
+        # Add to chat history
+        st.session_state.chat_history.append({
+            'role': 'user',
+            'content': response,
+            'timestamp': datetime.now(),
+            'question_context': question,
+            'interview_id': st.session_state.interview_id
+        })
+        
+        st.session_state.chat_history.append({
+            'role': 'interviewer',
+            'content': interviewer_response,
+            'timestamp': datetime.now(),
+            'interview_id': st.session_state.interview_id
+        })
+        
+        # Increment follow-up count
+        st.session_state.follow_up_count += 1
+        advance_interview('ai_replied')
+        
+        # Clear the response box and show success
+        st.success("✅ Response submitted! Check the interviewer's follow-up below.")
+        st.rerun()
+
+@fragment
+def show_interview_transcript():
+    """Latest interview turns; "Load earlier messages" reruns only the transcript"""
+    interview_turns = get_interview_turns()
+    if interview_turns:
+        st.subheader("💬 Interview Conversation")
+        
+        # Show recent conversation (last 6 messages, more on request)
+        recent_messages = get_message_window(interview_turns, "transcript", 6)
+        
+        cards = render_cards(recent_messages, roles=('user', 'interviewer'))
+        if cards:
+            st.markdown("\n\n".join(cards), unsafe_allow_html=True)
+
+@fragment
+def show_interview_controls():
+    """Next question, hint, feedback and end; hints and feedback render in place"""
+    question = st.session_state.current_question
+    
+    # Interview controls
+    st.subheader("🎮 Interview Controls")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if st.button("🔄 Next Question", key="next_question"):
+            # Move to next question in sequence
+            next_question = get_next_question(st.session_state.current_category)
+            st.session_state.current_question = next_question
+            
+            # The interviewer opens every question, from the prefetch when it was made while the candidate answered
+            st.session_state.chat_history.append({
+                'role': 'interviewer',
+                'content': take_opening_turn(st.session_state.current_category, next_question),
+                'timestamp': datetime.now(),
+                'interview_id': st.session_state.interview_id
+            })
+            
+            st.session_state.follow_up_count = 0
+            st.session_state.session_count += 1
+            advance_interview('next_question')
+            st.rerun()
+    
+    with col2:
+        if st.button("💡 Get Hint", key="get_hint"):
+            if 'hints' in question:
+                hint = question['hints'][st.session_state.follow_up_count % len(question['hints'])]
+                st.info(f"💡 Hint: {hint}")
+    
+    with col3:
+        if st.button("📊 Get Feedback", key="get_feedback"):
+            if st.session_state.chat_history:
+                # Get recent responses for evaluation
+                recent_responses = [msg['content'] for msg in st.session_state.chat_history[-3:] if msg['role'] == 'user']
+                if recent_responses:
+                    feedback_context = build_feedback_context(
+                        recent_responses,
+                        st.session_state.interview_summary.get('lines', [])
+                    )
+                    feedback = get_ai_response(
+                        "Please provide detailed feedback on the candidate's interview performance so far",
+                        feedback_context
+                    )
+                    st.markdown(f"""
+                    <div class="feedback-positive">
+                        <h4>📊 Interview Feedback</h4>
+                        <p>{feedback}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.warning("Submit at least one response to get feedback!")
+            else:
+                st.warning("No responses yet to evaluate!")
+    
+    with col4:
+        if st.button("🏁 End Interview", key="end_interview"):
+            # Store session data
+            session_data = {
+                'timestamp': datetime.now(),
+                'type': st.session_state.current_category,
+                'duration': (datetime.now() - st.session_state.interview_timer).seconds // 60,
+                'questions_asked': st.session_state.follow_up_count + 1,
+                'responses': len([msg for msg in get_interview_turns() if msg['role'] == 'user'])
+            }
+            record_session(session_data)
+            
+            # Save data automatically
+            save_user_data()
+            
+            # Drop prefetched turns this interview will no longer use
+            get_prefetcher().cancel(f"{st.session_state.interview_id}:")
+            
+            # Reset interview state; the setup page shows the summary
+            advance_interview('end')
+            st.session_state.last_interview = {'session': session_data, 'celebrated': False}
+            st.session_state.live_interview_mode = False
+            st.session_state.current_question = None
+            st.session_state.follow_up_count = 0
+            st.rerun()
+
+def show_interview_summary():
+    """Summary of the interview that just ended, celebrated once"""
+    last_interview = st.session_state.last_interview
+    session_data = last_interview['session']
+    if not last_interview['celebrated']:
+        last_interview['celebrated'] = True
+        st.success("🎉 Interview session completed! Great job!")
+        st.balloons()
+    
+    st.markdown(f"""
+    <div class="feedback-positive">
+        <h4>📋 Session Summary</h4>
+        <p><strong>Duration:</strong> {session_data['duration']} minutes</p>
+        <p><strong>Questions:</strong> {session_data['questions_asked']}</p>
+        <p><strong>Responses:</strong> {session_data['responses']}</p>
+        <p><strong>Type:</strong> {session_data['type']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def show_live_interview_page():
+    """Live interview setup page"""
+    st.header("🎪 Live Interview Simulation")
+    
+    st.markdown("""
+    <div class="interview-session-card">
+        <h3>🚀 Realistic Amazon SDE II Interview Experience</h3>
+        <p>Experience the most realistic interview simulation with AI-powered follow-up questions!</p>
+        <ul style="text-align: left; margin: 1rem auto; max-width: 600px;">
+            <li>🎯 <strong>Dynamic Questioning</strong> - AI asks follow-ups based on your responses</li>
+            <li>⏱️ <strong>Real-time Pressure</strong> - Timed sessions with realistic interview flow</li>
+            <li>🔄 <strong>Adaptive Difficulty</strong> - Questions get deeper as you progress</li>
+            <li>📊 <strong>Live Feedback</strong> - Immediate evaluation and guidance</li>
+            <li>🎤 <strong>Voice Simulation</strong> - Practice speaking your solutions</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if st.session_state.interview_state == interview_state.ENDED and st.session_state.last_interview:
+        show_interview_summary()
+    
+    # Interview type selection with enhanced descriptions
+    st.subheader("🎯 Choose Your Interview Round")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card" style="text-align: center;">
+            <h3>💻 DSA Coding</h3>
+            <p>Arrays, Trees, Graphs, DP</p>
+            <p><strong>Duration:</strong> 45 minutes</p>
+            <p><strong>Format:</strong> Code + Follow-ups</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Start DSA Round", use_container_width=True, type="primary", key="start_dsa"):
+            st.session_state.current_category = "DSA Coding Round"
+            start_live_interview()
+            st.rerun()
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card" style="text-align: center;">
+            <h3>🏗️ System Design</h3>
+            <p>Scalability, Architecture</p>
+            <p><strong>Duration:</strong> 60 minutes</p>
+            <p><strong>Format:</strong> Design + Deep Dive</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Start System Design", use_container_width=True, type="primary", key="start_system"):
+            st.session_state.current_category = "System Design Round"
+            start_live_interview()
+            st.rerun()
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card" style="text-align: center;">
+            <h3>🎭 Behavioral</h3>
+            <p>Leadership Principles</p>
+            <p><strong>Duration:</strong> 30 minutes</p>
+            <p><strong>Format:</strong> STAR + Follow-ups</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("Start Behavioral", use_container_width=True, type="primary", key="start_behavioral"):
+            st.session_state.current_category = "Behavioral Round"
+            start_live_interview()
+            st.rerun()
+    
+    # Recent interview sessions
+    if st.session_state.interview_sessions:
+        st.subheader("📈 Recent Interview Sessions")
+        
+        # pandas loads only once there is a table to show
+        from app_pages.charts import build_sessions_table
+        st.dataframe(
+            cached_view('sessions_table', ('sessions',), build_sessions_table),
+            column_config={
+                'timestamp': 'Date & Time',
+                'type': 'Interview Type',
+                'duration': 'Duration (min)',
+                'questions_asked': 'Questions',
+                'responses': 'Responses'
+            },
+            use_container_width=True
+        )
+    
+    # Success tips
+    st.subheader("💡 Tips for Maximum Success")
+    
+    tips_col1, tips_col2 = st.columns(2)
+    
+    with tips_col1:
+        st.markdown("""
+        **🎯 Before Starting:**
+        - Find a quiet, focused environment
+        - Have a whiteboard or paper ready
+        - Prepare your mindset for realistic pressure
+        - Review Amazon Leadership Principles
+        
+        **💬 During the Interview:**
+        - Think out loud - explain your reasoning
+        - Ask clarifying questions when needed
+        - Don't be afraid to admit uncertainty
+        - Stay calm and methodical in your approach
+        """)
+    
+    with tips_col2:
+        st.markdown("""
+        **🔄 Follow-up Strategy:**
+        - Listen carefully to follow-up questions
+        - Build on your previous responses
+        - Show depth of technical knowledge
+        - Demonstrate problem-solving skills
+        
+        **📊 After Each Session:**
+        - Review the feedback carefully
+        - Identify specific areas for improvement
+        - Practice weak areas before next session
+        - Track your progress over time
+        """)
@@ -0,0 +1,344 @@
+"""📝 Mock Interview: DSA, system design and behavioral practice with scored answers."""
+from datetime import datetime
+
+import streamlit as st
+
+from ai_assistant import evaluate_answer, evaluate_answers_batch, record_evaluation_scores
+from app_state import record_score, save_user_data
+from question_bank import BEHAVIORAL_QUESTIONS, DSA_QUESTIONS, SYSTEM_DESIGN_QUESTIONS
+
+def show_mock_interview():
+    """Traditional mock interview mode"""
+    st.header("📝 Mock Interview Practice")
+    
+    st.info("💡 For the most realistic experience with follow-up questions, try the **Live Interview Mode** in the sidebar!")
+    
+    # Interview type selection
+    interview_type = st.selectbox(
+        "Select Practice Type",
+        ["🔢 Data Structures & Algorithms", "🏗️ System Design", "🎭 Behavioral (Leadership Principles)"]
+    )
+    
+    if "Data Structures" in interview_type:
+        show_dsa_practice()
+    elif "System Design" in interview_type:
+        show_system_design_practice()
+    else:
+        show_behavioral_practice()
+    
+    show_evaluation_queue()
+
+def queue_answer(question_text: str, answer: str, category: str):
+    """Hold an answer for the next batch evaluation and move on to a new question"""
+    st.session_state.evaluation_queue.append({'question': question_text, 'answer': answer, 'category': category})
+    st.session_state.current_question = None
+    st.session_state.current_category = None
+    st.success(f"📥 Answer queued - {len(st.session_state.evaluation_queue)} waiting for batch review.")
+
+def show_evaluation_queue():
+    """Queued answers, graded together with one AI request per batch"""
+    queue = st.session_state.evaluation_queue
+    if not queue:
+        return
+    
+    st.markdown("---")
+    st.subheader(f"📋 Batch Review Queue ({len(queue)})")
+    for item in queue:
+        st.write(f"• **{item['category']}:** {item['question']}")
+    
+    if st.button(f"⚡ Evaluate {len(queue)} Queued Answers", type="primary", key="evaluate_queue"):
+        with st.spinner("Evaluating queued answers..."):
+            results = evaluate_answers_batch(queue)
+        recorded = record_evaluation_scores(results)
+        
+        # Answers that were not scored (unparsed section or failed request) stay queued for another try
+        st.session_state.evaluation_queue = [item for item, result in zip(queue, results) if result['score'] is None]
+        if recorded:
+            st.success(f"✅ Recorded {recorded} of {len(results)} scores.")
+        else:
+            st.error(f"❌ No scores recorded: {results[0]['error']}")
+        for item, result in zip(queue, results):
+            with st.expander(f"{item['category']}: {item['question']}"):
+                if result['score'] is None:
+                    st.warning(f"⚠️ Not scored: {result['error']}. The answer is still queued.")
+                else:
+                    st.markdown(f"**Score: {result['score']}/10**")
+                    st.write(result['feedback'])
+
+def show_dsa_practice():
+    """DSA practice mode"""
+    st.subheader("💻 Data Structures & Algorithms Practice")
+    
+    if st.button("🎲 Generate New DSA Question", type="primary"):
+        question_idx = st.session_state.session_count % len(DSA_QUESTIONS)
+        question = DSA_QUESTIONS[question_idx]
+        st.session_state.current_question = question
+        st.session_state.current_category = "DSA"
+        st.session_state.question_start_time = datetime.now()
+        st.session_state.session_count += 1
+    
+    if st.session_state.current_question and st.session_state.current_category == "DSA":
+        question = st.session_state.current_question
+        
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🎯 {question['topic']} - {question['difficulty']}</h4>
+            <p><strong>Question:</strong> {question['question']}</p>
+            <p><strong>💡 Hints:</strong> {', '.join(question['hints'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Timer
+        if st.session_state.question_start_time:
+            elapsed = datetime.now() - st.session_state.question_start_time
+            st.info(f"⏱️ Time elapsed: {elapsed.seconds // 60}m {elapsed.seconds % 60}s")
+        
+        # Code input
+        st.subheader("💻 Your Solution")
+        language = st.selectbox("Programming Language", ["Python", "Java", "C++", "JavaScript"])
+        
+        code_solution = st.text_area(
+            "Write your code solution:",
+            height=300,
+            placeholder="def solution(nums, target):\n    # Your approach here\n    pass"
+        )
+        
+        # Explanation input
+        explanation = st.text_area(
+            "Explain your approach and complexity:",
+            height=150,
+            placeholder="My approach is to...\nTime Complexity: O(?)\nSpace Complexity: O(?)"
+        )
+        
+        full_answer = f"Code:\n{code_solution}\n\nExplanation:\n{explanation}"
+        if st.button("✅ Submit Solution", type="primary"):
+            if code_solution and explanation:
+                # Evaluate the solution
+                evaluation = evaluate_answer(question['question'], full_answer, "DSA")
+                
+                # Store performance data
+                record_score("DSA", evaluation['score'])
+                
+                # Save data automatically
+                save_user_data()
+                
+                # Show feedback
+                if evaluation['score'] >= 7:
+                    st.markdown(f"""
+                    <div class="feedback-positive">
+                        <h4>✅ Excellent! Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div class="feedback-negative">
+                        <h4>📈 Room for Improvement - Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Clear current question
+                st.session_state.current_question = None
+                st.session_state.current_category = None
+            else:
+                st.error("Please provide both code solution and explanation.")
+        
+        if st.button("📥 Queue for Batch Review", key="queue_dsa", help="Collect several answers and grade them in one request"):
+            if code_solution and explanation:
+                queue_answer(question['question'], full_answer, "DSA")
+            else:
+                st.error("Please provide both code solution and explanation.")
+
+def show_system_design_practice():
+    """System design practice mode"""
+    st.subheader("🏗️ System Design Practice")
+    
+    if st.button("🎲 Generate New System Design Question", type="primary"):
+        question_idx = st.session_state.session_count % len(SYSTEM_DESIGN_QUESTIONS)
+        question = SYSTEM_DESIGN_QUESTIONS[question_idx]
+        st.session_state.current_question = question
+        st.session_state.current_category = "System Design"
+        st.session_state.question_start_time = datetime.now()
+        st.session_state.session_count += 1
+    
+    if st.session_state.current_question and st.session_state.current_category == "System Design":
+        question = st.session_state.current_question
+        
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🎯 {question['question']}</h4>
+            <p><strong>🎪 Focus Areas:</strong> {', '.join(question['focus_areas'])}</p>
+            <p><strong>🔧 Key Components:</strong> {', '.join(question['key_components'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Timer
+        if st.session_state.question_start_time:
+            elapsed = datetime.now() - st.session_state.question_start_time
+            st.info(f"⏱️ Time elapsed: {elapsed.seconds // 60}m {elapsed.seconds % 60}s")
+        
+        # System design response sections
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("📋 Requirements & Scale")
+            requirements = st.text_area(
+                "Functional and Non-functional Requirements:",
+                height=150,
+                placeholder="Functional: Users can...\nNon-functional: Handle X requests/day, 99.9% availability..."
+            )
+            
+            st.subheader("🎯 High-Level Design")
+            high_level = st.text_area(
+                "High-level architecture:",
+                height=150,
+                placeholder="Client -> Load Balancer -> API Gateway -> Services..."
+            )
+        
+        with col2:
+            st.subheader("🗄️ Database Design")
+            database = st.text_area(
+                "Database schema and technology choices:",
+                height=150,
+                placeholder="Tables, relationships, SQL vs NoSQL choice..."
+            )
+            
+            st.subheader("⚡ Deep Dive & Scaling")
+            deep_dive = st.text_area(
+                "Detailed component discussion:",
+                height=150,
+                placeholder="Caching strategy, load balancing, monitoring..."
+            )
+        
+        full_answer = f"Requirements: {requirements}\nHigh-level: {high_level}\nDatabase: {database}\nDeep dive: {deep_dive}"
+        if st.button("✅ Submit Design", type="primary"):
+            if all([requirements, high_level, database, deep_dive]):
+                evaluation = evaluate_answer(question['question'], full_answer, "System Design")
+                
+                # Store performance data
+                record_score("System Design", evaluation['score'])
+                
+                # Save data automatically
+                save_user_data()
+                
+                # Show feedback
+                if evaluation['score'] >= 7:
+                    st.markdown(f"""
+                    <div class="feedback-positive">
+                        <h4>✅ Strong Design! Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div class="feedback-negative">
+                        <h4>📈 Areas to Strengthen - Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Clear current question
+                st.session_state.current_question = None
+                st.session_state.current_category = None
+            else:
+                st.error("Please fill in all sections of the system design.")
+        
+        if st.button("📥 Queue for Batch Review", key="queue_system_design", help="Collect several answers and grade them in one request"):
+            if all([requirements, high_level, database, deep_dive]):
+                queue_answer(question['question'], full_answer, "System Design")
+            else:
+                st.error("Please fill in all sections of the system design.")
+
+def show_behavioral_practice():
+    """Behavioral practice mode"""
+    st.subheader("🎭 Behavioral Interview Practice")
+    
+    if st.button("🎲 Generate New Behavioral Question", type="primary"):
+        question_idx = st.session_state.session_count % len(BEHAVIORAL_QUESTIONS)
+        question = BEHAVIORAL_QUESTIONS[question_idx]
+        st.session_state.current_question = question
+        st.session_state.current_category = "Behavioral"
+        st.session_state.question_start_time = datetime.now()
+        st.session_state.session_count += 1
+    
+    if st.session_state.current_question and st.session_state.current_category == "Behavioral":
+        question = st.session_state.current_question
+        
+        st.markdown(f"""
+        <div class="question-card">
+            <h4>🎯 Leadership Principle: {question['principle']}</h4>
+            <p><strong>Question:</strong> {question['question']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.subheader("⭐ STAR Format Response")
+        st.info("💡 Structure your answer using STAR: Situation, Task, Action, Result")
+        
+        # STAR format inputs
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            situation = st.text_area(
+                "🎬 Situation:",
+                height=120,
+                placeholder="Describe the context and background..."
+            )
+            
+            action = st.text_area(
+                "⚡ Action:",
+                height=120,
+                placeholder="What specific actions did YOU take..."
+            )
+        
+        with col2:
+            task = st.text_area(
+                "📋 Task:",
+                height=120,
+                placeholder="What was your responsibility or goal..."
+            )
+            
+            result = st.text_area(
+                "🎯 Result:",
+                height=120,
+                placeholder="What was the outcome? Include metrics..."
+            )
+        
+        full_answer = f"Situation: {situation}\n\nTask: {task}\n\nAction: {action}\n\nResult: {result}"
+        if st.button("✅ Submit STAR Response", type="primary"):
+            if all([situation, task, action, result]):
+                evaluation = evaluate_answer(question['question'], full_answer, "Behavioral")
+                
+                # Store performance data
+                record_score("Behavioral", evaluation['score'])
+                
+                # Save data automatically
+                save_user_data()
+                
+                # Show feedback
+                if evaluation['score'] >= 7:
+                    st.markdown(f"""
+                    <div class="feedback-positive">
+                        <h4>✅ Strong STAR Response! Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div class="feedback-negative">
+                        <h4>📈 Strengthen Your STAR - Score: {evaluation['score']}/10</h4>
+                        <p>{evaluation['feedback']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Clear current question
+                st.session_state.current_question = None
+                st.session_state.current_category = None
+            else:
+                st.error("Please complete all STAR components.")
+        
+        if st.button("📥 Queue for Batch Review", key="queue_behavioral", help="Collect several answers and grade them in one request"):
+            if all([situation, task, action, result]):
+                queue_answer(question['question'], full_answer, "Behavioral")
+            else:
+                st.error("Please complete all STAR components.")
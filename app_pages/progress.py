@@ -0,0 +1,134 @@
+"""📈 Progress Tracking: score trends, session analysis and recommendations."""
+import streamlit as st
+
+import score_stats
+from app_pages.charts import (CHART_MAX_BARS, CHART_MAX_POINTS, build_date_bounds, build_score_progression_chart,
+                              build_session_duration_chart, build_session_summary)
+from app_state import cached_view, get_score_stats
+
+def select_zoom_range():
+    """Date range picked to see more detail once charts are downsampled; None for all dates"""
+    too_many_points = len(st.session_state.performance_data['timestamps']) > CHART_MAX_POINTS
+    too_many_bars = len(st.session_state.interview_sessions) > CHART_MAX_BARS
+    if not (too_many_points or too_many_bars):
+        return None
+    
+    bounds = cached_view('date_bounds', ('scores', 'sessions'), build_date_bounds)
+    if bounds is None:
+        return None
+    picked = st.date_input(
+        "🔍 Zoom to dates", value=bounds, min_value=bounds[0], max_value=bounds[1], key="progress_zoom",
+        help="Long histories are downsampled; a shorter range loads full detail for that period"
+    )
+    # The picker returns one date while the second end is being chosen
+    if isinstance(picked, (list, tuple)) and len(picked) == 2 and tuple(picked) != bounds:
+        return tuple(picked)
+    return None
+
+def show_progress_tracking():
+    """Enhanced progress tracking"""
+    st.header("📈 Advanced Progress Tracking & Analytics")
+    
+    date_range = select_zoom_range()
+    
+    # Performance overview
+    if st.session_state.performance_data['timestamps']:
+        col1, col2, col3 = st.columns(3)
+        
+        metric_labels = [("DSA", "🔢 DSA"), ("System Design", "🏗️ System Design"), ("Behavioral", "🎭 Behavioral")]
+        for col, (category, label) in zip((col1, col2, col3), metric_labels):
+            stats = get_score_stats(category)
+            with col:
+                if score_stats.count(stats):
+                    avg = score_stats.mean(stats)
+                    st.metric(f"{label} Average", f"{avg:.1f}/10", f"+{avg-5:.1f}")
+                    st.caption(
+                        f"Last {len(stats['window'])}: {score_stats.window_mean(stats):.1f} · "
+                        f"Trend (EWMA): {stats['ewma']:.1f} · Range {stats['min']}-{stats['max']} · "
+                        f"Streak {stats['streak']} (best {stats['best_streak']})"
+                    )
+        
+        # Performance trends
+        st.subheader("📊 Detailed Performance Analysis")
+        
+        fig, shown, total = cached_view(
+            f'score_progression:{date_range}', ('scores',), lambda: build_score_progression_chart(date_range)
+        )
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True)
+            if shown < total:
+                st.caption(f"Showing {shown:,} of {total:,} scores; zoom to a shorter date range for more detail.")
+    else:
+        st.info("📝 Complete some practice questions to see your detailed progress!")
+    
+    # Interview sessions analysis
+    if st.session_state.interview_sessions:
+        st.subheader("🎪 Live Interview Sessions Analysis")
+        
+        summary = cached_view('session_summary', ('sessions',), build_session_summary)
+        
+        # Summary metrics
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("⏱️ Avg Session Duration", f"{summary['avg_duration']:.1f} min")
+        
+        with col2:
+            st.metric("❓ Total Questions Asked", f"{summary['total_questions']}")
+        
+        with col3:
+            st.metric("💬 Avg Responses per Session", f"{summary['avg_responses']:.1f}")
+        
+        # Session breakdown chart
+        if len(st.session_state.interview_sessions) > 1:
+            session_chart = cached_view(
+                f'session_durations:{date_range}', ('sessions',), lambda: build_session_duration_chart(date_range)
+            )
+            if session_chart is not None:
+                st.plotly_chart(session_chart, use_container_width=True)
+    
+    # Personalized recommendations
+    st.subheader("🎯 AI-Powered Recommendations")
+    
+    if st.session_state.performance_data['timestamps']:
+        recommendations = []
+        
+        # Analyze weak areas
+        dsa_stats = get_score_stats("DSA")
+        if score_stats.count(dsa_stats):
+            avg_dsa = score_stats.mean(dsa_stats)
+            if avg_dsa < 7:
+                recommendations.append(f"🔢 **DSA Focus Needed** - Current average: {avg_dsa:.1f}/10. Practice more array and tree problems.")
+        
+        system_stats = get_score_stats("System Design")
+        if score_stats.count(system_stats):
+            avg_sys = score_stats.mean(system_stats)
+            if avg_sys < 7:
+                recommendations.append(f"🏗️ **System Design Improvement** - Current average: {avg_sys:.1f}/10. Focus on scalability patterns.")
+        
+        behavioral_stats = get_score_stats("Behavioral")
+        if score_stats.count(behavioral_stats):
+            avg_beh = score_stats.mean(behavioral_stats)
+            if avg_beh < 7:
+                recommendations.append(f"🎭 **Behavioral Enhancement** - Current average: {avg_beh:.1f}/10. Strengthen STAR method responses.")
+        
+        # Session-based recommendations
+        total_sessions = len(st.session_state.interview_sessions) + st.session_state.archived_sessions
+        if not total_sessions:
+            recommendations.append("🎪 **Try Live Interview Mode** - Experience realistic interview pressure with follow-up questions.")
+        
+        if total_sessions < 3:
+            recommendations.append("🔄 **More Practice Needed** - Complete at least 3 live interview sessions for comprehensive preparation.")
+        
+        if not recommendations:
+            recommendations.append("🎉 **Excellent Progress!** - You're performing well across all areas. Keep practicing to maintain your edge!")
+        
+        for rec in recommendations:
+            st.markdown(f"• {rec}")
+    else:
+        st.markdown("""
+        **🚀 Get Started:**
+        • Complete your first practice question to see personalized recommendations
+        • Try the Live Interview Mode for realistic practice
+        • Focus on areas where you feel less confident
+        """)
@@ -0,0 +1,28 @@
+"""📚 Resources: study links, plans and leadership principles."""
+import streamlit as st
+
+from resources_content import load_resources
+
+def render_block(block):
+    """One precompiled block: a single Streamlit call (two for columns)"""
+    if block.kind == 'markdown':
+        st.markdown(block.body)
+    elif block.kind == 'subheader':
+        st.subheader(block.body)
+    elif block.kind == 'expander':
+        with st.expander(block.title):
+            st.markdown(block.body)
+    elif block.kind == 'columns':
+        for column, body in zip(st.columns(len(block.body)), block.body):
+            column.markdown(body)
+
+def show_resources():
+    """Enhanced resources page"""
+    content = load_resources()
+    st.header(content.header)
+
+    # st.tabs would send every tab's content on each rerun; only the selected one is rendered here
+    selected = st.radio("Section", list(content.tabs), horizontal=True, key="resources_tab",
+                        label_visibility="collapsed")
+    for block in content.tabs[selected].blocks:
+        render_block(block)
@@ -0,0 +1,247 @@
+"""Session state and persistence shared by main_app and the page modules.
+
+Pages live in app_pages/ and are imported on first use; everything they
+share about the current session (saving and loading the profile, recording
+scores and sessions, cached views, message windows) lives here rather than
+in main_app, which Streamlit runs as __main__ and pages cannot import.
+"""
+import json
+import os
+import secrets
+from datetime import datetime
+from typing import Any, Dict, List
+
+import streamlit as st
+
+import interview_state
+import score_stats
+from user_store import DEFAULT_USER_ID, SCORE_KEYS, get_user_store, validate_user_id
+from view_cache import ViewCache
+from write_behind import get_write_behind
+
+# Data persistence functions
+# Messages loaded when a session starts and per "Load earlier" click
+CHAT_PAGE_SIZE = int(os.getenv('CHAT_PAGE_SIZE', '50'))
+
+def collect_unsaved_records() -> List[tuple]:
+    """Records created since the last save, in the order they happened"""
+    saved = st.session_state.saved_counts
+    records = [('message', msg) for msg in st.session_state.chat_history[saved['chat_history']:]]
+    records += [('session', session) for session in st.session_state.interview_sessions[saved['interview_sessions']:]]
+    records += [('score', score) for score in st.session_state.unsaved_scores]
+    
+    counters = {
+        'session_count': st.session_state.session_count,
+        'total_study_time': st.session_state.total_study_time
+    }
+    if counters != saved['counters']:
+        records.append(('counters', counters))
+    return records
+
+def mark_all_saved():
+    """Record that everything currently in session state is persisted"""
+    st.session_state.saved_counts = {
+        'chat_history': len(st.session_state.chat_history),
+        'interview_sessions': len(st.session_state.interview_sessions),
+        'counters': {
+            'session_count': st.session_state.session_count,
+            'total_study_time': st.session_state.total_study_time
+        }
+    }
+    st.session_state.unsaved_scores = []
+
+def save_user_data():
+    """Queue new messages, sessions and scores for the background writer"""
+    try:
+        store = get_user_store(st.session_state.user_id)
+        writer = get_write_behind()
+        
+        # Writes happen on the writer thread, so errors surface on a later save
+        error = writer.last_error(store)
+        if error:
+            st.error(f"Error saving data: {error}")
+        
+        records = collect_unsaved_records()
+        if records:
+            writer.submit(store, records)
+            mark_all_saved()
+    except Exception as e:
+        st.error(f"Error saving data: {e}")
+
+def load_user_data():
+    """Load the current profile's data from local storage"""
+    try:
+        store = get_user_store(st.session_state.user_id)
+        # Queued writes (e.g. from another tab of this profile) must land before reading
+        get_write_behind().flush(timeout=5.0)
+        
+        # One-time import of the legacy single-user file into the default profile
+        if st.session_state.user_id == DEFAULT_USER_ID and store.is_empty() and os.path.exists('user_data.json'):
+            with open('user_data.json', 'r') as f:
+                store.import_state(json.load(f))
+        
+        data = store.load(message_limit=CHAT_PAGE_SIZE)
+        st.session_state.chat_history = data['chat_history']
+        st.session_state.chat_history_cursor = data['chat_history_cursor']
+        st.session_state.message_windows = {}
+        st.session_state.interview_sessions = data['interview_sessions']
+        st.session_state.archived_sessions = data['archived_sessions']
+        st.session_state.performance_data = data['performance_data']
+        st.session_state.score_stats = data['score_stats']
+        st.session_state.session_count = data['session_count']
+        st.session_state.total_study_time = data['total_study_time']
+        mark_all_saved()
+        bump_data_version('scores', 'sessions')
+        
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+
+def load_earlier_messages() -> int:
+    """Prepend the previous page of chat history from storage; returns how many were added"""
+    if st.session_state.chat_history_cursor is None:
+        return 0
+    
+    try:
+        page, cursor = get_user_store(st.session_state.user_id).read_messages(
+            CHAT_PAGE_SIZE, before=st.session_state.chat_history_cursor
+        )
+    except Exception as e:
+        st.error(f"Error loading earlier messages: {e}")
+        return 0
+    
+    st.session_state.chat_history[:0] = page
+    st.session_state.chat_history_cursor = cursor
+    # Saved messages are tracked by position, so shift past the prepended page
+    st.session_state.saved_counts['chat_history'] += len(page)
+    return len(page)
+
+def get_requested_user_id() -> str:
+    """Profile from the ?user= query parameter, or a new guest profile for this browser
+
+    A guest id is written back into the URL, so reloading or bookmarking the
+    page keeps the same profile and concurrent users never share one.
+    """
+    if hasattr(st, 'query_params'):
+        user_id = st.query_params.get('user', '')
+    else:
+        user_id = st.experimental_get_query_params().get('user', [''])[0]
+    try:
+        return validate_user_id(user_id)
+    except ValueError:
+        user_id = f"guest-{secrets.token_hex(6)}"
+        set_requested_user_id(user_id)
+        return user_id
+
+def set_requested_user_id(user_id: str):
+    """Put the profile in the ?user= query parameter"""
+    if hasattr(st, 'query_params'):
+        st.query_params['user'] = user_id
+    else:
+        st.experimental_set_query_params(user=user_id)
+
+def bump_data_version(*kinds: str):
+    """Invalidate cached views derived from 'scores' and/or 'sessions'"""
+    for kind in kinds:
+        st.session_state.data_versions[kind] += 1
+
+def cached_view(name: str, depends: tuple, build):
+    """DataFrame or figure from build(), reused until the data it depends on changes"""
+    version = (st.session_state.user_id,) + tuple(st.session_state.data_versions[kind] for kind in depends)
+    return st.session_state.view_cache.get(name, version, build)
+
+def record_score(category: str, score: int, timestamp: datetime = None):
+    """Add a score to performance_data and queue it for the next save"""
+    score_key = SCORE_KEYS[category]
+    timestamp = timestamp or datetime.now()
+    st.session_state.performance_data[score_key].append(score)
+    st.session_state.performance_data['timestamps'].append(timestamp)
+    st.session_state.unsaved_scores.append({'key': score_key, 'score': score, 'timestamp': timestamp})
+    score_stats.record_score_stats(st.session_state.score_stats, score_key, score)
+    bump_data_version('scores')
+
+def record_session(session_data: dict):
+    """Add a finished live interview session; saved with the next save"""
+    st.session_state.interview_sessions.append(session_data)
+    bump_data_version('sessions')
+
+def init_session_state():
+    """Set up session state and load the profile on a session's first run"""
+    if 'initialized' not in st.session_state:
+        st.session_state.initialized = True
+        st.session_state.current_session = datetime.now().strftime("%Y%m%d_%H%M%S")
+        st.session_state.chat_history = []
+        st.session_state.interview_sessions = []
+        st.session_state.archived_sessions = 0
+        st.session_state.performance_data = {
+            'dsa_scores': [],
+            'system_design_scores': [],
+            'behavioral_scores': [],
+            'timestamps': []
+        }
+        st.session_state.score_stats = score_stats.build_score_stats({})
+        st.session_state.current_question = None
+        st.session_state.current_category = None
+        st.session_state.question_start_time = None
+        st.session_state.total_study_time = 0
+        st.session_state.gemini_client = None
+        st.session_state.demo_mode = False
+        st.session_state.live_interview_mode = False
+        st.session_state.interview_state = interview_state.IDLE
+        st.session_state.last_interview = None
+        st.session_state.prefetched_turn = None
+        st.session_state.prefetched_openings = 0
+        st.session_state.coach_warmed = False
+        st.session_state.interview_timer = None
+        st.session_state.follow_up_count = 0
+        st.session_state.current_interview_questions = []
+        st.session_state.interview_id = None
+        st.session_state.interview_summary = {}
+        st.session_state.session_count = 0
+        st.session_state.user_id = get_requested_user_id()
+        st.session_state.chat_history_cursor = None
+        st.session_state.message_windows = {}
+        st.session_state.unsaved_scores = []
+        st.session_state.evaluation_queue = []
+        st.session_state.view_cache = ViewCache()
+        st.session_state.data_versions = {'scores': 0, 'sessions': 0}
+        mark_all_saved()
+        
+        # Load existing data
+        load_user_data()
+
+def get_score_stats(category: str) -> dict:
+    """Precomputed aggregates for a category ("DSA", "System Design", "Behavioral")"""
+    return st.session_state.score_stats.get(SCORE_KEYS[category])
+
+def get_message_window(messages: List[Dict[str, Any]], window_key: str, page_size: int,
+                       can_fetch: bool = False) -> List[Dict[str, Any]]:
+    """Latest messages that fit the window, with a "Load earlier" button to widen it
+    
+    With can_fetch, older chat history is read from storage once the loaded
+    messages are all shown.
+    """
+    size = st.session_state.message_windows.get(window_key, page_size)
+    has_more_loaded = len(messages) > size
+    has_more_stored = can_fetch and st.session_state.chat_history_cursor is not None
+    
+    if has_more_loaded or has_more_stored:
+        if st.button("⬆️ Load earlier messages", key=f"load_earlier_{window_key}"):
+            if not has_more_loaded:
+                load_earlier_messages()
+            size += page_size
+            st.session_state.message_windows[window_key] = size
+    
+    return messages[-size:]
+
+def fragment(func=None, *, run_every=None):
+    """st.fragment (st.experimental_fragment before 1.37); a plain function on older Streamlit
+    
+    Interacting with a widget inside a fragment reruns only that function,
+    and run_every reruns it on a timer. st.rerun() still reruns the whole app.
+    """
+    impl = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if impl is None:
+        return func if func is not None else (lambda f: f)
+    if func is not None:
+        return impl(func, run_every=run_every)
+    return impl(run_every=run_every)
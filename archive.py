@@ -0,0 +1,233 @@
+"""Compressed archive tier for old conversations and interview sessions.
+
+The user store keeps a hot window on disk as plain JSONL segments. When a
+profile grows past its RetentionPolicy, the oldest message segments and
+interview sessions are compressed into archive/ (zstd when the optional
+zstandard package is installed, zlib otherwise) and removed from the hot
+tier. archive/index.json stays small: one entry per archived conversation
+with its time range, message count, a preview and its most frequent terms,
+so archived transcripts can be searched without decompressing anything and
+opened on demand.
+"""
+import os
+import re
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from file_utils import atomic_write_bytes
+from snapshot_format import decode_line, encode_line
+
+try:
+    import zstandard
+except ImportError:  # Optional: fall back to zlib
+    zstandard = None
+
+INDEX_TERMS = 24
+PREVIEW_CHARS = 160
+TERM_PATTERN = re.compile(r"[a-z][a-z0-9+#'-]{3,}")
+STOPWORDS = frozenset(
+    "about after again also because been before being between could does doing down during each from "
+    "further have having here into just more most only other over same should some such than that "
+    "their them then there these they this those through under until very were what when where which "
+    "while will with would your yours you're it's that's let's".split()
+)
+
+
+class RetentionPolicy:
+    """How much of a profile stays in the hot tier"""
+
+    def __init__(self, hot_message_segments: int = 4, hot_sessions: int = 500):
+        self.hot_message_segments = hot_message_segments
+        self.hot_sessions = hot_sessions
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """Policy configured by USER_DATA_HOT_SEGMENTS and USER_DATA_HOT_SESSIONS"""
+        return cls(
+            hot_message_segments=int(os.getenv('USER_DATA_HOT_SEGMENTS', '4')),
+            hot_sessions=int(os.getenv('USER_DATA_HOT_SESSIONS', '500'))
+        )
+
+
+def compress(payload: bytes) -> Tuple[bytes, str]:
+    """Compress with the best available codec; returns (data, file suffix)"""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(payload), ".zst"
+    return zlib.compress(payload, 9), ".zz"
+
+
+def decompress(data: bytes, suffix: str) -> bytes:
+    if suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("Archive was written with zstd; install it with 'pip install zstandard'")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def conversation_id(message: Dict[str, Any]) -> str:
+    """Live interview turns group by interview; coach messages by day"""
+    if message.get('interview_id'):
+        return f"interview:{message['interview_id']}"
+    timestamp = message.get('timestamp')
+    day = timestamp.date().isoformat() if isinstance(timestamp, datetime) else "undated"
+    return f"coach:{day}"
+
+
+def conversation_title(conversation: str) -> str:
+    kind, _, key = conversation.partition(":")
+    if kind == "interview":
+        try:
+            return f"Live interview {datetime.strptime(key, '%Y%m%d_%H%M%S'):%Y-%m-%d %H:%M}"
+        except ValueError:
+            return f"Live interview {key}"
+    return f"Coach chat {key}"
+
+
+def extract_terms(texts: Iterable[str], limit: int = INDEX_TERMS) -> List[str]:
+    counts = Counter(
+        term for text in texts for term in TERM_PATTERN.findall(text.lower()) if term not in STOPWORDS
+    )
+    return [term for term, _ in counts.most_common(limit)]
+
+
+class Archive:
+    """Compressed segments plus a small searchable index for one profile"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.join(directory, "archive")
+        self.index_path = os.path.join(self.directory, "index.json")
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_version = None
+
+    def index(self) -> Dict[str, Any]:
+        """The archive index, re-read when another process has changed it"""
+        if not os.path.exists(self.index_path):
+            return {'files': {}, 'conversations': {}, 'sessions': 0}
+        version = self._version()
+        if self._index is None or version != self._index_version:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._index = decode_line(f.read())
+            self._index_version = version
+        return self._index
+
+    def _version(self) -> Tuple[int, int]:
+        stat = os.stat(self.index_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _save_index(self, index: Dict[str, Any]):
+        atomic_write_bytes(self.index_path, encode_line(index).encode('utf-8'))
+        self._index, self._index_version = index, self._version()
+
+    def _write_file(self, name: str, lines: List[str]) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        data, suffix = compress("".join(line + "\n" for line in lines).encode('utf-8'))
+        file_name = name + suffix
+        atomic_write_bytes(os.path.join(self.directory, file_name), data)
+        return file_name
+
+    def read_file(self, file_name: str) -> List[Dict[str, Any]]:
+        with open(os.path.join(self.directory, file_name), 'rb') as f:
+            data = decompress(f.read(), os.path.splitext(file_name)[1])
+        records = []
+        for line in data.decode('utf-8').splitlines():
+            try:
+                records.append(decode_line(line)['data'])
+            except ValueError:
+                continue
+        return records
+
+    def has(self, name: str) -> bool:
+        return any(os.path.splitext(file_name)[0] == name for file_name in self.index()['files'])
+
+    def add_messages(self, name: str, lines: List[str], messages: List[Dict[str, Any]]):
+        """Archive one hot message segment (raw lines and decoded messages) and index its conversations"""
+        file_name = self._write_file(name, lines)
+
+        index = self.index()
+        index = {'files': dict(index['files']), 'conversations': dict(index['conversations']),
+                 'sessions': index['sessions']}
+        index['files'][file_name] = {'kind': 'message', 'count': len(messages)}
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for message in messages:
+            grouped.setdefault(conversation_id(message), []).append(message)
+        for conversation, turns in grouped.items():
+            entry = dict(index['conversations'].get(conversation) or {
+                'title': conversation_title(conversation),
+                'files': [],
+                'messages': 0,
+                'preview': next((turn['content'] for turn in turns if turn.get('role') == 'user'),
+                                turns[0].get('content', ''))[:PREVIEW_CHARS],
+                'terms': []
+            })
+            timestamps = [turn['timestamp'] for turn in turns if isinstance(turn.get('timestamp'), datetime)]
+            if timestamps:
+                entry['started'] = min([entry['started']] + timestamps) if entry.get('started') else min(timestamps)
+                entry['ended'] = max([entry['ended']] + timestamps) if entry.get('ended') else max(timestamps)
+            entry['files'] = entry['files'] + [file_name]
+            entry['messages'] += len(turns)
+            entry['terms'] = extract_terms(entry['terms'] + [turn.get('content', '') for turn in turns])
+            index['conversations'][conversation] = entry
+        self._save_index(index)
+
+    def next_session_file(self) -> str:
+        """Name for the next archived sessions file"""
+        count = sum(1 for meta in self.index()['files'].values() if meta['kind'] == 'session')
+        return f"sessions-{count + 1:06d}"
+
+    def add_sessions(self, name: str, sessions: List[Dict[str, Any]]):
+        """Archive interview sessions that left the hot window"""
+        if not sessions:
+            return
+        file_name = self._write_file(name, [encode_line({'kind': 'session', 'data': session}) for session in sessions])
+        index = self.index()
+        index = {'files': dict(index['files']), 'conversations': index['conversations'],
+                 'sessions': index['sessions'] + len(sessions)}
+        index['files'][file_name] = {'kind': 'session', 'count': len(sessions)}
+        self._save_index(index)
+
+    def session_count(self) -> int:
+        return self.index()['sessions']
+
+    def search(self, query: str = "", limit: int = 20) -> List[Dict[str, Any]]:
+        """Archived conversations matching every query term (newest first), from the index only"""
+        terms = TERM_PATTERN.findall(query.lower()) or query.lower().split()
+        matches = []
+        for conversation, entry in self.index()['conversations'].items():
+            haystack = " ".join([entry['title'].lower(), entry['preview'].lower()] + entry['terms'])
+            if all(term in haystack for term in terms):
+                matches.append(dict(entry, id=conversation))
+        matches.sort(key=lambda entry: entry.get('ended') or datetime.min, reverse=True)
+        return matches[:limit]
+
+    def open(self, conversation: str) -> List[Dict[str, Any]]:
+        """Decompress and return an archived conversation's messages in order"""
+        entry = self.index()['conversations'].get(conversation)
+        if entry is None:
+            return []
+        return [
+            message
+            for file_name in entry['files']
+            for message in self.read_file(file_name)
+            if conversation_id(message) == conversation
+        ]
+
+    def read_segment(self, name: str) -> List[Dict[str, Any]]:
+        """Records of the archived file for a former hot segment name (empty if absent)"""
+        for file_name in self.index()['files']:
+            if os.path.splitext(file_name)[0] == name:
+                return self.read_file(file_name)
+        return []
+
+    def message_files(self) -> List[str]:
+        """Archived message files, oldest first"""
+        return sorted(name for name, meta in self.index()['files'].items() if meta['kind'] == 'message')
+
+    def session_files(self) -> List[str]:
+        return sorted(name for name, meta in self.index()['files'].items() if meta['kind'] == 'session')
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        """All archived interview sessions, oldest first"""
+        return [session for file_name in self.session_files() for session in self.read_file(file_name)]
@@ -0,0 +1,339 @@
+"""Multi-session load test for main_app.py.
+
+Drives many simulated candidates through the real page flows with
+Streamlit's AppTest: open the app, start a live DSA interview, type and
+submit responses, ask for feedback, end the interview and open the
+dashboard. The LLM is the local stand-in backend (LLM_BACKEND=local), so no
+API quota is used.
+
+AppTest is not thread-safe, so every concurrent session runs in its own
+worker process. Each worker first drives one untimed session to import
+Streamlit, pandas, Plotly and the app, so neither latency nor memory
+includes first-import costs. Process-wide state (response cache, request
+engine, prefetcher) is per worker rather than shared as on one server.
+Sessions run in a scratch directory holding a copy of the repository's
+.streamlit/ configuration.
+
+Reports p50/p95/p99 rerun latency per step and overall, rerun throughput,
+script occupancy (seconds each session keeps a script run busy, and the
+share of the workers' time that was busy) and traced memory per session.
+The live interview timer adds load of its own when it is rendered on the
+server (--timer-tick, i.e. INTERVIEW_TIMER_TICK): AppTest cannot fire timed
+fragment reruns, so the cost of one timer rerun is measured on its own and
+reported as the share of a script thread each live candidate keeps busy.
+Results can be saved as a baseline (benchmarks/baselines/load_test.json) and
+later runs are compared against it:
+
+    python benchmarks/load_test.py --sessions 20 --concurrency 4 --save-baseline
+    python benchmarks/load_test.py --sessions 20 --concurrency 4
+"""
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "main_app.py")
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines", "load_test.json")
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "script_seconds_per_session", "memory_per_session_kb",
+                   "timer_occupancy_per_candidate")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(samples, 50) * 1000, 2),
+        'p95_ms': round(percentile(samples, 95) * 1000, 2),
+        'p99_ms': round(percentile(samples, 99) * 1000, 2),
+    }
+
+
+class SimulatedSession:
+    """One candidate driving the app through AppTest, timing every rerun"""
+
+    def __init__(self, index: int, responses: int, timeout: float):
+        from streamlit.testing.v1 import AppTest
+
+        self.index = index
+        self.responses = responses
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.timings: List[tuple] = []
+        self.started = self.finished = 0.0
+
+    def _timed(self, step: str):
+        start = time.perf_counter()
+        self.app.run()
+        self.timings.append((step, time.perf_counter() - start))
+        if self.app.exception:
+            raise RuntimeError(f"Session {self.index} failed at '{step}': {self.app.exception[0].message}")
+
+    def _navigate(self, page: str):
+        nav = next(sb for sb in self.app.sidebar.selectbox if sb.label == "Choose Mode")
+        nav.select(page)
+        self._timed(f"open {page}")
+
+    def run(self):
+        self.started = time.time()
+        try:
+            self._run_steps()
+        finally:
+            self.finished = time.time()
+
+    def _run_steps(self):
+        self._timed("initial load")
+        self._navigate("🎪 Live Interview")
+
+        self.app.button(key="start_dsa").click()
+        self._timed("start interview")
+
+        for turn in range(self.responses):
+            # Distinct text per session and turn so the response cache cannot short-circuit the LLM
+            answer = (
+                f"Session {self.index}, turn {turn}: I would use a hash map from value to index, "
+                f"scanning once for O(n) time and O(n) space, and check edge cases like duplicates."
+            )
+            self.app.text_area(key="interview_response").input(answer)
+            self._timed("type response")
+            self.app.button(key="submit_response").click()
+            self._timed("submit response")
+
+        self.app.button(key="get_feedback").click()
+        self._timed("get feedback")
+        self.app.button(key="end_interview").click()
+        self._timed("end interview")
+
+        self._navigate("🏠 Dashboard")
+
+
+def warm_up_worker(responses: int, timeout: float):
+    """Process initializer: one untimed session so imports and first-use caches are in place"""
+    try:
+        SimulatedSession(-1, responses, timeout).run()
+    except Exception:
+        # The timed sessions report the same failure
+        pass
+
+
+# A script that renders only the server-side interview timer, standing in for one timed fragment rerun
+TIMER_SCRIPT = """
+from datetime import datetime
+
+import streamlit as st
+
+from app_pages.live_interview import show_server_interview_timer
+
+if 'interview_timer' not in st.session_state:
+    st.session_state.interview_timer = datetime.now()
+show_server_interview_timer()
+"""
+
+
+def measure_timer_rerun(timeout: float, runs: int = 20) -> float:
+    """Median seconds one server-side timer rerun keeps a script thread busy"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_string(TIMER_SCRIPT, default_timeout=timeout)
+    app.run()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        app.run()
+        samples.append(time.perf_counter() - start)
+    return percentile(samples, 50)
+
+
+def drive_session(index: int, responses: int, timeout: float) -> Dict[str, Any]:
+    """Run one timed session in a worker process; memory is what the session adds while alive"""
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    session = SimulatedSession(index, responses, timeout)
+    failure = None
+    try:
+        session.run()
+    except Exception as e:
+        failure = str(e)
+    memory_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        'timings': session.timings,
+        'started': session.started,
+        'finished': session.finished,
+        'memory_bytes': memory_after - memory_before,
+        'failure': failure,
+    }
+
+
+def run_load_test(sessions: int, concurrency: int, responses: int, timeout: float) -> Dict[str, Any]:
+    """Run the simulated sessions and return the metrics report"""
+    # Spawned workers start without the parent's imports and with the same cwd, environment and sys.path
+    context = multiprocessing.get_context('spawn')
+    # AppTest replaces sys.modules['__main__'] with the app script, so workers must find these by module name
+    harness = importlib.import_module(os.path.splitext(os.path.basename(__file__))[0])
+    with ProcessPoolExecutor(max_workers=concurrency, mp_context=context,
+                             initializer=harness.warm_up_worker, initargs=(responses, timeout)) as pool:
+        results = list(pool.map(harness.drive_session, range(sessions), [responses] * sessions, [timeout] * sessions))
+        timer_tick = float(os.getenv('INTERVIEW_TIMER_TICK', '0'))
+        timer_seconds = pool.submit(harness.measure_timer_rerun, timeout).result() if timer_tick else 0.0
+
+    failures = [result['failure'] for result in results if result['failure']]
+    # From the first timed rerun to the last, so worker start-up and warm-up are left out
+    wall_seconds = max(result['finished'] for result in results) - min(result['started'] for result in results)
+    memory_per_session = sum(result['memory_bytes'] for result in results) / max(sessions, 1)
+
+    all_samples = [seconds for result in results for _, seconds in result['timings']]
+    script_seconds = sum(all_samples)
+    by_step: Dict[str, List[float]] = {}
+    for result in results:
+        for step, seconds in result['timings']:
+            by_step.setdefault(step, []).append(seconds)
+
+    return {
+        'config': {
+            'sessions': sessions,
+            'concurrency': concurrency,
+            'responses_per_session': responses,
+            'llm_latency_ms': float(os.getenv('LOCAL_LLM_LATENCY_MS', '800')),
+            'timer_tick_seconds': timer_tick,
+        },
+        'overall': dict(
+            summarize(all_samples),
+            reruns_per_second=round(len(all_samples) / wall_seconds, 2) if wall_seconds else 0.0,
+            sessions_per_minute=round(sessions / wall_seconds * 60, 2) if wall_seconds else 0.0,
+            wall_seconds=round(wall_seconds, 2),
+            script_seconds_per_session=round(script_seconds / max(sessions, 1), 3),
+            thread_occupancy=round(script_seconds / (wall_seconds * concurrency), 3) if wall_seconds else 0.0,
+            memory_per_session_kb=round(memory_per_session / 1024, 1),
+            timer_reruns_per_minute=round(60 / timer_tick, 2) if timer_tick else 0.0,
+            timer_ms_per_rerun=round(timer_seconds * 1000, 2),
+            # Share of one script thread each candidate in a live interview keeps busy with timer reruns alone
+            timer_occupancy_per_candidate=round(timer_seconds / timer_tick, 4) if timer_tick else 0.0,
+        ),
+        'steps': {step: summarize(samples) for step, samples in by_step.items()},
+        'failures': failures,
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """List metrics that got worse than the baseline by more than tolerance"""
+    regressions = []
+    for metric in LOWER_IS_BETTER:
+        old, new = baseline['overall'].get(metric), report['overall'].get(metric)
+        if old and new is not None and new > old * (1 + tolerance):
+            regressions.append(f"overall {metric}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    old, new = baseline['overall'].get('reruns_per_second'), report['overall'].get('reruns_per_second')
+    if old and new is not None and new < old * (1 - tolerance):
+        regressions.append(f"overall reruns_per_second: {old} -> {new} ({(new / old - 1) * 100:.0f}%)")
+    for step, stats in report['steps'].items():
+        old = baseline.get('steps', {}).get(step, {}).get('p95_ms')
+        if old and stats['p95_ms'] > old * (1 + tolerance):
+            regressions.append(f"{step} p95_ms: {old} -> {stats['p95_ms']} (+{(stats['p95_ms'] / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    overall = report['overall']
+    print(f"Sessions: {report['config']['sessions']}  Concurrency: {report['config']['concurrency']}  "
+          f"Wall: {overall['wall_seconds']}s")
+    print(f"Rerun latency  p50 {overall['p50_ms']} ms  p95 {overall['p95_ms']} ms  p99 {overall['p99_ms']} ms")
+    print(f"Throughput     {overall['reruns_per_second']} reruns/s  {overall['sessions_per_minute']} sessions/min")
+    print(f"Occupancy      {overall['script_seconds_per_session']} script s per session  "
+          f"{overall['thread_occupancy']:.0%} of {report['config']['concurrency']} workers busy")
+    print(f"Memory         {overall['memory_per_session_kb']} KB per session")
+    if report['config']['timer_tick_seconds']:
+        print(f"Timer          {overall['timer_reruns_per_minute']} server reruns/min per live candidate  "
+              f"{overall['timer_ms_per_rerun']} ms each  {overall['timer_occupancy_per_candidate']:.1%} of a script thread")
+    else:
+        print("Timer          counted in the browser, no server reruns")
+    print()
+    print(f"{'step':<28}{'n':>6}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    for step, stats in report['steps'].items():
+        print(f"{step:<28}{stats['count']:>6}{stats['p50_ms']:>12}{stats['p95_ms']:>12}{stats['p99_ms']:>12}")
+    for failure in report['failures']:
+        print(f"FAILED: {failure}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="simulated candidates")
+    parser.add_argument("--concurrency", type=int, default=4, help="sessions driven at the same time (one process each)")
+    parser.add_argument("--responses", type=int, default=2, help="interview responses per session")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per rerun")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression before failing (0.2 = 20%%)")
+    parser.add_argument("--output", help="also write the full report to this JSON file")
+    parser.add_argument("--timer-tick", type=float,
+                        help="render the interview timer on the server every N seconds (INTERVIEW_TIMER_TICK)")
+    args = parser.parse_args(argv)
+
+    if args.timer_tick is not None:
+        os.environ['INTERVIEW_TIMER_TICK'] = str(args.timer_tick)
+
+    # Offline stand-in LLM and throwaway storage, unless the caller chose otherwise
+    os.environ.setdefault('LLM_BACKEND', 'local')
+    os.environ.setdefault('LLM_REQUESTS_PER_MINUTE', '100000')
+    workdir = tempfile.mkdtemp(prefix="load_test_")
+    # Streamlit reads .streamlit/config.toml from the working directory
+    shutil.copytree(os.path.join(REPO_ROOT, ".streamlit"), os.path.join(workdir, ".streamlit"))
+    os.environ.setdefault('RESPONSE_CACHE_PATH', '')
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+
+    try:
+        report = run_load_test(args.sessions, args.concurrency, args.responses, args.timeout)
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 1 if report['failures'] else 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('config') != report['config']:
+            print("\nBaseline was recorded with a different configuration; comparison may be misleading.")
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+
+    return 1 if report['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Micro-benchmark: rendering a long transcript's chat cards on every rerun.
+
+Compares the per-message f-strings the pages used to build on each rerun
+with message_cards.render_cards, which joins precompiled per-role prefixes
+and suffixes: build time and the bytes of markup sent per rerun. It also
+times a per-window memo keyed on message identity and content, warm, on a
+rerun with one new message: that is the memoization message_cards does not
+do, because checking a card costs about as much as building it.
+
+    python benchmarks/message_render_benchmark.py --messages 5000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from message_cards import CARD_TEMPLATES, render_cards  # noqa: E402
+
+
+def build_transcript(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    words = ["hash", "map", "latency", "partition", "customer", "ownership", "queue", "index", "trade-off"]
+    start = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        {
+            'role': 'user' if index % 2 == 0 else 'interviewer',
+            'content': " ".join(rng.choice(words) for _ in range(rng.randint(20, 120))),
+            'timestamp': start + timedelta(seconds=30 * index)
+        }
+        for index in range(count)
+    ]
+
+
+def legacy_render(messages: List[Dict[str, Any]]) -> List[str]:
+    """The f-string cards the transcript built for every message on every rerun"""
+    cards = []
+    for msg in messages:
+        if msg['role'] == 'user':
+            cards.append(f"""
+                <div class="chat-message user-message">
+                    <strong>You:</strong> {msg['content']}
+                </div>
+                """)
+        elif msg['role'] == 'interviewer':
+            cards.append(f"""
+                <div class="chat-message interviewer-message">
+                    <strong>🎯 Interviewer:</strong> {msg['content']}
+                </div>
+                """)
+    return cards
+
+
+class IdentityMemo:
+    """Cards of the last window rendered, reused while a message and its content are the same objects"""
+
+    def __init__(self, roles):
+        self.affixes = {role: (CARD_TEMPLATES[role].prefix, CARD_TEMPLATES[role].suffix) for role in roles}
+        self.cards: Dict[int, tuple] = {}
+
+    def render(self, messages: List[Dict[str, Any]]) -> List[str]:
+        previous, current, rendered = self.cards, {}, []
+        for message in messages:
+            affixes = self.affixes.get(message.get('role'))
+            if affixes is None:
+                continue
+            content = message.get('content', '')
+            entry = previous.get(id(message))
+            if entry is not None and entry[0] is message and entry[1] is content:
+                card = entry[2]
+            else:
+                card = f"{affixes[0]}{content}{affixes[1]}"
+            current[id(message)] = (message, content, card)
+            rendered.append(card)
+        self.cards = current
+        return rendered
+
+
+def time_it(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of fn in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000, help="messages in the transcript")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per measurement (median reported)")
+    args = parser.parse_args(argv)
+
+    messages = build_transcript(args.messages)
+    roles = ('user', 'interviewer')
+
+    legacy_ms = time_it(lambda: legacy_render(messages), args.repeat)
+    template_ms = time_it(lambda: render_cards(messages, roles), args.repeat)
+
+    memo = IdentityMemo(roles)
+    memo.render(messages)
+    new_message = {'role': 'user', 'content': "One more answer", 'timestamp': datetime.now()}
+
+    def memo_rerun():
+        messages.append(new_message)
+        memo.render(messages)
+        messages.pop()
+
+    memo_ms = time_it(memo_rerun, args.repeat)
+
+    print(f"Transcript of {args.messages} messages")
+    print(f"{'per rerun':<34}{'ms':>10}")
+    print(f"{'f-string cards (before)':<34}{legacy_ms:>10.2f}")
+    print(f"{'precompiled templates':<34}{template_ms:>10.2f}")
+    print(f"{'identity memo, one new message':<34}{memo_ms:>10.2f}")
+    legacy_kb = sum(len(card.encode('utf-8')) for card in legacy_render(messages)) / 1024
+    template_kb = sum(len(card.encode('utf-8')) for card in render_cards(messages, roles)) / 1024
+    print(f"Markup per rerun: {legacy_kb:.0f} KB before, {template_kb:.0f} KB with templates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Snapshot and startup benchmark: legacy user_data.json vs the user store.
+
+Builds a synthetic heavy user (scores, interview sessions, chat messages)
+and times:
+
+- snapshot codec: json.dump with default=str plus the string-to-datetime
+  parsing reloaded data needed, against snapshot_format.encode_snapshot /
+  decode_snapshot, which returns datetimes directly (msgpack when
+  installed, tagged JSON otherwise)
+- session startup: loading the whole legacy user_data.json against
+  UserStore.load reading the snapshot and the latest page of messages
+
+    python benchmarks/snapshot_benchmark.py --scores 50000 --sessions 5000 --messages 20000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import snapshot_format  # noqa: E402
+from score_stats import build_score_stats  # noqa: E402
+from user_store import UserStore  # noqa: E402
+
+# Messages the app loads at startup (CHAT_PAGE_SIZE default)
+STARTUP_PAGE = 50
+
+
+def build_messages(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 9, 0, 0)
+    return [
+        {
+            'role': 'user' if index % 2 == 0 else 'assistant',
+            'content': " ".join(rng.choice(["hash", "map", "tree", "graph", "cache", "latency", "customer"])
+                                for _ in range(40)),
+            'timestamp': start + timedelta(minutes=3 * index)
+        }
+        for index in range(count)
+    ]
+
+
+def build_state(scores: int, sessions: int, seed: int = 0) -> Dict[str, Any]:
+    """Synthetic snapshot state for a long-time user"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 9, 0, 0)
+    performance_data = {'dsa_scores': [], 'system_design_scores': [], 'behavioral_scores': [], 'timestamps': []}
+    keys = ('dsa_scores', 'system_design_scores', 'behavioral_scores')
+    for index in range(scores):
+        performance_data[keys[index % 3]].append(rng.randint(3, 10))
+        performance_data['timestamps'].append(start + timedelta(minutes=17 * index, microseconds=rng.randint(0, 999999)))
+    interview_sessions = [
+        {
+            'timestamp': start + timedelta(hours=5 * index, microseconds=rng.randint(0, 999999)),
+            'type': rng.choice(["DSA", "System Design", "Behavioral"]),
+            'duration': rng.randint(10, 60),
+            'questions_asked': rng.randint(1, 6),
+            'responses': rng.randint(1, 12)
+        }
+        for index in range(sessions)
+    ]
+    return {
+        'chat_history': [],
+        'interview_sessions': interview_sessions,
+        'performance_data': performance_data,
+        'score_stats': build_score_stats(performance_data),
+        'session_count': sessions,
+        'total_study_time': 0
+    }
+
+
+def legacy_save(state: Dict[str, Any]) -> bytes:
+    return json.dumps({'state': state, 'through_segment': 0}, default=str).encode('utf-8')
+
+
+def legacy_load(payload: bytes) -> Dict[str, Any]:
+    snapshot = json.loads(payload.decode('utf-8'))
+    # What every page had to redo on reloaded data before timestamps were typed
+    snapshot_format.upgrade_state(snapshot['state'])
+    return snapshot
+
+
+def binary_save(state: Dict[str, Any]) -> bytes:
+    return snapshot_format.encode_snapshot({'state': state, 'through_segment': 0})
+
+
+def binary_load(payload: bytes) -> Dict[str, Any]:
+    return snapshot_format.decode_snapshot(payload)[0]
+
+
+def time_it(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of fn in milliseconds"""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scores", type=int, default=50000, help="recorded scores")
+    parser.add_argument("--sessions", type=int, default=5000, help="live interview sessions")
+    parser.add_argument("--messages", type=int, default=20000, help="chat messages")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median reported)")
+    args = parser.parse_args(argv)
+
+    state = build_state(args.scores, args.sessions)
+    legacy_payload = legacy_save(state)
+    binary_payload = binary_save(state)
+
+    # The binary round trip must hand back real datetimes
+    restored = binary_load(binary_payload)['state']
+    if not isinstance(restored['interview_sessions'][0]['timestamp'], datetime):
+        print("Binary snapshot did not restore datetimes")
+        return 1
+
+    codec = "msgpack" if snapshot_format.msgpack is not None else "json (install msgpack for the binary codec)"
+    results = {
+        'legacy': (time_it(lambda: legacy_save(state), args.repeat),
+                   time_it(lambda: legacy_load(legacy_payload), args.repeat), len(legacy_payload)),
+        'binary': (time_it(lambda: binary_save(state), args.repeat),
+                   time_it(lambda: binary_load(binary_payload), args.repeat), len(binary_payload)),
+    }
+
+    print(f"Scores: {args.scores}  Sessions: {args.sessions}  Snapshot codec: {codec}")
+    print(f"{'format':<10}{'save ms':>12}{'load ms':>12}{'size KB':>12}")
+    for name, (save_ms, load_ms, size) in results.items():
+        print(f"{name:<10}{save_ms:>12.1f}{load_ms:>12.1f}{size / 1024:>12.1f}")
+    speedup = results['legacy'][1] / results['binary'][1] if results['binary'][1] else 0.0
+    print(f"Snapshot load speedup: {speedup:.1f}x")
+
+    # Session startup with chat history included
+    full_state = dict(state, chat_history=build_messages(args.messages))
+    workdir = tempfile.mkdtemp(prefix="snapshot_benchmark_")
+    try:
+        legacy_path = os.path.join(workdir, "user_data.json")
+        with open(legacy_path, 'w') as f:
+            json.dump(full_state, f, default=str)
+        store = UserStore(os.path.join(workdir, "store"))
+        store.import_state(json.loads(json.dumps(full_state, default=str)))
+
+        def legacy_startup():
+            with open(legacy_path) as f:
+                snapshot_format.upgrade_state(json.load(f))
+
+        legacy_ms = time_it(legacy_startup, args.repeat)
+        store_ms = time_it(lambda: store.load(message_limit=STARTUP_PAGE), args.repeat)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nSession startup with {args.messages} messages")
+    print(f"{'legacy user_data.json':<28}{legacy_ms:>10.1f} ms")
+    print(f"{'user store (latest page)':<28}{store_ms:>10.1f} ms")
+    print(f"Startup speedup: {legacy_ms / store_ms if store_ms else 0.0:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Cold-start benchmark: import time and time to first render per page.
+
+Every measurement runs in a fresh interpreter so nothing is already in
+sys.modules:
+
+- import time of the heavy dependencies, the shared app modules and each
+  page module in app_pages/
+- time to first render: Streamlit's AppTest runs main_app.py with the
+  navigation already set to one page, so the first script run imports and
+  renders only that page (local stand-in LLM backend, throwaway storage)
+
+    python benchmarks/startup_benchmark.py --repeat 3
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app_pages import PAGES  # noqa: E402
+
+DEPENDENCIES = ["streamlit", "pandas", "plotly.express", "google.generativeai"]
+APP_MODULES = ["app_state", "ai_assistant"]
+
+IMPORT_SNIPPET = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+RENDER_SNIPPET = """
+import sys, time
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app!r}, default_timeout=120)
+app.session_state["nav_page"] = {page!r}
+start = time.perf_counter()
+app.run()
+elapsed = time.perf_counter() - start
+if app.exception:
+    raise SystemExit(app.exception[0].message)
+print(elapsed)
+"""
+
+
+def run_snippet(code: str, workdir: str) -> float:
+    env = dict(os.environ)
+    env.setdefault('LLM_BACKEND', 'local')
+    env.setdefault('RESPONSE_CACHE_PATH', '')
+    env.setdefault('USER_DATA_DIR', os.path.join(workdir, "user_data"))
+    result = subprocess.run([sys.executable, "-c", code], cwd=workdir, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def median_ms(code: str, workdir: str, repeat: int) -> float:
+    samples: List[float] = [run_snippet(code, workdir) for _ in range(repeat)]
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement (median reported)")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="startup_benchmark_")
+    try:
+        results = {'imports_ms': {}, 'first_render_ms': {}, 'errors': {}}
+
+        modules = DEPENDENCIES + APP_MODULES + [f"app_pages.{module}" for module, _ in PAGES.values()]
+        print(f"{'import':<32}{'ms':>10}")
+        for module in modules:
+            try:
+                ms = median_ms(IMPORT_SNIPPET.format(root=REPO_ROOT, module=module), workdir, args.repeat)
+            except RuntimeError as e:
+                results['errors'][module] = str(e)
+                print(f"{module:<32}{'n/a':>10}  ({e})")
+                continue
+            results['imports_ms'][module] = round(ms, 1)
+            print(f"{module:<32}{ms:>10.1f}")
+
+        print(f"\n{'first render':<32}{'ms':>10}")
+        app_path = os.path.join(REPO_ROOT, "main_app.py")
+        for label in PAGES:
+            try:
+                ms = median_ms(RENDER_SNIPPET.format(root=REPO_ROOT, app=app_path, page=label), workdir, args.repeat)
+            except RuntimeError as e:
+                results['errors'][label] = str(e)
+                print(f"{label:<32}{'n/a':>10}  ({e})")
+                continue
+            results['first_render_ms'][label] = round(ms, 1)
+            print(f"{label:<32}{ms:>10.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 1 if results['errors'] and not results['first_render_ms'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
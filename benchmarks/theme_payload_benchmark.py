@@ -0,0 +1,52 @@
+"""Bytes sent per rerun for the global stylesheet: inline <style> vs static asset.
+
+Before, every rerun sent the whole stylesheet to the browser inside an
+st.markdown element. Now each rerun sends the small loader from theme.py and
+the stylesheet itself is fetched once per browser session. This counts the
+payload for a simulated browser session of N reruns, raw and deflated (as
+with websocket compression).
+
+    python benchmarks/theme_payload_benchmark.py --reruns 200
+"""
+import argparse
+import os
+import sys
+import zlib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import theme  # noqa: E402
+
+
+def sizes(payload: str):
+    data = payload.encode('utf-8')
+    return len(data), len(zlib.compress(data, 6))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reruns", type=int, default=200, help="reruns in one browser session")
+    args = parser.parse_args(argv)
+
+    css, version = theme.load_theme()
+    inline_raw, inline_deflated = sizes(theme.inline_style(css))
+    loader_raw, loader_deflated = sizes(theme.loader_html(theme.theme_url(version), version))
+    asset_raw, asset_deflated = sizes(css)
+
+    before = (inline_raw * args.reruns, inline_deflated * args.reruns)
+    after = (loader_raw * args.reruns + asset_raw, loader_deflated * args.reruns + asset_deflated)
+
+    print(f"Stylesheet {asset_raw} bytes, version {version}")
+    print(f"{'per rerun':<28}{'raw B':>10}{'deflated B':>12}")
+    print(f"{'inline <style> (before)':<28}{inline_raw:>10}{inline_deflated:>12}")
+    print(f"{'loader (after)':<28}{loader_raw:>10}{loader_deflated:>12}")
+    print(f"\nSession of {args.reruns} reruns (after includes one fetch of the asset)")
+    print(f"{'before':<28}{before[0] / 1024:>9.1f}K{before[1] / 1024:>11.1f}K")
+    print(f"{'after':<28}{after[0] / 1024:>9.1f}K{after[1] / 1024:>11.1f}K")
+    print(f"Reduction: {1 - after[0] / before[0]:.0%} raw, {1 - after[1] / before[1]:.0%} deflated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
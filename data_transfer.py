@@ -0,0 +1,394 @@
+"""Streaming export and import of practice history.
+
+Every record (chat message, score, interview session) becomes one flat row
+with the columns in EXPORT_COLUMNS, so a single file can hold a whole
+cohort. Rows flow through generators: export reads one storage segment at a
+time and import appends in chunks, so millions of records move in constant
+memory. CSV and JSONL are built in; Parquet needs the optional pyarrow
+package.
+
+Import skips records a profile already holds (same type, timestamp and
+content), so importing a file twice does not double it. The fingerprints of
+stored records go into a temporary on-disk SQLite index rather than memory,
+so that check stays constant-memory too.
+
+    python data_transfer.py export --profile alice --output alice.csv
+    python data_transfer.py export --all-profiles --output cohort.parquet
+    python data_transfer.py import --input cohort.jsonl
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime
+from typing import IO, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from score_stats import iter_recorded_scores
+from snapshot_format import parse_timestamp
+from user_store import DEFAULT_USER_ID, SCORE_KEYS, get_user_store, list_user_ids, validate_user_id
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:  # Optional: Parquet support only
+    pyarrow = None
+    parquet = None
+
+EXPORT_COLUMNS = [
+    'profile', 'record_type', 'timestamp',
+    'role', 'content', 'interview_id',
+    'category', 'score',
+    'session_type', 'duration', 'questions_asked', 'responses'
+]
+FORMATS = ('csv', 'jsonl', 'parquet')
+CHUNK_SIZE = 5000
+INTEGER_COLUMNS = ('score', 'duration', 'questions_asked', 'responses')
+SCORE_CATEGORIES = frozenset(SCORE_KEYS.values())
+
+
+def format_for_path(path: str) -> str:
+    """Export format implied by a file extension"""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    fmt = {'jsonl': 'jsonl', 'ndjson': 'jsonl', 'csv': 'csv', 'parquet': 'parquet', 'pq': 'parquet'}.get(extension)
+    if fmt is None:
+        raise ValueError(f"Can't tell the format of '{path}'; use one of: {', '.join(FORMATS)}")
+    return fmt
+
+
+def require_parquet():
+    if pyarrow is None:
+        raise RuntimeError("Parquet support needs pyarrow; install it with 'pip install pyarrow'")
+
+
+# Export
+
+def iter_scores(state: Dict[str, Any]) -> Iterator[Tuple[str, int, Optional[datetime]]]:
+    """(score key, score, timestamp) for every recorded score, in recorded order
+
+    Timestamps are matched to categories through state['score_keys']; scores
+    recorded before those were kept have no timestamp.
+    """
+    return iter_recorded_scores(state['performance_data'], state.get('score_keys', []))
+
+
+def iter_profile_rows(user_id: str) -> Iterator[Dict[str, Any]]:
+    """Export rows for one profile: messages, then scores, then sessions"""
+    store = get_user_store(user_id)
+    for message in store.iter_messages():
+        yield {
+            'profile': user_id,
+            'record_type': 'message',
+            'timestamp': message.get('timestamp'),
+            'role': message.get('role'),
+            'content': message.get('content'),
+            'interview_id': message.get('interview_id')
+        }
+
+    state = store.load(message_limit=0)
+    for key, score, timestamp in iter_scores(state):
+        yield {'profile': user_id, 'record_type': 'score', 'timestamp': timestamp, 'category': key, 'score': score}
+
+    for file_name in store.archive.session_files():
+        for session in store.archive.read_file(file_name):
+            yield session_row(user_id, session)
+    for session in state['interview_sessions']:
+        yield session_row(user_id, session)
+
+
+def session_row(user_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'profile': user_id,
+        'record_type': 'session',
+        'timestamp': session.get('timestamp'),
+        'session_type': session.get('type'),
+        'duration': session.get('duration'),
+        'questions_asked': session.get('questions_asked'),
+        'responses': session.get('responses')
+    }
+
+
+def iter_export_rows(user_ids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for user_id in user_ids:
+        yield from iter_profile_rows(user_id)
+
+
+def _text_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], fmt: str, output: IO, chunk_size: int = CHUNK_SIZE) -> int:
+    """Stream rows to an open file (text for csv/jsonl, binary for parquet); returns the row count"""
+    count = 0
+    if fmt == 'jsonl':
+        for row in rows:
+            output.write(json.dumps({column: _text_value(row.get(column)) for column in EXPORT_COLUMNS}) + "\n")
+            count += 1
+    elif fmt == 'csv':
+        writer = csv.DictWriter(output, fieldnames=EXPORT_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({column: _text_value(row.get(column)) for column in EXPORT_COLUMNS})
+            count += 1
+    elif fmt == 'parquet':
+        require_parquet()
+        schema = pyarrow.schema(
+            [(column, pyarrow.timestamp('us')) if column == 'timestamp'
+             else (column, pyarrow.int64()) if column in INTEGER_COLUMNS
+             else (column, pyarrow.string())
+             for column in EXPORT_COLUMNS]
+        )
+        with parquet.ParquetWriter(output, schema) as writer:
+            for chunk in iter_chunks(rows, chunk_size):
+                columns = {column: [row.get(column) for row in chunk] for column in EXPORT_COLUMNS}
+                writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+                count += len(chunk)
+    else:
+        raise ValueError(f"Unknown export format '{fmt}'")
+    return count
+
+
+def export_to_path(user_ids: Iterable[str], path: str, fmt: Optional[str] = None) -> int:
+    fmt = fmt or format_for_path(path)
+    if fmt == 'parquet':
+        require_parquet()
+        with open(path, 'wb') as output:
+            return write_rows(iter_export_rows(user_ids), fmt, output)
+    with open(path, 'w', encoding='utf-8', newline='') as output:
+        return write_rows(iter_export_rows(user_ids), fmt, output)
+
+
+def export_to_file(user_ids: Iterable[str], fmt: str) -> BinaryIO:
+    """Export into an anonymous temporary file, returned rewound and open for reading
+
+    The file has no name on disk, so it is removed as soon as it is closed.
+    """
+    if fmt == 'parquet':
+        require_parquet()
+    output = tempfile.TemporaryFile()
+    if fmt == 'parquet':
+        write_rows(iter_export_rows(user_ids), fmt, output)
+    else:
+        text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+        write_rows(iter_export_rows(user_ids), fmt, text)
+        text.flush()
+        text.detach()
+    output.flush()
+    output.seek(0)
+    # A plain reader over the same descriptor, which st.download_button accepts
+    return io.BufferedReader(output.detach())
+
+
+# Import
+
+def iter_chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_rows(source: IO, fmt: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Stream rows from an open binary file in any export format"""
+    if fmt == 'jsonl':
+        for line in io.TextIOWrapper(source, encoding='utf-8'):
+            if line.strip():
+                yield json.loads(line)
+    elif fmt == 'csv':
+        yield from csv.DictReader(io.TextIOWrapper(source, encoding='utf-8', newline=''))
+    elif fmt == 'parquet':
+        require_parquet()
+        for batch in parquet.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"Unknown import format '{fmt}'")
+
+
+def _blank(value: Any) -> bool:
+    return value is None or value == ""
+
+
+def _integer(value: Any) -> Optional[int]:
+    return None if _blank(value) else int(float(value))
+
+
+def row_to_record(row: Dict[str, Any]) -> Tuple[str, Any]:
+    """(kind, data) store record for an export row; raises ValueError for bad rows"""
+    record_type = row.get('record_type')
+    timestamp = None if _blank(row.get('timestamp')) else parse_timestamp(row['timestamp'])
+    if record_type == 'message':
+        data = {'role': row.get('role') or 'user', 'content': row.get('content') or "", 'timestamp': timestamp}
+        if not _blank(row.get('interview_id')):
+            data['interview_id'] = str(row['interview_id'])
+        return 'message', data
+    if record_type == 'score':
+        if _blank(row.get('category')) or _blank(row.get('score')):
+            raise ValueError("score rows need category and score")
+        # The category is a performance_data key, so anything else would corrupt it
+        if row['category'] not in SCORE_CATEGORIES:
+            raise ValueError(f"Unknown score category '{row['category']}'")
+        return 'score', {'key': row['category'], 'score': _integer(row['score']), 'timestamp': timestamp}
+    if record_type == 'session':
+        return 'session', {
+            'timestamp': timestamp,
+            'type': row.get('session_type'),
+            'duration': _integer(row.get('duration')),
+            'questions_asked': _integer(row.get('questions_asked')),
+            'responses': _integer(row.get('responses'))
+        }
+    raise ValueError(f"Unknown record_type '{record_type}'")
+
+
+def record_fingerprint(kind: str, data: Dict[str, Any]) -> bytes:
+    """Digest of what identifies a record: its type, timestamp and content"""
+    timestamp = data.get('timestamp')
+    if kind == 'message':
+        fields = [data.get('role'), data.get('content'), data.get('interview_id')]
+    elif kind == 'score':
+        fields = [data.get('key'), data.get('score')]
+    else:
+        fields = [data.get('type'), data.get('duration'), data.get('questions_asked'), data.get('responses')]
+    payload = json.dumps([kind, _text_value(timestamp)] + fields, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).digest()
+
+
+def iter_fingerprints(user_id: str) -> Iterator[bytes]:
+    """Fingerprint of every record already stored for a profile"""
+    for row in iter_profile_rows(user_id):
+        try:
+            yield record_fingerprint(*row_to_record(row))
+        except (ValueError, TypeError):
+            continue
+
+
+class FingerprintIndex:
+    """Fingerprints of the records stored in each imported profile, with counts
+
+    The index is a private temporary SQLite database, which lives on disk and
+    is deleted on close, so memory stays flat however large the profiles are.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.profiles = 0
+        self._db = sqlite3.connect("")
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute("CREATE TABLE loaded (profile TEXT PRIMARY KEY)")
+        self._db.execute(
+            "CREATE TABLE stored (profile TEXT, fingerprint BLOB, remaining INTEGER, "
+            "PRIMARY KEY (profile, fingerprint)) WITHOUT ROWID"
+        )
+
+    def load_profile(self, user_id: str):
+        """Index a profile's stored records, once, before any rows are imported into it"""
+        if self._db.execute("SELECT 1 FROM loaded WHERE profile = ?", (user_id,)).fetchone():
+            return
+        with self._db:
+            self._db.execute("INSERT INTO loaded VALUES (?)", (user_id,))
+            for chunk in iter_chunks(iter_fingerprints(user_id), self.chunk_size):
+                self._db.executemany(
+                    "INSERT INTO stored VALUES (?, ?, 1) "
+                    "ON CONFLICT (profile, fingerprint) DO UPDATE SET remaining = remaining + 1",
+                    [(user_id, fingerprint) for fingerprint in chunk]
+                )
+        self.profiles += 1
+
+    def take(self, user_id: str, fingerprint: bytes) -> bool:
+        """Match one stored copy of a record; False once none are left"""
+        cursor = self._db.execute(
+            "UPDATE stored SET remaining = remaining - 1 WHERE profile = ? AND fingerprint = ? AND remaining > 0",
+            (user_id, fingerprint)
+        )
+        return cursor.rowcount > 0
+
+    def close(self):
+        self._db.close()
+
+
+def import_rows(rows: Iterable[Dict[str, Any]], default_profile: str = DEFAULT_USER_ID,
+                chunk_size: int = CHUNK_SIZE) -> Dict[str, int]:
+    """Append rows to each row's profile in chunks
+
+    Returns imported, skipped (invalid), duplicates (already stored) and
+    profiles counts. A stored record matches one imported row, so records
+    that legitimately repeat in a file are still imported.
+    """
+    counts = {'imported': 0, 'skipped': 0, 'duplicates': 0, 'profiles': 0}
+    index = FingerprintIndex(chunk_size)
+    try:
+        for chunk in iter_chunks(rows, chunk_size):
+            by_profile: Dict[str, List[Tuple[str, Any]]] = {}
+            for row in chunk:
+                try:
+                    profile = validate_user_id(str(row.get('profile') or default_profile))
+                    kind, data = row_to_record(row)
+                except (ValueError, TypeError):
+                    counts['skipped'] += 1
+                    continue
+                if profile not in by_profile:
+                    index.load_profile(profile)
+                if index.take(profile, record_fingerprint(kind, data)):
+                    counts['duplicates'] += 1
+                    continue
+                by_profile.setdefault(profile, []).append((kind, data))
+            for profile, records in by_profile.items():
+                get_user_store(profile).append(records)
+                counts['imported'] += len(records)
+        counts['profiles'] = index.profiles
+    finally:
+        index.close()
+    return counts
+
+
+def import_from_path(path: str, fmt: Optional[str] = None, default_profile: str = DEFAULT_USER_ID) -> Dict[str, int]:
+    fmt = fmt or format_for_path(path)
+    with open(path, 'rb') as source:
+        return import_rows(read_rows(source, fmt), default_profile)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="write practice history to a file")
+    export_parser.add_argument("--profile", action="append", help="profile to export (repeatable)")
+    export_parser.add_argument("--all-profiles", action="store_true", help="export every profile")
+    export_parser.add_argument("--output", required=True, help="output file (.csv, .jsonl or .parquet)")
+    export_parser.add_argument("--format", choices=FORMATS, help="override the format implied by --output")
+
+    import_parser = commands.add_parser(
+        "import", help="append practice history from a file (records already stored are skipped)"
+    )
+    import_parser.add_argument("--input", required=True, help="input file (.csv, .jsonl or .parquet)")
+    import_parser.add_argument("--format", choices=FORMATS, help="override the format implied by --input")
+    import_parser.add_argument("--profile", default=DEFAULT_USER_ID, help="profile for rows without one")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "export":
+            user_ids = list_user_ids() if args.all_profiles else (args.profile or [DEFAULT_USER_ID])
+            count = export_to_path(user_ids, args.output, args.format)
+            print(f"Exported {count} records from {len(user_ids)} profile(s) to {args.output}")
+        else:
+            counts = import_from_path(args.input, args.format, args.profile)
+            print(f"Imported {counts['imported']} records into {counts['profiles']} profile(s); "
+                  f"skipped {counts['duplicates']} already stored and {counts['skipped']} invalid rows")
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
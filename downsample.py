@@ -0,0 +1,110 @@
+"""Server-side downsampling for long chart series.
+
+Months of practice leave thousands of scores and sessions, and sending every
+point to Plotly makes each figure larger and slower to draw. Line series are
+reduced with Largest-Triangle-Three-Buckets (LTTB), which keeps the points
+that shape the trend (peaks, dips, first and last). Bar series are
+aggregated into time buckets (hour, day, week or month, the finest that
+fits). Both cap the points per chart; pages re-run them on a narrower date
+range to show detail.
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+BUCKET_UNITS = ('hour', 'day', 'week', 'month')
+
+
+def _as_number(value: Any, fallback: float) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return fallback
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """Indices of the points LTTB keeps (all of them when there are no more than threshold)"""
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    # Bucket width for everything between the fixed first and last points
+    every = (count - 2) / (threshold - 2)
+    selected = [0]
+    anchor = 0
+    for bucket in range(threshold - 2):
+        # Average of the next bucket is the third corner of the triangle
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, count)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        anchor_x, anchor_y = xs[anchor], ys[anchor]
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((anchor_x - avg_x) * (ys[index] - anchor_y) - (anchor_x - xs[index]) * (avg_y - anchor_y))
+            if area > best_area:
+                best, best_area = index, area
+        selected.append(best)
+        anchor = best
+    selected.append(count - 1)
+    return selected
+
+
+def lttb(points: Sequence[Tuple[Any, float]], threshold: int) -> List[Tuple[Any, float]]:
+    """At most threshold (x, y) points preserving the series' shape; x may be datetimes"""
+    ordered = sorted(points, key=lambda point: _as_number(point[0], 0.0)) \
+        if any(isinstance(point[0], datetime) for point in points) else list(points)
+    xs = [_as_number(x, float(index)) for index, (x, _) in enumerate(ordered)]
+    ys = [float(y) for _, y in ordered]
+    return [ordered[index] for index in lttb_indices(xs, ys, threshold)]
+
+
+def bucket_start(timestamp: datetime, unit: str) -> datetime:
+    if unit == 'hour':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    day = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit == 'day':
+        return day
+    if unit == 'week':
+        return day - timedelta(days=day.weekday())
+    if unit == 'month':
+        return day.replace(day=1)
+    raise ValueError(f"Unknown bucket unit '{unit}'")
+
+
+def choose_bucket_unit(timestamps: Iterable[datetime], max_buckets: int) -> str:
+    """Finest unit giving at most max_buckets distinct buckets (month if none does)"""
+    timestamps = list(timestamps)
+    for unit in BUCKET_UNITS:
+        if len({bucket_start(timestamp, unit) for timestamp in timestamps}) <= max_buckets:
+            return unit
+    return BUCKET_UNITS[-1]
+
+
+def aggregate_buckets(rows: Iterable[Dict[str, Any]], time_key: str, group_key: str, value_key: str,
+                      max_buckets: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Mean of value_key per (time bucket, group) when rows have more than max_buckets timestamps
+
+    Returns the rows to plot (with a 'count' per bucket) and the bucket unit,
+    or the dated rows unchanged and None when they already fit.
+    """
+    rows = [row for row in rows if isinstance(row.get(time_key), datetime)]
+    if len(rows) <= max_buckets:
+        return rows, None
+
+    unit = choose_bucket_unit((row[time_key] for row in rows), max_buckets)
+    totals: Dict[Tuple[datetime, Any], List[float]] = {}
+    for row in rows:
+        key = (bucket_start(row[time_key], unit), row.get(group_key))
+        total = totals.setdefault(key, [0.0, 0])
+        total[0] += row.get(value_key) or 0
+        total[1] += 1
+    aggregated = [
+        {time_key: start, group_key: group, value_key: total / count, 'count': count}
+        for (start, group), (total, count) in sorted(totals.items(), key=lambda item: (item[0][0], str(item[0][1])))
+    ]
+    return aggregated, unit
@@ -0,0 +1,137 @@
+"""Prompt building and parsing for single and batched answer evaluation.
+
+A batch packs several (question, answer, category) items into one request and
+asks for one delimited section per item, so N submissions cost one model
+round-trip instead of N.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from prompt_builder import PROMPT_BUDGETS, estimate_tokens, fit_to_budget
+
+SCORE_PATTERN = re.compile(r'Score:\s*(\d+)')
+ITEM_HEADER_PATTERN = re.compile(r'^#{2,4}\s*Item\s+(\d+)\b.*$', re.MULTILINE | re.IGNORECASE)
+
+# Token budget per batched request and the most items packed into one
+BATCH_TOKEN_BUDGET = 1800
+MAX_BATCH_ITEMS = 8
+
+EVALUATION_TEMPLATE = """
+    Evaluate this {category} interview answer for Amazon SDE II position:
+    
+    Question: {question}
+    Answer: {answer}
+    
+    Provide evaluation in this format:
+    Score: X/10
+    Strengths: [list specific strengths]
+    Weaknesses: [list areas for improvement]
+    Suggestions: [actionable suggestions for improvement]
+    Amazon Focus: [how this aligns with Amazon's standards]
+    """
+
+BATCH_INSTRUCTIONS = """Evaluate each of the following {count} interview answers for an Amazon SDE II position.
+
+Respond with exactly one section per item, in order, using this format:
+### Item <number>
+Score: X/10
+Strengths: [list specific strengths]
+Weaknesses: [list areas for improvement]
+Suggestions: [actionable suggestions for improvement]
+Amazon Focus: [how this aligns with Amazon's standards]
+"""
+
+
+def parse_score(text: str) -> Optional[int]:
+    """Extract the X from 'Score: X/10', clamped to 0-10; None if absent"""
+    match = SCORE_PATTERN.search(text or "")
+    if not match:
+        return None
+    return max(0, min(10, int(match.group(1))))
+
+
+def build_evaluation_prompt(question: Any, answer: str, category: str,
+                            max_tokens: int = PROMPT_BUDGETS['evaluation']) -> str:
+    """Single-answer evaluation prompt within max_tokens
+
+    Only the answer is trimmed, so the question and the 'Score: X/10' format
+    instructions always reach the model.
+    """
+    fixed = EVALUATION_TEMPLATE.format(category=category, question=question, answer="")
+    return EVALUATION_TEMPLATE.format(category=category, question=question,
+                                      answer=fit_to_budget(answer, fixed, max_tokens))
+
+
+def fit_batch_item(item: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+    """item with its answer trimmed so the item alone fits max_tokens"""
+    fixed = format_batch_item(MAX_BATCH_ITEMS, dict(item, answer=""))
+    answer = fit_to_budget(item['answer'], fixed, max_tokens)
+    return item if answer == item['answer'] else dict(item, answer=answer)
+
+
+def format_batch_item(number: int, item: Dict[str, Any]) -> str:
+    """Render one (question, answer, category) item for a batch prompt"""
+    return (
+        f"### Item {number} ({item['category']})\n"
+        f"Question: {item['question']}\n"
+        f"Answer: {item['answer']}\n"
+    )
+
+
+def build_batch_prompt(items: List[Dict[str, Any]]) -> str:
+    """Build one evaluation prompt covering every item"""
+    parts = [BATCH_INSTRUCTIONS.format(count=len(items))]
+    for number, item in enumerate(items, start=1):
+        parts.append(format_batch_item(number, item))
+    return "\n".join(parts)
+
+
+def split_batches(items: List[Dict[str, Any]], max_tokens: int = BATCH_TOKEN_BUDGET,
+                  max_items: int = MAX_BATCH_ITEMS) -> List[List[Dict[str, Any]]]:
+    """Greedily group items so each batch prompt stays within max_tokens
+
+    An answer too long for a batch of its own is trimmed; the instructions
+    and every item header are always kept.
+    """
+    overhead = estimate_tokens(BATCH_INSTRUCTIONS)
+    batches, current, current_tokens = [], [], overhead
+    for item in items:
+        item = fit_batch_item(item, max_tokens - overhead)
+        cost = estimate_tokens(format_batch_item(len(current) + 1, item))
+        if current and (current_tokens + cost > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, current_tokens = [], overhead
+        current.append(item)
+        current_tokens += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(text: str, count: int) -> List[Dict[str, Any]]:
+    """Split a batch response into per-item results
+
+    Each result has 'score' (int or None), 'feedback' and 'error' (None when
+    the section was found and carried a score).
+    """
+    sections: Dict[int, str] = {}
+    headers = list(ITEM_HEADER_PATTERN.finditer(text or ""))
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        number = int(header.group(1))
+        # The first section for a number wins if the model repeats a header
+        sections.setdefault(number, text[header.end():end].strip())
+
+    results = []
+    for number in range(1, count + 1):
+        section = sections.get(number)
+        if section is None:
+            results.append({'score': None, 'feedback': "", 'error': f"No section for item {number} in the response"})
+            continue
+        score = parse_score(section)
+        results.append({
+            'score': score,
+            'feedback': section,
+            'error': None if score is not None else f"No 'Score: X/10' line for item {number}"
+        })
+    return results
@@ -0,0 +1,34 @@
+"""Crash-safe file writing helpers shared by the storage modules."""
+import os
+import tempfile
+
+
+def atomic_write_bytes(path: str, payload: bytes):
+    """Write to a temp file in the same directory, fsync it and rename it over path"""
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    fsync_directory(directory)
+
+
+def fsync_directory(directory: str):
+    """Make a rename or new file in directory durable (no-op where unsupported)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,77 @@
+"""Process-wide registry of configured Gemini model handles.
+
+Sessions and reruns share one GenerativeModel (and its transport) per
+(API key, model name) pair, and API key validation results are cached with a
+TTL so the sidebar "Test API Key" button does not fire a live request every
+time it is clicked.
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+VALIDATION_PROMPT = "Say 'Hello' if you can read this."
+
+_lock = threading.Lock()
+_models: Dict[Tuple[str, str], Any] = {}
+_validations: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+
+
+def _fingerprint(api_key: str) -> str:
+    """Hash the API key so raw keys are never used as registry keys"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def get_gemini_model(api_key: str, model_name: str) -> Any:
+    """Return the shared model handle for this key and model, creating it once"""
+    registry_key = (_fingerprint(api_key), model_name)
+    with _lock:
+        model = _models.get(registry_key)
+        if model is None:
+            import google.generativeai as genai
+            from google.generativeai import client as genai_client
+
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel(model_name)
+            # genai.configure is global; bind the transport now so a later
+            # configure() for another key does not redirect this handle
+            if getattr(model, '_client', None) is None and hasattr(model, '_client'):
+                model._client = genai_client.get_default_generative_client()
+            _models[registry_key] = model
+        return model
+
+
+def validate_api_key(api_key: str, model_name: str, probe: Callable[[Any], str]) -> dict:
+    """Check an API key with probe(model), reusing recent results
+
+    Successful checks are cached for GEMINI_KEY_VALIDATION_TTL seconds and
+    failures for GEMINI_KEY_FAILURE_TTL seconds, so a fixed key can be
+    re-tested soon after a failure.
+    """
+    registry_key = (_fingerprint(api_key), model_name)
+    now = time.time()
+    with _lock:
+        cached = _validations.get(registry_key)
+    if cached is not None and cached[0] > now:
+        return dict(cached[1], cached=True)
+
+    try:
+        result = {"success": True, "response": probe(get_gemini_model(api_key, model_name))}
+        ttl = float(os.getenv('GEMINI_KEY_VALIDATION_TTL', '3600'))
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+        ttl = float(os.getenv('GEMINI_KEY_FAILURE_TTL', '60'))
+        # Drop the handle so a corrected configuration gets a fresh one
+        with _lock:
+            _models.pop(registry_key, None)
+
+    with _lock:
+        _validations[registry_key] = (now + ttl, result)
+    return dict(result, cached=False)
+
+
+def registry_stats() -> Dict[str, int]:
+    """Return the number of shared model handles and cached validations"""
+    with _lock:
+        return {'models': len(_models), 'validations': len(_validations)}
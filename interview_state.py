@@ -0,0 +1,48 @@
+"""Live interview state machine.
+
+A live interview is always in one of five states:
+
+- idle: the candidate is reading the question or typing
+- recording: the simulated voice recording is on
+- awaiting_ai: a response was submitted and the interviewer's reply is streaming
+- reviewing: the reply is in and the candidate is reading it
+- ended: the interview is over and its summary is shown
+
+Starting an interview resets the state to idle.
+
+Widgets send events and the page renders whatever the current state calls
+for, so nothing has to pause the script thread to show an effect.
+"""
+from typing import Dict, Optional, Tuple
+
+IDLE = 'idle'
+RECORDING = 'recording'
+AWAITING_AI = 'awaiting_ai'
+REVIEWING = 'reviewing'
+ENDED = 'ended'
+STATES = (IDLE, RECORDING, AWAITING_AI, REVIEWING, ENDED)
+
+# (state, event) -> next state
+TRANSITIONS: Dict[Tuple[str, str], str] = {
+    (IDLE, 'start_recording'): RECORDING,
+    (IDLE, 'submit'): AWAITING_AI,
+    (IDLE, 'next_question'): IDLE,
+    (IDLE, 'end'): ENDED,
+    (RECORDING, 'stop_recording'): IDLE,
+    (RECORDING, 'submit'): AWAITING_AI,
+    (RECORDING, 'next_question'): IDLE,
+    (RECORDING, 'end'): ENDED,
+    (AWAITING_AI, 'ai_replied'): REVIEWING,
+    (AWAITING_AI, 'ai_failed'): IDLE,
+    (AWAITING_AI, 'end'): ENDED,
+    (REVIEWING, 'start_recording'): RECORDING,
+    (REVIEWING, 'submit'): AWAITING_AI,
+    (REVIEWING, 'next_question'): IDLE,
+    (REVIEWING, 'end'): ENDED,
+}
+
+
+def next_state(state: str, event: str) -> Optional[str]:
+    """State after event, or None if event does not apply in state"""
+    return TRANSITIONS.get((state, event))
+
@@ -0,0 +1,258 @@
+"""Pluggable LLM backends behind get_ai_response.
+
+Every backend exposes the small slice of the google.generativeai
+GenerativeModel interface the app uses: generate_content(prompt, stream=...)
+returning an object with .text (or an iterable of such chunks when
+streaming). GeminiBackend wraps the shared Gemini model handles, and
+LocalStandInBackend mimics Gemini offline with configurable latency,
+throughput, error and quota injection and deterministic output, so the full
+request path can be load-tested without spending real quota.
+
+Select a backend with LLM_BACKEND=gemini (default) or LLM_BACKEND=local.
+"""
+import hashlib
+import math
+import os
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from gemini_clients import VALIDATION_PROMPT, get_gemini_model, validate_api_key
+
+
+class LLMBackend(ABC):
+    """Interface shared by all text generation backends"""
+
+    name = "base"
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    @property
+    def cache_namespace(self) -> str:
+        """Model identifier used in response cache keys"""
+        return self.model_name
+
+    @abstractmethod
+    def generate_content(self, prompt: str, stream: bool = False) -> Any:
+        """Response with .text, or an iterator of such chunks when stream=True"""
+
+    def check(self, runner: Optional[Callable[..., Any]] = None) -> dict:
+        """Send a tiny request to verify the backend works
+
+        runner(fn, *args) lets callers route the probe through the request engine.
+        """
+        runner = runner or (lambda fn, *args: fn(*args))
+        try:
+            return {"success": True, "response": runner(self.generate_content, VALIDATION_PROMPT).text}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini through the shared, process-wide model handles"""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model_name: str):
+        super().__init__(model_name)
+        self._api_key = api_key
+        self._model = get_gemini_model(api_key, model_name)
+
+    def generate_content(self, prompt: str, stream: bool = False) -> Any:
+        return self._model.generate_content(prompt, stream=stream)
+
+    def check(self, runner: Optional[Callable[..., Any]] = None) -> dict:
+        """Validate the API key, reusing cached results (see gemini_clients.validate_api_key)"""
+        runner = runner or (lambda fn, *args: fn(*args))
+        return validate_api_key(
+            self._api_key,
+            self.model_name,
+            lambda model: runner(model.generate_content, VALIDATION_PROMPT).text
+        )
+
+
+class LocalText:
+    """Response or stream chunk with the .text attribute Gemini responses have"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+# Sentences the stand-in stitches together; chosen deterministically per prompt
+STAND_IN_SENTENCES = [
+    "Let's walk through the trade-offs of that approach.",
+    "What happens to your solution when the input grows by two orders of magnitude?",
+    "Can you describe the edge cases you would test first?",
+    "How would you measure whether this change actually helped the customer?",
+    "Tell me more about the data structure you chose and why.",
+    "Which part of the design would fail first under load?",
+    "Good structure so far; now quantify the result.",
+    "How would you explain this decision to a skeptical stakeholder?",
+    "What would you do differently with twice the time?",
+    "Consider caching, but be explicit about invalidation.",
+]
+
+ITEM_PATTERN = re.compile(r'^#{2,4}\s*Item\s+(\d+)\b', re.MULTILINE)
+
+
+class LocalStandInBackend(LLMBackend):
+    """Deterministic offline stand-in for Gemini with injectable latency and failures
+
+    Latency is time-to-first-token drawn from a 'fixed', 'uniform', 'normal'
+    or 'lognormal' distribution around latency_ms, followed by output at
+    tokens_per_second. error_rate and quota_rate inject the same kinds of
+    exceptions Gemini raises (503 and 429). Output text depends only on the
+    prompt; latency and failure draws come from a seeded generator.
+    """
+
+    name = "local"
+
+    def __init__(self, model_name: str = "gemini-1.5-pro", latency_ms: float = 800.0,
+                 latency_jitter_ms: float = 200.0, distribution: str = "lognormal",
+                 tokens_per_second: float = 60.0, response_tokens: int = 120,
+                 error_rate: float = 0.0, quota_rate: float = 0.0, seed: int = 0,
+                 chunk_tokens: int = 8):
+        super().__init__(model_name)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.distribution = distribution
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.error_rate = error_rate
+        self.quota_rate = quota_rate
+        self.chunk_tokens = chunk_tokens
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'errors': 0, 'quota_errors': 0, 'tokens': 0}
+
+    @property
+    def cache_namespace(self) -> str:
+        # Keep stand-in output out of the real model's cache entries
+        return f"local-stand-in/{self.model_name}"
+
+    def _draw_latency(self) -> float:
+        """Time to first token in seconds"""
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+        with self._lock:
+            if self.distribution == "fixed" or jitter <= 0:
+                value = mean
+            elif self.distribution == "uniform":
+                value = self._rng.uniform(mean - jitter, mean + jitter)
+            elif self.distribution == "normal":
+                value = self._rng.gauss(mean, jitter)
+            else:
+                # Lognormal with the requested mean and standard deviation
+                sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if mean > 0 else 0
+                mu = math.log(mean) - sigma ** 2 / 2 if mean > 0 else 0
+                value = self._rng.lognormvariate(mu, sigma)
+        return max(value, 0.0) / 1000.0
+
+    def _maybe_fail(self):
+        with self._lock:
+            self._counters['requests'] += 1
+            draw = self._rng.random()
+            if draw < self.quota_rate:
+                self._counters['quota_errors'] += 1
+                raise Exception("429 Resource has been exhausted (e.g. check quota).")
+            if draw < self.quota_rate + self.error_rate:
+                self._counters['errors'] += 1
+                raise Exception("503 The service is currently unavailable.")
+
+    def render_text(self, prompt: str) -> str:
+        """Deterministic reply for a prompt, shaped like the format it asks for"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+        items = sorted({int(number) for number in ITEM_PATTERN.findall(prompt)})
+
+        if "Score: X/10" in prompt and items:
+            sections = []
+            for number in items:
+                score = 4 + digest[number % len(digest)] % 7
+                sections.append(
+                    f"### Item {number}\nScore: {score}/10\n"
+                    f"Strengths: {STAND_IN_SENTENCES[digest[(number + 1) % len(digest)] % len(STAND_IN_SENTENCES)]}\n"
+                    f"Weaknesses: {STAND_IN_SENTENCES[digest[(number + 2) % len(digest)] % len(STAND_IN_SENTENCES)]}\n"
+                    f"Suggestions: Practice explaining complexity out loud.\n"
+                    f"Amazon Focus: Dive Deep and Deliver Results."
+                )
+            return "\n\n".join(sections)
+
+        words, index = [], 0
+        while len(words) < self.response_tokens:
+            words.extend(STAND_IN_SENTENCES[digest[index % len(digest)] % len(STAND_IN_SENTENCES)].split())
+            index += 1
+        text = " ".join(words[:self.response_tokens])
+        if "Score: X/10" in prompt:
+            text = f"Score: {4 + digest[0] % 7}/10\n{text}"
+        return text
+
+    def generate_content(self, prompt: str, stream: bool = False) -> Any:
+        self._maybe_fail()
+        text = self.render_text(prompt)
+        first_token_delay = self._draw_latency()
+        tokens = text.split(" ")
+        with self._lock:
+            self._counters['tokens'] += len(tokens)
+
+        if not stream:
+            time.sleep(first_token_delay + len(tokens) / self.tokens_per_second)
+            return LocalText(text)
+
+        def chunks() -> Iterator[LocalText]:
+            time.sleep(first_token_delay)
+            for start in range(0, len(tokens), self.chunk_tokens):
+                piece = tokens[start:start + self.chunk_tokens]
+                time.sleep(len(piece) / self.tokens_per_second)
+                yield LocalText((" " if start else "") + " ".join(piece))
+
+        return chunks()
+
+    def stats(self) -> Dict[str, int]:
+        """Return request, injected failure and token counters"""
+        with self._lock:
+            return dict(self._counters)
+
+    @classmethod
+    def from_env(cls, model_name: str) -> "LocalStandInBackend":
+        """Build a stand-in configured by LOCAL_LLM_* environment variables"""
+        return cls(
+            model_name=model_name,
+            latency_ms=float(os.getenv('LOCAL_LLM_LATENCY_MS', '800')),
+            latency_jitter_ms=float(os.getenv('LOCAL_LLM_JITTER_MS', '200')),
+            distribution=os.getenv('LOCAL_LLM_DISTRIBUTION', 'lognormal'),
+            tokens_per_second=float(os.getenv('LOCAL_LLM_TOKENS_PER_SECOND', '60')),
+            response_tokens=int(os.getenv('LOCAL_LLM_RESPONSE_TOKENS', '120')),
+            error_rate=float(os.getenv('LOCAL_LLM_ERROR_RATE', '0')),
+            quota_rate=float(os.getenv('LOCAL_LLM_QUOTA_RATE', '0')),
+            seed=int(os.getenv('LOCAL_LLM_SEED', '0'))
+        )
+
+
+_local_backend = None
+_local_backend_lock = threading.Lock()
+
+
+def selected_backend_name() -> str:
+    """Backend chosen by the LLM_BACKEND environment variable"""
+    return os.getenv('LLM_BACKEND', 'gemini').strip().lower()
+
+
+def get_local_backend(model_name: str) -> LocalStandInBackend:
+    """Return the process-wide local stand-in backend"""
+    global _local_backend
+    with _local_backend_lock:
+        if _local_backend is None:
+            _local_backend = LocalStandInBackend.from_env(model_name)
+        return _local_backend
+
+
+def create_backend(model_name: str, api_key: Optional[str] = None) -> LLMBackend:
+    """Return the configured backend; the Gemini backend needs an API key"""
+    if selected_backend_name() == "local":
+        return get_local_backend(model_name)
+    if not api_key:
+        raise ValueError("A Gemini API key is required for the gemini backend")
+    return GeminiBackend(api_key, model_name)
@@ -0,0 +1,256 @@
+"""Process-wide request engine for LLM calls.
+
+Every generate_content call goes through one bounded worker pool and a
+token-bucket rate limiter sized to the API quota. Transient and quota errors
+are retried with exponential backoff and jitter, and each request carries a
+deadline so bursts queue up instead of exhausting the shared key.
+"""
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Substrings of error messages worth retrying (quota, throttling, server hiccups)
+RETRYABLE_ERROR_MARKERS = (
+    "429", "quota", "resource has been exhausted", "resource_exhausted", "rate limit",
+    "500", "502", "503", "504", "unavailable", "internal error", "deadline", "timed out",
+    "timeout", "temporarily", "connection reset", "connection aborted"
+)
+
+
+class EngineError(Exception):
+    """Base class for request engine failures"""
+
+
+class EngineOverloaded(EngineError):
+    """Raised when the request queue is full"""
+
+
+class DeadlineExceeded(EngineError):
+    """Raised when a request does not finish before its deadline"""
+
+
+class _StreamBroken(Exception):
+    """Internal marker for a stream that failed after yielding output"""
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Return True for transient and quota errors that are worth retrying"""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in RETRYABLE_ERROR_MARKERS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute"""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_minute / 6.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Take one token, waiting until deadline (monotonic time); False if it passes"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate_per_second
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class LLMRequestEngine:
+    """Bounded worker pool with rate limiting, retries and per-request deadlines"""
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32, requests_per_minute: float = 60,
+                 burst: Optional[float] = None, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 16.0, default_timeout: float = 120.0):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.default_timeout = default_timeout
+
+        self._bucket = TokenBucket(requests_per_minute, burst)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-engine")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._lock = threading.Lock()
+        self._counters = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'retries': 0,
+            'rejected': 0,
+            'timeouts': 0,
+            'in_flight': 0
+        }
+
+    def _count(self, name: str, delta: int = 1):
+        with self._lock:
+            self._counters[name] += delta
+
+    def _backoff(self, attempt: int) -> float:
+        # Exponential backoff with "equal jitter": half fixed, half random
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _attempt(self, fn: Callable[[], Any], deadline: float, cancelled: threading.Event) -> Any:
+        """Run fn under the rate limiter, retrying retryable errors until the deadline"""
+        attempt = 0
+        while True:
+            if cancelled.is_set():
+                raise DeadlineExceeded("Request cancelled")
+            if not self._bucket.acquire(deadline):
+                raise DeadlineExceeded("Rate limit wait exceeded the request deadline")
+            try:
+                return fn()
+            except Exception as e:
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                if time.monotonic() + delay > deadline:
+                    raise
+                self._count('retries')
+                attempt += 1
+                if cancelled.wait(delay):
+                    raise DeadlineExceeded("Request cancelled")
+
+    def _submit(self, task: Callable[[], Any]):
+        if not self._slots.acquire(blocking=False):
+            self._count('rejected')
+            raise EngineOverloaded("Too many AI requests are queued right now")
+        self._count('submitted')
+
+        def run():
+            self._count('in_flight')
+            try:
+                return task()
+            finally:
+                self._count('in_flight', -1)
+                self._slots.release()
+
+        return self._executor.submit(run)
+
+    def call(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the pool and wait for its result"""
+        timeout = timeout if timeout is not None else self.default_timeout
+        deadline = time.monotonic() + timeout
+        cancelled = threading.Event()
+        future = self._submit(lambda: self._attempt(lambda: fn(*args, **kwargs), deadline, cancelled))
+        # Wait apart from result(): on 3.11+ concurrent.futures.TimeoutError is the
+        # builtin TimeoutError, so catching it there would also catch one fn raised
+        finished, _ = wait([future], timeout=max(0.0, deadline - time.monotonic()))
+        if not finished:
+            cancelled.set()
+            future.cancel()
+            self._count('timeouts')
+            raise DeadlineExceeded(f"AI request did not finish within {timeout:g}s")
+        try:
+            result = future.result()
+        except DeadlineExceeded:
+            self._count('timeouts')
+            raise
+        except Exception:
+            self._count('failed')
+            raise
+        self._count('completed')
+        return result
+
+    def stream(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Iterator[Any]:
+        """Run fn on the pool and yield the items of the iterable it returns
+
+        Retries only happen before the first item, so callers never see
+        duplicated output.
+        """
+        timeout = timeout if timeout is not None else self.default_timeout
+        deadline = time.monotonic() + timeout
+        cancelled = threading.Event()
+        items: "queue.Queue" = queue.Queue()
+        done = object()
+
+        def produce():
+            started = []
+
+            def open_and_pump():
+                try:
+                    for item in fn(*args, **kwargs):
+                        if cancelled.is_set():
+                            return
+                        started.append(True)
+                        items.put((None, item))
+                except Exception:
+                    if started:
+                        # Output already reached the caller, so the error is final
+                        raise _StreamBroken()
+                    raise
+
+            try:
+                self._attempt(open_and_pump, deadline, cancelled)
+            except _StreamBroken as e:
+                items.put((e.__context__, done))
+                return
+            except Exception as e:
+                items.put((e, done))
+                return
+            items.put((None, done))
+
+        self._submit(produce)
+        try:
+            while True:
+                try:
+                    error, item = items.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._count('timeouts')
+                    raise DeadlineExceeded(f"AI response did not finish within {timeout:g}s")
+                if item is done:
+                    if error is not None:
+                        self._count('timeouts' if isinstance(error, DeadlineExceeded) else 'failed')
+                        raise error
+                    self._count('completed')
+                    return
+                yield item
+        finally:
+            cancelled.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counters and pool configuration"""
+        with self._lock:
+            stats = dict(self._counters)
+        stats['max_workers'] = self.max_workers
+        stats['max_pending'] = self.max_pending
+        return stats
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_request_engine() -> LLMRequestEngine:
+    """Return the process-wide request engine, configured from the environment"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = LLMRequestEngine(
+                max_workers=int(os.getenv('LLM_MAX_CONCURRENCY', '4')),
+                max_pending=int(os.getenv('LLM_MAX_PENDING', '32')),
+                requests_per_minute=float(os.getenv('LLM_REQUESTS_PER_MINUTE', '60')),
+                max_retries=int(os.getenv('LLM_MAX_RETRIES', '3')),
+                default_timeout=float(os.getenv('LLM_REQUEST_TIMEOUT', '120'))
+            )
+        return _default_engine
@@ -0,0 +1,45 @@
+"""Chat card HTML for the coach chat and the live interview transcript.
+
+Card markup is split once per role into a fixed prefix and suffix, without
+the indentation the inline f-strings used to carry, and the pages join a
+whole window of cards into one st.markdown call instead of one per message.
+
+Rendered cards are deliberately not memoized. Building a card is one
+allocation and copy of its content, and checking a memo entry (message
+identity, role and content) costs as much: on a 5,000-message transcript a
+warm per-window memo takes 3.4 ms per rerun against 2.7 ms for building
+every card (benchmarks/message_render_benchmark.py), and visible windows of
+6 to 50 messages build in about 10 us. The templates trim the markup sent
+per rerun by about a tenth; they do not make building faster.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class CardTemplate:
+    """Precompiled markup for one kind of chat card"""
+
+    def __init__(self, css_class: str, speaker: str):
+        self.prefix = f'<div class="chat-message {css_class}">\n<strong>{speaker}:</strong> '
+        self.suffix = "\n</div>"
+
+    def render(self, content: str) -> str:
+        return self.prefix + content + self.suffix
+
+
+CARD_TEMPLATES: Dict[str, CardTemplate] = {
+    'user': CardTemplate("user-message", "You"),
+    'interviewer': CardTemplate("interviewer-message", "🎯 Interviewer"),
+    'assistant': CardTemplate("ai-message", "🤖 AI Coach"),
+}
+
+
+def render_cards(messages: Iterable[Dict[str, Any]], roles: Optional[Iterable[str]] = None) -> List[str]:
+    """Cards for messages in order, skipping roles not listed (or without a card)"""
+    parts = {role: (CARD_TEMPLATES[role].prefix, CARD_TEMPLATES[role].suffix)
+             for role in (roles if roles is not None else CARD_TEMPLATES) if role in CARD_TEMPLATES}
+    rendered = []
+    for message in messages:
+        affixes = parts.get(message.get('role'))
+        if affixes is not None:
+            rendered.append(f"{affixes[0]}{message.get('content', '')}{affixes[1]}")
+    return rendered
@@ -0,0 +1,154 @@
+"""Speculative background prefetching of predictable AI turns.
+
+While a candidate is typing, likely next requests (the next question's
+opening turn, fixed coaching prompts) are generated on a small background
+pool. Results are held until the UI takes them; anything cancelled or never
+used is counted as waste so the hit rate can be monitored.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class Prefetcher:
+    """Keyed background task runner with hit, cancel and waste accounting"""
+
+    def __init__(self, max_workers: int = 2, max_entries: int = 256, ttl_seconds: float = 900):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        # key -> (future, created); completed results stay here until taken
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._warming = set()
+        self._counters = {
+            'issued': 0,
+            'hits': 0,
+            'misses': 0,
+            'cancelled': 0,
+            'wasted': 0,
+            'failed': 0,
+            'warmed': 0
+        }
+
+    def _discard(self, key: str):
+        """Drop an entry, counting it as cancelled (still pending) or wasted (unused result)"""
+        future, _ = self._entries.pop(key)
+        if future.cancel():
+            self._counters['cancelled'] += 1
+        elif future.done() and future.exception() is None:
+            self._counters['wasted'] += 1
+        else:
+            # Running: let it finish but never hand out the result
+            self._counters['cancelled'] += 1
+
+    def _expire(self, now: float):
+        for key, (_, created) in list(self._entries.items()):
+            if now - created > self.ttl_seconds:
+                self._discard(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def prefetch(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Start fn in the background unless key is already pending or ready"""
+        with self._lock:
+            self._expire(time.time())
+            if key in self._entries:
+                return False
+            future = self._executor.submit(fn)
+            self._entries[key] = (future, time.time())
+            self._counters['issued'] += 1
+
+        def on_done(done: Future):
+            if not done.cancelled() and done.exception() is not None:
+                with self._lock:
+                    self._counters['failed'] += 1
+                    entry = self._entries.get(key)
+                    if entry is not None and entry[0] is done:
+                        del self._entries[key]
+
+        future.add_done_callback(on_done)
+        return True
+
+    def warm(self, key: str, fn: Callable[[], Any]) -> bool:
+        """Run fn for its side effects (e.g. filling a cache) without keeping the result"""
+        with self._lock:
+            if key in self._warming:
+                return False
+            self._warming.add(key)
+
+        def run():
+            try:
+                fn()
+                with self._lock:
+                    self._counters['warmed'] += 1
+            except Exception:
+                with self._lock:
+                    self._counters['failed'] += 1
+            finally:
+                with self._lock:
+                    self._warming.discard(key)
+
+        self._executor.submit(run)
+        return True
+
+    def take(self, key: str, wait: float = 0.0) -> Optional[Any]:
+        """Return and remove a finished result; None if it is missing, failed or not ready in time"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                self._counters['misses'] += 1
+            return None
+
+        future = entry[0]
+        if wait > 0 and not future.done():
+            try:
+                future.result(timeout=wait)
+            except Exception:
+                pass
+
+        with self._lock:
+            if not future.done() or future.cancelled() or future.exception() is not None:
+                self._counters['misses'] += 1
+                return None
+            if self._entries.get(key, (None,))[0] is future:
+                del self._entries[key]
+            self._counters['hits'] += 1
+            return future.result()
+
+    def cancel(self, prefix: str = "") -> int:
+        """Cancel and discard every entry whose key starts with prefix"""
+        with self._lock:
+            doomed = [key for key in self._entries if key.startswith(prefix)]
+            for key in doomed:
+                self._discard(key)
+            return len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return prefetch counters plus the hit rate over issued prefetches"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['pending'] = sum(1 for future, _ in self._entries.values() if not future.done())
+            stats['ready'] = len(self._entries) - stats['pending']
+        stats['hit_rate'] = stats['hits'] / stats['issued'] if stats['issued'] else 0.0
+        return stats
+
+
+_default_prefetcher = None
+_default_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher() -> Prefetcher:
+    """Return the process-wide prefetcher, configured from the environment"""
+    global _default_prefetcher
+    with _default_prefetcher_lock:
+        if _default_prefetcher is None:
+            _default_prefetcher = Prefetcher(
+                max_workers=int(os.getenv('PREFETCH_WORKERS', '2')),
+                ttl_seconds=float(os.getenv('PREFETCH_TTL', '900'))
+            )
+        return _default_prefetcher
@@ -0,0 +1,185 @@
+"""Token-budgeted prompt assembly for the interviewer, coach and feedback modes.
+
+Tokens are estimated locally (about four characters per token for English
+text), older interview turns are folded into a compact rolling summary, and
+only the question fields the interviewer actually needs are included.
+"""
+import re
+from typing import Any, Dict, List, Tuple
+
+# Input token budgets per mode (prompt + context, excluding the fixed persona text)
+PROMPT_BUDGETS = {
+    'interviewer': 1200,
+    'coach': 2000,
+    'feedback': 1200,
+    # Answer evaluations: only the candidate's answer is trimmed (see evaluation.py)
+    'evaluation': 3000,
+}
+
+# Over budget, context is shed down to MIN_CONTEXT_TOKENS before the prompt (the
+# user's own words) is cut, and the prompt always keeps MIN_PROMPT_TOKENS
+MIN_CONTEXT_TOKENS = 150
+MIN_PROMPT_TOKENS = 3000
+
+# Most recent interview messages sent verbatim; older ones are summarized
+RECENT_TURNS = 4
+SUMMARY_BUDGET = 300
+TURN_SUMMARY_CHARS = 160
+
+ROLE_LABELS = {
+    'user': 'Candidate',
+    'interviewer': 'Interviewer',
+    'assistant': 'Coach',
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough local token estimate (about four characters per token)"""
+    return (len(text or "") + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to roughly max_tokens, cutting at a word boundary"""
+    text = text or ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+    # Leave room for the ellipsis so the result stays within max_tokens
+    cut = text[:max_tokens * 4 - 2]
+    if " " in cut:
+        cut = cut[:cut.rfind(" ")]
+    return cut.rstrip() + " …"
+
+
+def fit_to_budget(text: str, fixed: str, max_tokens: int) -> str:
+    """Trim text so that fixed plus text stays within max_tokens; fixed is never cut"""
+    return truncate_to_tokens(text, max(max_tokens - estimate_tokens(fixed), 0))
+
+
+def question_brief(question: Dict[str, Any], category: str, follow_up_count: int = 0) -> str:
+    """Describe the current question with only the fields the interviewer needs"""
+    if not question:
+        return ""
+    lines = []
+    if category == "DSA":
+        lines.append(f"Coding question ({question.get('topic')}, {question.get('difficulty')}): {question.get('question')}")
+        if question.get('expected_approach'):
+            lines.append(f"Expected approach: {question['expected_approach']}")
+    elif category == "System Design":
+        lines.append(f"System design question: {question.get('question')}")
+        if question.get('focus_areas'):
+            lines.append(f"Focus areas: {', '.join(question['focus_areas'])}")
+    else:
+        lines.append(f"Behavioral question ({question.get('principle')}): {question.get('question')}")
+
+    follow_ups = question.get('follow_ups') or []
+    if follow_ups:
+        lines.append(f"Suggested next follow-up: {follow_ups[follow_up_count % len(follow_ups)]}")
+    return "\n".join(lines)
+
+
+def summarize_turn(message: Dict[str, Any], max_chars: int = TURN_SUMMARY_CHARS) -> str:
+    """One-line extractive summary of a chat message"""
+    content = " ".join(str(message.get('content', '')).split())
+    # Keep the first sentence, which usually carries the point of the turn
+    first_sentence = re.split(r"(?<=[.!?])\s", content, maxsplit=1)[0]
+    if len(first_sentence) > max_chars:
+        first_sentence = first_sentence[:max_chars].rsplit(" ", 1)[0] + " …"
+    return f"{ROLE_LABELS.get(message.get('role'), 'Note')}: {first_sentence}"
+
+
+def fold_history(turns: List[Dict[str, Any]], summary_state: Dict[str, Any],
+                 recent_turns: int = RECENT_TURNS) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Fold turns older than the recent window into the rolling summary
+
+    summary_state is {'lines': [...], 'covered': n} where covered counts the
+    leading turns already summarized. Returns the updated state and the
+    recent turns to send verbatim.
+    """
+    lines = list(summary_state.get('lines', []))
+    covered = summary_state.get('covered', 0)
+    keep_from = max(len(turns) - recent_turns, 0)
+
+    for message in turns[covered:keep_from]:
+        lines.append(summarize_turn(message))
+    covered = max(covered, keep_from)
+
+    # Keep the summary compact by dropping the oldest lines first
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > SUMMARY_BUDGET:
+        lines.pop(0)
+
+    return {'lines': lines, 'covered': covered}, turns[keep_from:]
+
+
+def build_interview_context(category: str, question: Dict[str, Any], follow_up_count: int,
+                            turns: List[Dict[str, Any]], summary_state: Dict[str, Any],
+                            budget: int = PROMPT_BUDGETS['interviewer']) -> Tuple[str, Dict[str, Any]]:
+    """Assemble the interviewer context within budget; returns (context, new summary state)
+
+    When the budget is tight, recent turns go first, then the summary, and
+    the question shrinks to its bare text.
+    """
+    summary_state, recent = fold_history(turns, summary_state)
+
+    header = "\n".join([
+        f"Interview Type: {category}",
+        question_brief(question, category, follow_up_count),
+        f"Follow-up Count: {follow_up_count}",
+    ])
+    if estimate_tokens(header) > budget and question:
+        header = f"Interview Type: {category}\nQuestion: {question.get('question')}"
+    sections = [header]
+    if summary_state['lines']:
+        summary = "Earlier in this interview:\n" + "\n".join(summary_state['lines'])
+        if estimate_tokens(header + "\n\n" + summary) <= budget:
+            sections.append(summary)
+
+    # Add recent turns newest-first until the budget is spent, then restore order
+    remaining = budget - estimate_tokens("\n\n".join(sections))
+    recent_lines = []
+    for message in reversed(recent):
+        line = f"{ROLE_LABELS.get(message.get('role'), 'Note')}: {message.get('content', '')}"
+        cost = estimate_tokens(line)
+        if cost > remaining:
+            if remaining > 20:
+                recent_lines.append(truncate_to_tokens(line, remaining))
+            break
+        recent_lines.append(line)
+        remaining -= cost
+    if recent_lines:
+        sections.append("Recent turns:\n" + "\n".join(reversed(recent_lines)))
+
+    return truncate_to_tokens("\n\n".join(sections), budget), summary_state
+
+
+def build_feedback_context(responses: List[str], summary_lines: List[str],
+                           budget: int = PROMPT_BUDGETS['feedback']) -> str:
+    """Assemble the Get Feedback context from the summary and recent candidate answers"""
+    sections = []
+    if summary_lines:
+        sections.append("Earlier in this interview:\n" + "\n".join(summary_lines))
+    remaining = budget - estimate_tokens("\n\n".join(sections))
+    if responses:
+        # Split what is left evenly so one long answer cannot crowd out the rest
+        per_response = max(remaining // len(responses), 20)
+        sections.append("Recent responses:\n" + "\n".join(
+            f"- {truncate_to_tokens(response, per_response)}" for response in responses
+        ))
+    return truncate_to_tokens("\n\n".join(sections), budget)
+
+
+def enforce_budget(prompt: str, context: str, mode: str) -> Tuple[str, str]:
+    """Trim context first, then the prompt, so together they fit the mode's budget
+
+    The prompt is never cut below MIN_PROMPT_TOKENS, so a long answer can
+    overrun the budget rather than reach the model truncated.
+    """
+    budget = PROMPT_BUDGETS.get(mode, PROMPT_BUDGETS['coach'])
+    prompt_tokens = estimate_tokens(prompt)
+    context_tokens = estimate_tokens(context)
+    if prompt_tokens + context_tokens <= budget:
+        return prompt, context
+    context = truncate_to_tokens(context, max(budget - prompt_tokens, min(context_tokens, MIN_CONTEXT_TOKENS)))
+    prompt = truncate_to_tokens(prompt, max(budget - estimate_tokens(context), MIN_PROMPT_TOKENS))
+    return prompt, context
@@ -0,0 +1,173 @@
+"""Interview question banks and fixed coach prompts."""
+
+# Amazon Leadership Principles
+LEADERSHIP_PRINCIPLES = [
+    "Customer Obsession", "Ownership", "Invent and Simplify", "Are Right, A Lot",
+    "Learn and Be Curious", "Hire and Develop the Best", "Insist on the Highest Standards",
+    "Think Big", "Bias for Action", "Frugality", "Earn Trust", "Dive Deep",
+    "Have Backbone; Disagree and Commit", "Deliver Results", "Strive to be Earth's Best Employer",
+    "Success and Scale Bring Broad Responsibility"
+]
+
+# Enhanced Question banks with follow-up questions
+DSA_QUESTIONS = [
+    {
+        "id": 1,
+        "difficulty": "Medium",
+        "topic": "Arrays",
+        "question": "Given an array of integers, find two numbers such that they add up to a specific target number. Return indices of the two numbers.",
+        "hints": ["Think about using a hash map", "What's the time complexity?"],
+        "expected_approach": "Hash map for O(n) solution",
+        "follow_ups": [
+            "What if the array is sorted? Can you optimize further?",
+            "How would you handle duplicate numbers?",
+            "What if we need to find three numbers instead of two?",
+            "Can you implement this without using extra space?"
+        ]
+    },
+    {
+        "id": 2,
+        "difficulty": "Hard",
+        "topic": "Dynamic Programming",
+        "question": "Given a string s, find the longest palindromic substring in s. You may assume that the maximum length of s is 1000.",
+        "hints": ["Consider expand around centers", "Think about Manacher's algorithm"],
+        "expected_approach": "Expand around centers or dynamic programming",
+        "follow_ups": [
+            "Can you optimize the space complexity?",
+            "How would you handle very large strings?",
+            "What if we need to count all palindromic substrings?",
+            "Explain the difference between your approach and Manacher's algorithm."
+        ]
+    },
+    {
+        "id": 3,
+        "difficulty": "Medium",
+        "topic": "Trees",
+        "question": "Given a binary tree, determine if it is a valid binary search tree (BST).",
+        "hints": ["In-order traversal should be sorted", "Think about bounds"],
+        "expected_approach": "In-order traversal or bounds checking",
+        "follow_ups": [
+            "How would you handle duplicate values?",
+            "Can you do this without extra space?",
+            "What if the tree is very large and doesn't fit in memory?",
+            "How would you modify this for a k-ary tree?"
+        ]
+    },
+    {
+        "id": 4,
+        "difficulty": "Medium",
+        "topic": "Graphs",
+        "question": "Given a 2D grid representing a map where 1s are land and 0s are water, count the number of islands.",
+        "hints": ["Use DFS or BFS", "Mark visited cells"],
+        "expected_approach": "DFS/BFS with visited tracking",
+        "follow_ups": [
+            "How would you handle a very large grid?",
+            "What if the grid is dynamic and changes over time?",
+            "Can you solve this with Union-Find?",
+            "How would you find the largest island?"
+        ]
+    }
+]
+
+SYSTEM_DESIGN_QUESTIONS = [
+    {
+        "id": 1,
+        "question": "Design a URL shortening service like bit.ly",
+        "focus_areas": ["Scalability", "Database design", "Caching", "Load balancing"],
+        "key_components": ["URL encoding", "Database schema", "Cache layer", "Analytics"],
+        "follow_ups": [
+            "How would you handle 10x more traffic?",
+            "What about custom URLs?",
+            "How would you implement analytics and click tracking?",
+            "What if we need to support different geographical regions?",
+            "How would you prevent spam and malicious URLs?"
+        ]
+    },
+    {
+        "id": 2,
+        "question": "Design a chat system like WhatsApp",
+        "focus_areas": ["Real-time messaging", "Message delivery", "Scalability", "Security"],
+        "key_components": ["WebSocket connections", "Message queuing", "Database design", "Push notifications"],
+        "follow_ups": [
+            "How would you implement group chats with 1000+ members?",
+            "What about end-to-end encryption?",
+            "How would you handle offline users and message delivery?",
+            "What about file sharing and media messages?",
+            "How would you implement message sync across multiple devices?"
+        ]
+    },
+    {
+        "id": 3,
+        "question": "Design a video streaming service like YouTube",
+        "focus_areas": ["Video processing", "CDN", "Scalability", "Storage"],
+        "key_components": ["Video encoding", "Metadata storage", "Recommendation engine", "Analytics"],
+        "follow_ups": [
+            "How would you handle live streaming?",
+            "What about video recommendations?",
+            "How would you optimize for mobile vs desktop?",
+            "What about content moderation at scale?",
+            "How would you handle viral videos that get millions of views?"
+        ]
+    }
+]
+
+BEHAVIORAL_QUESTIONS = [
+    {
+        "principle": "Customer Obsession",
+        "question": "Tell me about a time when you had to make a decision between what was best for the customer and what was best for the business.",
+        "follow_ups": [
+            "How did you measure the actual impact on customers?",
+            "What was the business team's reaction to your decision?",
+            "Would you make the same decision again? Why or why not?",
+            "How did this experience influence your future decision-making?",
+            "What metrics did you use to validate your choice?"
+        ]
+    },
+    {
+        "principle": "Ownership",
+        "question": "Describe a situation where you took ownership of a problem that wasn't necessarily your responsibility.",
+        "follow_ups": [
+            "How did you convince others to support your initiative?",
+            "What obstacles did you face and how did you overcome them?",
+            "How did you ensure this problem wouldn't happen again?",
+            "What did you learn about cross-team collaboration?",
+            "How do you balance taking ownership with respecting boundaries?"
+        ]
+    },
+    {
+        "principle": "Dive Deep",
+        "question": "Tell me about a time when you had to dig deep into data or details to solve a complex problem.",
+        "follow_ups": [
+            "What tools and techniques did you use for analysis?",
+            "How did you know when you had enough information?",
+            "What was the most surprising thing you discovered?",
+            "How did you communicate your findings to stakeholders?",
+            "What would you do differently if faced with a similar problem?"
+        ]
+    }
+] 
+
+QUESTION_BANKS = {
+    "DSA": DSA_QUESTIONS,
+    "System Design": SYSTEM_DESIGN_QUESTIONS,
+    "Behavioral": BEHAVIORAL_QUESTIONS
+}
+
+# Live interview round labels and the question category each one uses
+ROUND_CATEGORIES = {
+    "DSA Coding Round": "DSA",
+    "System Design Round": "System Design",
+    "Behavioral Round": "Behavioral"
+}
+
+# Fixed AI coach prompts, also warmed in the response cache while candidates answer
+COACH_CONTEXT = "Amazon SDE II interview preparation. User preparing for interview."
+
+COACH_SUGGESTIONS = [
+    "How should I approach system design interviews?",
+    "What are the key Amazon Leadership Principles for SDE II?",
+    "Help me practice the Two Sum problem with follow-ups",
+    "How can I improve my behavioral interview responses?",
+    "What's the best way to handle coding interview pressure?",
+    "Give me a Customer Obsession behavioral question"
+]
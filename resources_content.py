@@ -0,0 +1,90 @@
+"""Precompiled content for the Resources page (content/resources.json).
+
+The Resources page is static text: links, study plans, leadership principles
+and tips. It used to rebuild those dicts and format its markdown on every
+visit and rerun. The text now lives in content/resources.json and is compiled
+once into render-ready tabs, where each block is one finished markdown string
+ready for st.markdown. The compiled tabs are cached per process and compiled
+again only when the file changes (mtime and size), so a rerun costs one
+os.stat.
+"""
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+RESOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content", "resources.json")
+
+
+class Block(NamedTuple):
+    """One render call: kind is 'subheader', 'markdown', 'columns' or 'expander'
+
+    body is the markdown (a tuple with one string per column for 'columns');
+    title is the expander label.
+    """
+    kind: str
+    body: Any
+    title: str = ""
+
+
+class Tab(NamedTuple):
+    title: str
+    blocks: Tuple[Block, ...]
+
+
+class ResourcesContent(NamedTuple):
+    header: str
+    tabs: Dict[str, Tab]
+
+
+_cached: Optional[Tuple[Tuple[int, int], ResourcesContent]] = None
+
+
+def _join(lines: List[str]) -> str:
+    return "\n".join(lines)
+
+
+def _compile_block(block: Dict[str, Any]) -> List[Block]:
+    kind = block['type']
+    if kind == 'subheader':
+        return [Block('subheader', block['text'])]
+    if kind == 'markdown':
+        return [Block('markdown', _join(block['lines']))]
+    if kind == 'columns':
+        return [Block('columns', tuple(_join(column) for column in block['columns']))]
+    if kind == 'definitions':
+        return [Block('markdown', "\n\n".join(f"**{term}:** {text}" for term, text in block['items'].items()))]
+    if kind == 'expanders':
+        bullet = block.get('bullet', "• ")
+        compiled = []
+        for item in block['items']:
+            # Blank lines between entries keep one paragraph per line, as separate st.write calls did
+            if 'sections' in item:
+                parts = []
+                for section, entries in item['sections'].items():
+                    parts.append(f"**{section}:**")
+                    parts.extend(bullet + entry for entry in entries)
+            else:
+                parts = [bullet + entry for entry in item['tips']]
+            compiled.append(Block('expander', "\n\n".join(parts), item['title']))
+        return compiled
+    raise ValueError(f"Unknown resources block type '{kind}'")
+
+
+def compile_content(data: Dict[str, Any]) -> ResourcesContent:
+    """Render-ready tabs (by title, in file order) from the parsed content file"""
+    tabs = {}
+    for tab in data['tabs']:
+        blocks = tuple(compiled for block in tab['blocks'] for compiled in _compile_block(block))
+        tabs[tab['title']] = Tab(tab['title'], blocks)
+    return ResourcesContent(data['header'], tabs)
+
+
+def load_resources(path: str = RESOURCES_PATH) -> ResourcesContent:
+    """Compiled Resources content, compiled again only when the file changes"""
+    global _cached
+    stat = os.stat(path)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+    if _cached is None or _cached[0] != file_version:
+        with open(path, 'r', encoding='utf-8') as f:
+            _cached = (file_version, compile_content(json.load(f)))
+    return _cached[1]
@@ -0,0 +1,245 @@
+"""Two-tier cache for AI responses.
+
+An in-memory LRU sits in front of an on-disk SQLite tier, so repeated prompts
+are answered without an API round-trip and the cache survives restarts.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Writes between recounts of the disk tier's running totals (other processes may share the file)
+DISK_TOTALS_RESYNC_WRITES = 1000
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace so trivially different prompts share a key"""
+    return " ".join((text or "").split())
+
+
+def make_cache_key(prompt: str, context: str, is_interviewer: bool, model_name: str,
+                   mode: Optional[str] = None) -> str:
+    """Build a stable cache key for one AI request"""
+    parts = [
+        normalize_prompt(prompt),
+        normalize_prompt(context),
+        bool(is_interviewer),
+        model_name
+    ]
+    # Only non-default modes are part of the key, so existing entries stay valid
+    if mode:
+        parts.append(mode)
+    payload = json.dumps(parts)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU + SQLite cache with TTL and size-based eviction"""
+
+    def __init__(self, path: Optional[str] = None, max_memory_entries: int = 256,
+                 max_disk_entries: int = 5000, max_disk_bytes: int = 50 * 1024 * 1024,
+                 ttl_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+            'expired': 0
+        }
+
+        self._db = None
+        # Running row count and byte total of the disk tier, so writes need not scan the table
+        self._disk_count = 0
+        self._disk_bytes = 0
+        self._writes_since_resync = 0
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses(created)")
+            self._db.commit()
+            self._resync_disk_totals()
+
+    def _resync_disk_totals(self):
+        self._disk_count, self._disk_bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._writes_since_resync = 0
+
+    def _is_expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created > self.ttl_seconds
+
+    def _remember(self, key: str, value: str, created: float):
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created = entry
+                if not self._is_expired(created, now):
+                    self._memory.move_to_end(key)
+                    self._counters['memory_hits'] += 1
+                    return value
+                del self._memory[key]
+                self._counters['expired'] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created = row
+                    if not self._is_expired(created, now):
+                        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                        self._db.commit()
+                        self._remember(key, value, created)
+                        self._counters['disk_hits'] += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._disk_count -= 1
+                    self._disk_bytes -= len(value.encode("utf-8"))
+                    self._counters['expired'] += 1
+
+            self._counters['misses'] += 1
+            return None
+
+    def has(self, key: str) -> bool:
+        """Return True if a fresh entry exists, without touching counters or recency"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._is_expired(entry[1], now):
+                return True
+            if self._db is None:
+                return False
+            row = self._db.execute("SELECT created FROM responses WHERE key = ?", (key,)).fetchone()
+            return row is not None and not self._is_expired(row[0], now)
+
+    def set(self, key: str, value: str):
+        """Store a response in both tiers and enforce the size limits"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self._counters['writes'] += 1
+            if self._db is None:
+                return
+            size = len(value.encode("utf-8"))
+            replaced = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                (key, value, now, now, size)
+            )
+            if replaced is None:
+                self._disk_count += 1
+                self._disk_bytes += size
+            else:
+                self._disk_bytes += size - replaced[0]
+            self._writes_since_resync += 1
+            if self._writes_since_resync >= DISK_TOTALS_RESYNC_WRITES:
+                self._resync_disk_totals()
+            self._evict_disk(now)
+            self._db.commit()
+
+    def _within_disk_limits(self) -> bool:
+        return self._disk_count <= self.max_disk_entries and self._disk_bytes <= self.max_disk_bytes
+
+    def _evict_disk(self, now: float):
+        # Both queries walk an index and touch only the rows they remove
+        if self.ttl_seconds > 0:
+            cutoff = now - self.ttl_seconds
+            expired, expired_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses WHERE created < ?", (cutoff,)
+            ).fetchone()
+            if expired:
+                self._db.execute("DELETE FROM responses WHERE created < ?", (cutoff,))
+                self._disk_count -= expired
+                self._disk_bytes -= expired_bytes
+                self._counters['expired'] += expired
+
+        if self._within_disk_limits():
+            return
+
+        # Drop least recently used rows until both limits are satisfied
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            if self._within_disk_limits():
+                break
+            doomed.append((key,))
+            self._disk_count -= 1
+            self._disk_bytes -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._counters['evictions'] += len(doomed)
+
+    def clear(self):
+        """Remove every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+                self._disk_count = self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current tier sizes"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+            stats['disk_entries'] = 0
+            if self._db is not None:
+                stats['disk_entries'] = self._disk_count
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, configured from the environment"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv('RESPONSE_CACHE_PATH', os.path.join('.cache', 'ai_responses.sqlite3'))
+            _default_cache = ResponseCache(
+                path=path or None,
+                max_memory_entries=int(os.getenv('RESPONSE_CACHE_MEMORY_ENTRIES', '256')),
+                max_disk_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '5000')),
+                max_disk_bytes=int(float(os.getenv('RESPONSE_CACHE_MAX_MB', '50')) * 1024 * 1024),
+                ttl_seconds=float(os.getenv('RESPONSE_CACHE_TTL', str(7 * 24 * 3600)))
+            )
+        return _default_cache
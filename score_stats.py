@@ -0,0 +1,116 @@
+"""Incrementally maintained score statistics.
+
+Each category (and 'overall') keeps a small JSON-friendly dict of running
+aggregates that is updated in O(1) as scores are recorded and saved with the
+rest of the user's data, so pages read averages, extremes, trends and
+streaks without rescanning the score history.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+# Weight of the newest score in the exponentially weighted moving average
+EWMA_ALPHA = 0.3
+# Scores kept for the "recent" window
+WINDOW_SIZE = 10
+# Scores at or above this count towards a streak
+STREAK_THRESHOLD = 7
+
+OVERALL = 'overall'
+
+
+def empty_stats() -> Dict[str, Any]:
+    """Aggregates for a category with no scores"""
+    return {
+        'count': 0,
+        'sum': 0,
+        'min': None,
+        'max': None,
+        'ewma': None,
+        'window': [],
+        'streak': 0,
+        'best_streak': 0,
+        'last': None
+    }
+
+
+def add_score(stats: Dict[str, Any], score: float):
+    """Fold one score into a category's aggregates in place"""
+    stats['count'] += 1
+    stats['sum'] += score
+    stats['min'] = score if stats['min'] is None else min(stats['min'], score)
+    stats['max'] = score if stats['max'] is None else max(stats['max'], score)
+    stats['ewma'] = score if stats['ewma'] is None else EWMA_ALPHA * score + (1 - EWMA_ALPHA) * stats['ewma']
+    stats['window'] = (stats['window'] + [score])[-WINDOW_SIZE:]
+    stats['streak'] = stats['streak'] + 1 if score >= STREAK_THRESHOLD else 0
+    stats['best_streak'] = max(stats['best_streak'], stats['streak'])
+    stats['last'] = score
+
+
+def record_score_stats(score_stats: Dict[str, Dict[str, Any]], score_key: str, score: float):
+    """Update a category's aggregates and the overall aggregates"""
+    add_score(score_stats.setdefault(score_key, empty_stats()), score)
+    add_score(score_stats.setdefault(OVERALL, empty_stats()), score)
+
+
+def iter_recorded_scores(performance_data: Dict[str, Any],
+                         score_keys: Sequence[str] = ()) -> Iterator[Tuple[str, float, Optional[datetime]]]:
+    """(score key, score, timestamp) in the order the scores were recorded
+
+    score_keys names the category of each entry in performance_data['timestamps'].
+    Scores recorded before those were kept have no timestamp and come first,
+    category by category.
+    """
+    timestamps = performance_data.get('timestamps', [])
+    aligned = min(len(timestamps), len(score_keys))
+    timed = list(zip(score_keys[len(score_keys) - aligned:], timestamps[len(timestamps) - aligned:]))
+    timed_counts = Counter(key for key, _ in timed)
+
+    positions: Dict[str, int] = {}
+    for score_key, scores in performance_data.items():
+        if score_key == 'timestamps':
+            continue
+        untimed = max(len(scores) - timed_counts[score_key], 0)
+        for score in scores[:untimed]:
+            yield score_key, score, None
+        positions[score_key] = untimed
+    for score_key, timestamp in timed:
+        scores = performance_data.get(score_key, [])
+        position = positions.get(score_key, len(scores))
+        if position < len(scores):
+            yield score_key, scores[position], timestamp
+            positions[score_key] = position + 1
+
+
+def build_score_stats(performance_data: Dict[str, Iterable[float]],
+                      score_keys: Sequence[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """Aggregates recomputed from the score lists (used when migrating or importing data)
+
+    With score_keys the overall aggregates see the scores in recorded order,
+    as they did when recorded one by one.
+    """
+    score_stats: Dict[str, Dict[str, Any]] = {OVERALL: empty_stats()}
+    for score_key in performance_data:
+        if score_key != 'timestamps':
+            score_stats.setdefault(score_key, empty_stats())
+    for score_key, score, _ in iter_recorded_scores(performance_data, score_keys):
+        record_score_stats(score_stats, score_key, score)
+    return score_stats
+
+
+def mean(stats: Optional[Dict[str, Any]], default: float = 0.0) -> float:
+    """Average score, or default when there are none"""
+    if not stats or not stats['count']:
+        return default
+    return stats['sum'] / stats['count']
+
+
+def window_mean(stats: Optional[Dict[str, Any]], default: float = 0.0) -> float:
+    """Average of the last WINDOW_SIZE scores"""
+    if not stats or not stats['window']:
+        return default
+    return sum(stats['window']) / len(stats['window'])
+
+
+def count(stats: Optional[Dict[str, Any]]) -> int:
+    return stats['count'] if stats else 0
@@ -0,0 +1,202 @@
+"""Typed serialization for the user store.
+
+Snapshots use a small versioned binary container:
+
+    MAGIC (6 bytes) | format version (1 byte) | codec (1 byte) | payload
+
+The payload is msgpack (listed in requirements.txt), with datetimes stored
+as native extension types; installs without it fall back to JSON. Large lists
+are stored by column: interview sessions as one list per field, and
+timestamp columns as a single datetime-array value, so decoding does not
+build one object per field. Log lines stay JSON but tag datetimes as
+{"$dt": "<iso>"}. Either way timestamps come back as datetime objects, so
+pages never have to coerce strings. Decoding is about 1.6x faster than
+the legacy JSON snapshot (benchmarks/snapshot_benchmark.py); building the
+datetime objects is most of the remaining cost.
+
+Data written before this format (snapshot.json, untagged log timestamps) is
+read through upgrade_state, which parses the known timestamp fields once.
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+try:
+    import msgpack
+except ImportError:  # Listed in requirements.txt; fall back to the JSON codec
+    msgpack = None
+
+MAGIC = b"IPSNAP"
+# Version 1 was the plain snapshot.json written with default=str
+SNAPSHOT_VERSION = 2
+CODEC_MSGPACK = b"m"
+CODEC_JSON = b"j"
+# msgpack extension types: one datetime, and a column of datetimes (ISO strings, newline separated)
+DATETIME_EXT = 1
+DATETIME_COLUMN_EXT = 2
+
+
+class SnapshotFormatError(Exception):
+    """Snapshot file that cannot be decoded"""
+
+
+def parse_timestamp(value: Any) -> Any:
+    """datetime for an ISO-format string, anything else unchanged"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def upgrade_timestamps(kind: str, data: Any) -> Any:
+    """Parse string timestamps in a record written before typed timestamps"""
+    if kind in ('message', 'session', 'score') and isinstance(data, dict) and 'timestamp' in data:
+        data['timestamp'] = parse_timestamp(data['timestamp'])
+    return data
+
+
+def upgrade_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse string timestamps in a state dict written by an older version"""
+    performance_data = state.get('performance_data', {})
+    if 'timestamps' in performance_data:
+        performance_data['timestamps'] = [parse_timestamp(value) for value in performance_data['timestamps']]
+    for session in state.get('interview_sessions', []):
+        upgrade_timestamps('session', session)
+    for message in state.get('chat_history', []):
+        upgrade_timestamps('message', message)
+    return state
+
+
+class _DatetimeColumn:
+    """Marks a list of datetimes to be encoded as one value"""
+
+    def __init__(self, values: List[datetime]):
+        self.values = values
+
+    def encode(self) -> str:
+        return "\n".join(value.isoformat() for value in self.values)
+
+
+def _decode_datetime_column(text: str) -> List[datetime]:
+    if not text:
+        return []
+    return [datetime.fromisoformat(value) for value in text.split("\n")]
+
+
+def _as_column(values: List[Any]) -> Any:
+    if values and all(isinstance(value, datetime) for value in values):
+        return _DatetimeColumn(values)
+    return values
+
+
+def pack_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Columnar copy of a state dict for encoding (the input is not modified)"""
+    packed = dict(state)
+    performance_data = dict(state.get('performance_data', {}))
+    if 'timestamps' in performance_data:
+        performance_data['timestamps'] = _as_column(performance_data['timestamps'])
+    packed['performance_data'] = performance_data
+
+    sessions = state.get('interview_sessions', [])
+    if sessions and all(isinstance(session, dict) for session in sessions):
+        keys = list(sessions[0])
+        # Only uniform rows can round-trip through columns
+        if all(list(session) == keys for session in sessions):
+            packed['interview_sessions'] = {
+                '$columns': {key: _as_column([session[key] for session in sessions]) for key in keys}
+            }
+    return packed
+
+
+def unpack_state(packed: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of pack_state"""
+    sessions = packed.get('interview_sessions')
+    if isinstance(sessions, dict) and '$columns' in sessions:
+        columns = sessions['$columns']
+        packed['interview_sessions'] = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    return packed
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    if isinstance(value, _DatetimeColumn):
+        return {'$dts': value.encode()}
+    return str(value)
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if '$dt' in obj:
+            return datetime.fromisoformat(obj['$dt'])
+        if '$dts' in obj:
+            return _decode_datetime_column(obj['$dts'])
+    return obj
+
+
+_encoder = json.JSONEncoder(default=_json_default)
+_decoder = json.JSONDecoder(object_hook=_json_object_hook)
+
+
+def encode_line(record: Dict[str, Any]) -> str:
+    """One JSON log line with tagged timestamps"""
+    return _encoder.encode(record)
+
+
+def decode_line(line: str) -> Dict[str, Any]:
+    return _decoder.decode(line)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(DATETIME_EXT, value.isoformat().encode('ascii'))
+    if isinstance(value, _DatetimeColumn):
+        return msgpack.ExtType(DATETIME_COLUMN_EXT, value.encode().encode('ascii'))
+    return str(value)
+
+
+def _msgpack_ext_hook(code: int, payload: bytes) -> Any:
+    if code == DATETIME_EXT:
+        return datetime.fromisoformat(payload.decode('ascii'))
+    if code == DATETIME_COLUMN_EXT:
+        return _decode_datetime_column(payload.decode('ascii'))
+    return msgpack.ExtType(code, payload)
+
+
+def encode_snapshot(snapshot: Dict[str, Any]) -> bytes:
+    """Serialize a snapshot dict ({'state', 'through_segment'}) with the best available codec"""
+    snapshot = dict(snapshot, state=pack_state(snapshot['state']))
+    header = MAGIC + bytes([SNAPSHOT_VERSION])
+    if msgpack is not None:
+        return header + CODEC_MSGPACK + msgpack.packb(snapshot, default=_msgpack_default, use_bin_type=True)
+    return header + CODEC_JSON + encode_line(snapshot).encode('utf-8')
+
+
+def decode_snapshot(payload: bytes) -> Tuple[Dict[str, Any], int]:
+    """Return the snapshot dict and the format version it was written with"""
+    if not payload.startswith(MAGIC):
+        # Version 1: plain JSON with string timestamps
+        try:
+            snapshot = json.loads(payload.decode('utf-8'))
+        except ValueError as e:
+            raise SnapshotFormatError(f"Unrecognized snapshot: {e}")
+        upgrade_state(snapshot['state'])
+        return snapshot, 1
+
+    version = payload[len(MAGIC)]
+    codec = payload[len(MAGIC) + 1:len(MAGIC) + 2]
+    body = payload[len(MAGIC) + 2:]
+    if version > SNAPSHOT_VERSION:
+        raise SnapshotFormatError(f"Snapshot version {version} is newer than supported ({SNAPSHOT_VERSION})")
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise SnapshotFormatError("Snapshot was written with msgpack; install it with 'pip install msgpack'")
+        snapshot = msgpack.unpackb(body, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+    elif codec == CODEC_JSON:
+        snapshot = decode_line(body.decode('utf-8'))
+    else:
+        raise SnapshotFormatError(f"Unknown snapshot codec {codec!r}")
+    unpack_state(snapshot['state'])
+    return snapshot, version
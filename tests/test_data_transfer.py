@@ -0,0 +1,120 @@
+"""Export -> import round-trips, validation and duplicate handling for data_transfer."""
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+import data_transfer
+from user_store import get_user_store
+
+START = datetime(2024, 3, 1, 8, 30)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('USER_DATA_DIR', str(tmp_path / "data"))
+    return tmp_path
+
+
+def seed(profile):
+    get_user_store(profile).append([
+        ('message', {'role': 'user', 'content': 'Hi, "coach"\nsecond line', 'timestamp': START}),
+        ('message', {'role': 'assistant', 'content': 'Hello', 'timestamp': START + timedelta(seconds=5),
+                     'interview_id': '20240301_083000'}),
+        ('score', {'key': 'dsa_scores', 'score': 7, 'timestamp': START + timedelta(minutes=1)}),
+        ('score', {'key': 'dsa_scores', 'score': 7, 'timestamp': START + timedelta(minutes=1)}),
+        ('score', {'key': 'behavioral_scores', 'score': 4, 'timestamp': START + timedelta(minutes=2)}),
+        ('session', {'type': 'DSA', 'duration': 25, 'questions_asked': 2, 'responses': 3,
+                     'timestamp': START + timedelta(hours=1)}),
+    ])
+
+
+def comparable(profile):
+    state = get_user_store(profile).load()
+    return state['chat_history'], state['performance_data'], state['interview_sessions']
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl", "parquet"])
+def test_export_import_round_trip(data_dir, fmt):
+    if fmt == 'parquet' and data_transfer.pyarrow is None:
+        pytest.skip("pyarrow not installed")
+    seed('alice')
+    path = str(data_dir / f"alice.{fmt}")
+    assert data_transfer.export_to_path(['alice'], path) == 6
+
+    # Rows name their profile, so retarget them to import into an empty one
+    with open(path, 'rb') as source:
+        rows = [dict(row, profile='bob') for row in data_transfer.read_rows(source, fmt)]
+    counts = data_transfer.import_rows(rows)
+    assert counts == {'imported': 6, 'skipped': 0, 'duplicates': 0, 'profiles': 1}
+    assert comparable('bob') == comparable('alice')
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_to_file_matches_export_to_path(data_dir, fmt):
+    seed('alice')
+    path = str(data_dir / f"alice.{fmt}")
+    data_transfer.export_to_path(['alice'], path)
+    with data_transfer.export_to_file(['alice'], fmt) as exported, open(path, 'rb') as expected:
+        assert exported.read() == expected.read()
+
+
+def test_reimport_skips_stored_records(data_dir):
+    seed('alice')
+    path = str(data_dir / "alice.jsonl")
+    data_transfer.export_to_path(['alice'], path)
+    before = comparable('alice')
+
+    counts = data_transfer.import_from_path(path)
+    assert counts['imported'] == 0
+    assert counts['duplicates'] == 6
+    assert comparable('alice') == before
+
+
+def test_repeated_rows_in_one_file_are_kept(data_dir):
+    row = {'profile': 'carol', 'record_type': 'score', 'category': 'dsa_scores', 'score': '8', 'timestamp': ''}
+    assert data_transfer.import_rows([row, row])['imported'] == 2
+    assert data_transfer.import_rows([row, row, row]) == {'imported': 1, 'skipped': 0, 'duplicates': 2, 'profiles': 1}
+
+
+def test_stored_copies_are_matched_across_chunks(data_dir):
+    row = {'profile': 'carol', 'record_type': 'score', 'category': 'dsa_scores', 'score': '8', 'timestamp': ''}
+    other = dict(row, profile='frank')
+    data_transfer.import_rows([row, row, row])
+    # Three stored copies absorb the first three rows even when they land in different chunks
+    counts = data_transfer.import_rows([row, other, row, other, row, row], chunk_size=2)
+    assert counts == {'imported': 3, 'skipped': 0, 'duplicates': 3, 'profiles': 2}
+    assert get_user_store('carol').load()['performance_data']['dsa_scores'] == [8] * 4
+
+
+def test_invalid_rows_are_skipped(data_dir):
+    rows = [
+        {'profile': 'dave', 'record_type': 'score', 'category': 'timestamps', 'score': 5},
+        {'profile': 'dave', 'record_type': 'score', 'category': 'made_up_scores', 'score': 5},
+        {'profile': 'dave', 'record_type': 'score', 'category': 'dsa_scores', 'score': ''},
+        {'profile': '../escape', 'record_type': 'message', 'content': 'x'},
+        {'profile': 'dave', 'record_type': 'unknown'},
+        {'profile': 'dave', 'record_type': 'message', 'role': 'user', 'content': 'kept'},
+    ]
+    counts = data_transfer.import_rows(rows)
+    assert counts['skipped'] == 5
+    assert counts['imported'] == 1
+    performance_data = get_user_store('dave').load()['performance_data']
+    assert sorted(performance_data) == ['behavioral_scores', 'dsa_scores', 'system_design_scores', 'timestamps']
+    assert performance_data['timestamps'] == []
+
+
+def test_import_streams_in_chunks(data_dir):
+    rows = ({'profile': 'erin', 'record_type': 'message', 'role': 'user', 'content': f"m{i}"} for i in range(25))
+    counts = data_transfer.import_rows(rows, chunk_size=10)
+    assert counts['imported'] == 25
+    assert len(get_user_store('erin').load()['chat_history']) == 25
+
+
+def test_format_detection():
+    assert data_transfer.format_for_path("cohort.ndjson") == 'jsonl'
+    assert data_transfer.format_for_path("x.PQ") == 'parquet'
+    with pytest.raises(ValueError):
+        data_transfer.format_for_path("history.xlsx")
+    with pytest.raises(ValueError):
+        data_transfer.write_rows([], 'xml', io.StringIO())
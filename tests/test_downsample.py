@@ -0,0 +1,70 @@
+"""LTTB downsampling and time-bucket aggregation for long chart series."""
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from downsample import aggregate_buckets, bucket_start, choose_bucket_unit, lttb, lttb_indices
+
+
+def test_short_series_are_returned_whole():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+
+
+def test_lttb_keeps_endpoints_and_threshold():
+    xs = list(range(1000))
+    ys = [math.sin(x / 20) for x in xs]
+    indices = lttb_indices(xs, ys, 50)
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert indices == sorted(set(indices))
+
+
+def test_lttb_keeps_a_spike():
+    ys = [0.0] * 500
+    ys[250] = 100.0
+    assert 250 in lttb_indices(list(range(500)), ys, 20)
+
+
+def test_lttb_sorts_datetime_points():
+    start = datetime(2024, 1, 1)
+    points = [(start + timedelta(hours=h), float(h % 7)) for h in range(300)]
+    reduced = lttb(list(reversed(points)), 30)
+    assert len(reduced) == 30
+    assert reduced[0] == points[0] and reduced[-1] == points[-1]
+    assert [x for x, _ in reduced] == sorted(x for x, _ in reduced)
+
+
+def test_bucket_start_units():
+    moment = datetime(2024, 5, 15, 13, 45, 10)  # a Wednesday
+    assert bucket_start(moment, 'hour') == datetime(2024, 5, 15, 13)
+    assert bucket_start(moment, 'day') == datetime(2024, 5, 15)
+    assert bucket_start(moment, 'week') == datetime(2024, 5, 13)
+    assert bucket_start(moment, 'month') == datetime(2024, 5, 1)
+    with pytest.raises(ValueError):
+        bucket_start(moment, 'year')
+
+
+def test_choose_bucket_unit_picks_the_finest_that_fits():
+    start = datetime(2024, 1, 1)
+    hourly = [start + timedelta(hours=h) for h in range(24 * 10)]
+    assert choose_bucket_unit(hourly, 300) == 'hour'
+    assert choose_bucket_unit(hourly, 20) == 'day'
+    assert choose_bucket_unit(hourly, 2) == 'week'
+
+
+def test_aggregate_buckets_averages_per_group():
+    start = datetime(2024, 1, 1)
+    rows = [{'when': start + timedelta(hours=h), 'type': 'DSA' if h % 2 else 'Behavioral', 'minutes': h}
+            for h in range(48)]
+    rows.append({'when': None, 'type': 'DSA', 'minutes': 999})
+
+    unchanged, unit = aggregate_buckets(rows, 'when', 'type', 'minutes', max_buckets=100)
+    assert unit is None and len(unchanged) == 48
+
+    aggregated, unit = aggregate_buckets(rows, 'when', 'type', 'minutes', max_buckets=5)
+    assert unit == 'day'
+    assert len(aggregated) == 4
+    first_day_dsa = next(r for r in aggregated if r['when'] == start and r['type'] == 'DSA')
+    assert first_day_dsa['count'] == 12
+    assert first_day_dsa['minutes'] == sum(range(1, 24, 2)) / 12
@@ -0,0 +1,97 @@
+"""Batch splitting, budgeted prompts and parsing for answer evaluation."""
+from types import SimpleNamespace
+
+from evaluation import (BATCH_TOKEN_BUDGET, build_batch_prompt, build_evaluation_prompt, parse_batch_response,
+                        parse_score, split_batches)
+from prompt_builder import estimate_tokens
+
+
+def item(number, answer="Use a hash map for O(n) lookups."):
+    return {'question': f"Question {number}", 'answer': answer, 'category': 'DSA'}
+
+
+def section(number, score=None):
+    body = f"Score: {score}/10\n" if score is not None else ""
+    return f"### Item {number}\n{body}Strengths: clear\n"
+
+
+def test_parse_score_clamps_and_handles_missing():
+    assert parse_score("Score: 8/10") == 8
+    assert parse_score("Score: 14/10") == 10
+    assert parse_score("No score here") is None
+    assert parse_score(None) is None
+
+
+def test_batch_response_in_order():
+    results = parse_batch_response(section(1, 7) + section(2, 4), 2)
+    assert [r['score'] for r in results] == [7, 4]
+    assert all(r['error'] is None for r in results)
+    assert results[0]['feedback'].startswith("Score: 7/10")
+
+
+def test_missing_and_unscored_items_are_reported():
+    results = parse_batch_response(section(1, 9) + section(3), 3)
+    assert results[0]['score'] == 9
+    assert results[1]['score'] is None and "No section for item 2" in results[1]['error']
+    assert results[2]['score'] is None and "Score" in results[2]['error']
+
+
+def test_extra_and_repeated_items_are_ignored():
+    text = section(2, 6) + section(1, 5) + section(1, 1) + section(4, 9)
+    results = parse_batch_response(text, 2)
+    # Sections are matched by number, the first of a repeated number wins, extras are dropped
+    assert [r['score'] for r in results] == [5, 6]
+
+
+def test_empty_response_reports_every_item():
+    assert [r['error'] is not None for r in parse_batch_response("", 2)] == [True, True]
+
+
+def test_batches_respect_the_token_budget():
+    items = [item(number, "word " * 200) for number in range(10)]
+    batches = split_batches(items)
+    assert sum(len(batch) for batch in batches) == 10
+    assert len(batches) > 1
+    for batch in batches:
+        assert estimate_tokens(build_batch_prompt(batch)) <= BATCH_TOKEN_BUDGET
+
+
+def test_oversized_answer_is_trimmed_not_the_format():
+    batches = split_batches([item(1, "word " * 5000), item(2)])
+    prompt = build_batch_prompt(batches[0])
+    assert estimate_tokens(prompt) <= BATCH_TOKEN_BUDGET
+    assert "Score: X/10" in prompt and "### Item 1" in prompt
+
+
+def test_single_evaluation_prompt_keeps_the_rubric():
+    prompt = build_evaluation_prompt("Design a URL shortener", "word " * 5000, "System Design", max_tokens=2000)
+    assert estimate_tokens(prompt) <= 2000
+    assert "Score: X/10" in prompt
+    assert "Amazon Focus" in prompt
+
+
+def test_demo_batch_scores_every_item(monkeypatch):
+    import ai_assistant
+
+    monkeypatch.setattr(ai_assistant.st, 'session_state', SimpleNamespace(demo_mode=True, gemini_client="demo"),
+                        raising=False)
+    results = ai_assistant.evaluate_answers_batch([item(1), item(2, "word " * 400), item(3)])
+    assert all(r['error'] is None for r in results)
+    assert [r['score'] for r in results] == [4, 8, 4]
+
+
+def test_failed_request_is_reported_not_as_parse_errors(monkeypatch):
+    import ai_assistant
+
+    class FailingClient:
+        cache_namespace = "test"
+
+        def generate_content(self, prompt, **kwargs):
+            raise RuntimeError("API_KEY_INVALID")
+
+    monkeypatch.setattr(ai_assistant.st, 'session_state', SimpleNamespace(demo_mode=False, gemini_client=FailingClient()),
+                        raising=False)
+    monkeypatch.setattr(ai_assistant, 'get_response_cache', lambda: {})
+    results = ai_assistant.evaluate_answers_batch([item(1), item(2)])
+    assert [r['score'] for r in results] == [None, None]
+    assert all("API_KEY_INVALID" in r['error'] for r in results)
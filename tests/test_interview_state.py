@@ -0,0 +1,84 @@
+"""Live interview transitions and the page's advance_interview guard."""
+from types import SimpleNamespace
+
+import pytest
+
+from app_pages import live_interview
+from interview_state import AWAITING_AI, ENDED, IDLE, RECORDING, REVIEWING, STATES, TRANSITIONS, next_state
+
+EVENTS = sorted({event for _, event in TRANSITIONS})
+
+
+@pytest.mark.parametrize("state, event, expected", [
+    (IDLE, 'start_recording', RECORDING),
+    (IDLE, 'submit', AWAITING_AI),
+    (IDLE, 'next_question', IDLE),
+    (RECORDING, 'stop_recording', IDLE),
+    (RECORDING, 'submit', AWAITING_AI),
+    (AWAITING_AI, 'ai_replied', REVIEWING),
+    (AWAITING_AI, 'ai_failed', IDLE),
+    (REVIEWING, 'start_recording', RECORDING),
+    (REVIEWING, 'submit', AWAITING_AI),
+    (REVIEWING, 'next_question', IDLE),
+])
+def test_valid_transitions(state, event, expected):
+    assert next_state(state, event) == expected
+
+
+@pytest.mark.parametrize("state, event", [
+    (IDLE, 'stop_recording'),
+    (IDLE, 'ai_replied'),
+    (RECORDING, 'start_recording'),
+    (AWAITING_AI, 'submit'),
+    (AWAITING_AI, 'next_question'),
+    (AWAITING_AI, 'start_recording'),
+    (REVIEWING, 'stop_recording'),
+    (REVIEWING, 'ai_failed'),
+    ('unknown', 'submit'),
+    (IDLE, 'unknown'),
+])
+def test_invalid_transitions(state, event):
+    assert next_state(state, event) is None
+
+
+def test_every_state_but_ended_can_end():
+    for state in STATES:
+        assert next_state(state, 'end') == (None if state == ENDED else ENDED)
+
+
+def test_ended_is_terminal():
+    assert all(next_state(ENDED, event) is None for event in EVENTS)
+
+
+def test_transitions_stay_within_states():
+    assert all(state in STATES and target in STATES for (state, _), target in TRANSITIONS.items())
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session_state = SimpleNamespace(interview_state=IDLE)
+    monkeypatch.setattr(live_interview.st, 'session_state', session_state)
+    return session_state
+
+
+def test_advance_interview_applies_valid_events(session):
+    assert live_interview.advance_interview('submit')
+    assert session.interview_state == AWAITING_AI
+    assert live_interview.advance_interview('ai_replied')
+    assert session.interview_state == REVIEWING
+
+
+def test_advance_interview_leaves_state_on_invalid_events(session):
+    session.interview_state = AWAITING_AI
+    # A second submit while the reply streams must not start another request
+    assert not live_interview.advance_interview('submit')
+    assert session.interview_state == AWAITING_AI
+
+
+def test_recording_button_toggles(session):
+    # The voice button tries start_recording and falls back to stop_recording
+    for expected in (RECORDING, IDLE):
+        if not live_interview.advance_interview('start_recording'):
+            live_interview.advance_interview('stop_recording')
+        assert session.interview_state == expected
+
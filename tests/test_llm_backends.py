@@ -0,0 +1,85 @@
+"""The local stand-in backend against the interface the engine and get_ai_response use."""
+from types import SimpleNamespace
+
+import pytest
+
+import ai_assistant
+from llm_backends import LLMBackend, LocalStandInBackend, create_backend
+from llm_engine import LLMRequestEngine
+from response_cache import ResponseCache
+
+
+def make_backend(**overrides):
+    options = dict(latency_ms=0.0, latency_jitter_ms=0.0, distribution="fixed", tokens_per_second=1e6,
+                   response_tokens=30)
+    options.update(overrides)
+    return LocalStandInBackend(**options)
+
+
+@pytest.fixture
+def engine():
+    return LLMRequestEngine(max_workers=2, max_pending=4, requests_per_minute=60000, max_retries=0,
+                            base_delay=0.01, max_delay=0.02, default_timeout=5.0)
+
+
+@pytest.fixture
+def app(monkeypatch, engine):
+    """get_ai_response wired to the stand-in, a test engine and an in-memory cache"""
+    backend, cache = make_backend(), ResponseCache()
+    monkeypatch.setattr(ai_assistant, 'get_request_engine', lambda: engine)
+    monkeypatch.setattr(ai_assistant, 'get_response_cache', lambda: cache)
+    monkeypatch.setattr(ai_assistant.st, 'session_state', SimpleNamespace(demo_mode=False, gemini_client=backend))
+    return backend
+
+
+def test_stand_in_implements_the_backend_interface():
+    backend = make_backend()
+    assert isinstance(backend, LLMBackend)
+    assert not getattr(LocalStandInBackend, '__abstractmethods__', None)
+    assert backend.cache_namespace != backend.model_name
+    assert backend.cache_namespace.endswith(backend.model_name)
+
+
+def test_generate_content_returns_text_and_streams_the_same_text():
+    backend = make_backend(chunk_tokens=4)
+    text = backend.generate_content("Explain hashing").text
+    chunks = list(backend.generate_content("Explain hashing", stream=True))
+    assert len(text.split()) == 30
+    assert len(chunks) > 1 and all(isinstance(chunk.text, str) for chunk in chunks)
+    assert "".join(chunk.text for chunk in chunks) == text
+
+
+def test_check_routes_through_a_runner():
+    calls = []
+    result = make_backend().check(lambda fn, *args: calls.append(args) or fn(*args))
+    assert result['success'] and result['response']
+    assert len(calls) == 1
+
+
+def test_engine_calls_and_streams_the_stand_in(engine):
+    backend = make_backend()
+    assert engine.call(backend.generate_content, "prompt").text == backend.render_text("prompt")
+    streamed = "".join(chunk.text for chunk in engine.stream(backend.generate_content, "prompt", stream=True))
+    assert streamed == backend.render_text("prompt")
+
+
+def test_get_ai_response_uses_the_stand_in(app):
+    text = ai_assistant.get_ai_response("Design a URL shortener")
+    assert text and "configure" not in text
+    assert app.stats()['requests'] == 1
+    # The repeat is served from the response cache under the stand-in's namespace
+    assert ai_assistant.get_ai_response("Design a URL shortener") == text
+    assert app.stats()['requests'] == 1
+    assert "".join(ai_assistant.get_ai_response("Design a URL shortener", stream=True)) == text
+
+
+def test_injected_failures_reach_the_caller_as_errors(app):
+    app.error_rate = 1.0
+    text = ai_assistant.get_ai_response("Design a rate limiter", is_interviewer=True)
+    assert app.stats()['errors'] >= 1
+    assert "503" in text
+
+
+def test_create_backend_selects_the_stand_in(monkeypatch):
+    monkeypatch.setenv('LLM_BACKEND', 'local')
+    assert isinstance(create_backend("gemini-1.5-pro"), LocalStandInBackend)
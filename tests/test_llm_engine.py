@@ -0,0 +1,134 @@
+"""Retry, deadline and overload behavior of the LLM request engine."""
+import threading
+import time
+
+import pytest
+
+from llm_engine import DeadlineExceeded, EngineOverloaded, LLMRequestEngine, is_retryable_error
+
+
+def make_engine(**overrides):
+    options = dict(max_workers=2, max_pending=2, requests_per_minute=60000, max_retries=3,
+                   base_delay=0.01, max_delay=0.02, default_timeout=5.0)
+    options.update(overrides)
+    return LLMRequestEngine(**options)
+
+
+class Flaky:
+    """Fails with error the first failures calls, then returns 'ok'"""
+
+    def __init__(self, failures, error):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def test_retryable_errors_are_classified():
+    assert is_retryable_error(Exception("429 Resource has been exhausted"))
+    assert is_retryable_error(ConnectionError("reset"))
+    assert not is_retryable_error(ValueError("API_KEY_INVALID"))
+
+
+def test_call_retries_transient_errors_until_success():
+    engine = make_engine()
+    fn = Flaky(2, Exception("503 unavailable"))
+    assert engine.call(fn) == "ok"
+    assert fn.calls == 3
+    stats = engine.stats()
+    assert stats['retries'] == 2
+    assert stats['completed'] == 1
+
+
+def test_call_gives_up_after_max_retries():
+    engine = make_engine(max_retries=2)
+    fn = Flaky(10, Exception("429 quota"))
+    with pytest.raises(Exception, match="429"):
+        engine.call(fn)
+    assert fn.calls == 3
+    assert engine.stats()['failed'] == 1
+
+
+def test_call_does_not_retry_permanent_errors():
+    engine = make_engine()
+    fn = Flaky(1, ValueError("API_KEY_INVALID"))
+    with pytest.raises(ValueError):
+        engine.call(fn)
+    assert fn.calls == 1
+
+
+def test_call_raises_deadline_exceeded_for_slow_requests():
+    engine = make_engine()
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        engine.call(time.sleep, 1.0, timeout=0.1)
+    assert time.monotonic() - started < 0.9
+    assert engine.stats()['timeouts'] == 1
+
+
+def test_timeout_error_from_the_request_is_not_a_missed_deadline():
+    engine = make_engine(max_retries=1)
+    fn = Flaky(5, TimeoutError("socket read timed out"))
+    with pytest.raises(TimeoutError) as failure:
+        engine.call(fn)
+    assert not isinstance(failure.value, DeadlineExceeded)
+    assert fn.calls == 2
+    stats = engine.stats()
+    assert stats['failed'] == 1
+    assert stats['timeouts'] == 0
+
+
+def test_retry_backoff_stops_at_the_deadline():
+    engine = make_engine(max_retries=10, base_delay=1.0, max_delay=1.0)
+    fn = Flaky(10, Exception("503 unavailable"))
+    with pytest.raises(Exception, match="503"):
+        engine.call(fn, timeout=0.3)
+    # The backoff would outlive the deadline, so the first error is final
+    assert fn.calls == 1
+
+
+def test_full_queue_is_rejected():
+    engine = make_engine(max_workers=1, max_pending=0)
+    release = threading.Event()
+    worker = threading.Thread(target=lambda: engine.call(release.wait, 5))
+    worker.start()
+    try:
+        deadline = time.monotonic() + 2
+        while engine.stats()['in_flight'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with pytest.raises(EngineOverloaded):
+            engine.call(lambda: "never")
+        assert engine.stats()['rejected'] == 1
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_stream_retries_only_before_the_first_item():
+    engine = make_engine()
+    attempts = []
+
+    def opens_after_one_failure():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise Exception("503 unavailable")
+        return iter(["a", "b"])
+
+    assert list(engine.stream(opens_after_one_failure)) == ["a", "b"]
+    assert len(attempts) == 2
+
+    def breaks_midway():
+        yield "partial"
+        raise Exception("503 unavailable")
+
+    received = []
+    with pytest.raises(Exception, match="503"):
+        for item in engine.stream(breaks_midway):
+            received.append(item)
+    # Output already reached the caller, so it is not repeated by a retry
+    assert received == ["partial"]
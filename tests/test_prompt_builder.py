@@ -0,0 +1,92 @@
+"""Token budgets, context shedding and rolling summaries for prompt_builder."""
+from prompt_builder import (MIN_CONTEXT_TOKENS, MIN_PROMPT_TOKENS, PROMPT_BUDGETS, build_feedback_context,
+                            build_interview_context, enforce_budget, estimate_tokens, fold_history,
+                            truncate_to_tokens)
+
+QUESTION = {
+    'question': "Two Sum: return indices of the two numbers adding up to target",
+    'topic': "Arrays",
+    'difficulty': "Easy",
+    'expected_approach': "Hash map from value to index, one pass",
+    'follow_ups': ["What if the array is sorted?", "What about duplicates?"],
+}
+
+
+def turn(number, role='user', words=30):
+    return {'role': role, 'content': f"Turn {number}: " + "detail " * words + "."}
+
+
+def test_truncate_cuts_at_a_word_boundary():
+    text = "alpha beta gamma delta " * 20
+    trimmed = truncate_to_tokens(text, 10)
+    assert trimmed.endswith(" …")
+    assert text.startswith(trimmed[:-2])
+    assert estimate_tokens(trimmed) <= 10
+    assert truncate_to_tokens("short", 10) == "short"
+    assert truncate_to_tokens("anything", 0) == ""
+
+
+def test_long_answer_is_never_cut_below_the_floor():
+    answer = "x = compute(y) " * 700  # about 10 KB of code
+    context = "Interview Type: DSA\n" + "context " * 2000
+    prompt, trimmed_context = enforce_budget(answer, context, 'interviewer')
+    assert prompt == answer
+    assert estimate_tokens(trimmed_context) <= MIN_CONTEXT_TOKENS
+    assert trimmed_context.startswith("Interview Type: DSA")
+
+
+def test_context_is_shed_before_the_prompt():
+    prompt = "word " * 400
+    context = "context " * 2000
+    kept_prompt, kept_context = enforce_budget(prompt, context, 'interviewer')
+    assert kept_prompt == prompt
+    assert estimate_tokens(kept_prompt) + estimate_tokens(kept_context) <= PROMPT_BUDGETS['interviewer']
+
+
+def test_only_huge_prompts_are_trimmed_to_the_floor():
+    prompt, context = enforce_budget("word " * 20000, "", 'coach')
+    assert MIN_PROMPT_TOKENS - 5 <= estimate_tokens(prompt) <= MIN_PROMPT_TOKENS
+    assert context == ""
+    assert enforce_budget("hi", "ctx", 'coach') == ("hi", "ctx")
+
+
+def test_fold_history_summarizes_older_turns_once():
+    turns = [turn(number) for number in range(7)]
+    state, recent = fold_history(turns, {}, recent_turns=4)
+    assert recent == turns[3:]
+    assert state['covered'] == 3
+    assert [line.split(":")[1].strip() for line in state['lines']] == ["Turn 0", "Turn 1", "Turn 2"]
+
+    # Folding again with one new turn only summarizes the turn that left the window
+    state, recent = fold_history(turns + [turn(7, 'interviewer')], state, recent_turns=4)
+    assert state['covered'] == 4
+    assert len(state['lines']) == 4
+    assert recent[-1]['role'] == 'interviewer'
+
+
+def test_interview_context_fits_and_keeps_newest_turns():
+    turns = [turn(number, 'user' if number % 2 else 'interviewer', words=80) for number in range(10)]
+    context, state = build_interview_context("DSA", QUESTION, 1, turns, {})
+    assert estimate_tokens(context) <= PROMPT_BUDGETS['interviewer']
+    assert "Expected approach" in context
+    assert "Earlier in this interview" in context
+    assert "Turn 9:" in context
+
+
+def test_tight_budget_sheds_turns_and_summary_before_the_question():
+    turns = [turn(number, words=80) for number in range(10)]
+    context, _ = build_interview_context("DSA", QUESTION, 1, turns, {}, budget=MIN_CONTEXT_TOKENS)
+    assert estimate_tokens(context) <= MIN_CONTEXT_TOKENS
+    assert QUESTION['question'] in context
+    assert "Earlier in this interview" not in context
+
+    context, _ = build_interview_context("DSA", QUESTION, 1, turns, {}, budget=25)
+    assert context.startswith("Interview Type: DSA\nQuestion: Two Sum")
+
+
+def test_feedback_context_shares_the_budget_between_responses():
+    responses = ["long " * 3000, "short answer"]
+    context = build_feedback_context(responses, ["Candidate: earlier point"])
+    assert estimate_tokens(context) <= PROMPT_BUDGETS['feedback']
+    assert "short answer" in context
+    assert context.startswith("Earlier in this interview:")
@@ -0,0 +1,74 @@
+"""Hits, eviction, expiry and persistence of the two-tier response cache."""
+import time
+
+from response_cache import ResponseCache, make_cache_key
+
+
+def test_cache_key_ignores_whitespace_and_separates_requests():
+    key = make_cache_key("Explain  hash maps", "ctx", False, "gemini-1.5-pro")
+    assert key == make_cache_key(" Explain hash maps\n", "ctx", False, "gemini-1.5-pro")
+    assert key != make_cache_key("Explain hash maps", "ctx", True, "gemini-1.5-pro")
+    assert key != make_cache_key("Explain hash maps", "ctx", False, "gemini-1.5-flash")
+    assert key != make_cache_key("Explain hash maps", "ctx", False, "gemini-1.5-pro", mode='evaluation')
+
+
+def test_memory_tier_hits_and_lru_eviction():
+    cache = ResponseCache(max_memory_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    stats = cache.stats()
+    assert stats['memory_hits'] == 3
+    assert stats['misses'] == 1
+    assert stats['evictions'] == 1
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResponseCache(path=path).set("key", "value")
+
+    reopened = ResponseCache(path=path)
+    assert reopened.has("key")
+    assert reopened.get("key") == "value"
+    assert reopened.stats()['disk_hits'] == 1
+
+
+def test_disk_tier_evicts_least_recently_used_by_count_and_size(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"), max_memory_entries=1,
+                          max_disk_entries=3, max_disk_bytes=1000)
+    for index in range(5):
+        cache.set(f"k{index}", "x" * 10)
+    assert cache.stats()['disk_entries'] == 3
+    assert cache.get("k0") is None
+    assert cache.get("k4") == "x" * 10
+
+    cache.set("big", "y" * 900)
+    # Only the newest entry and as many others as fit in 1000 bytes remain
+    remaining = cache._db.execute("SELECT COUNT(*), SUM(size) FROM responses").fetchone()
+    assert remaining[1] <= 1000
+    assert cache.stats()['disk_entries'] == remaining[0]
+    assert cache.get("big") == "y" * 900
+
+
+def test_running_totals_follow_replacements_and_clear(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"))
+    cache.set("key", "short")
+    cache.set("key", "a much longer value")
+    assert (cache._disk_count, cache._disk_bytes) == (1, len("a much longer value"))
+    cache.clear()
+    assert cache.stats()['disk_entries'] == 0
+    assert cache.get("key") is None
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0.05)
+    cache.set("key", "value")
+    time.sleep(0.1)
+    assert not cache.has("key")
+    assert cache.get("key") is None
+    assert cache.stats()['expired'] >= 1
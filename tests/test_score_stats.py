@@ -0,0 +1,115 @@
+"""Incremental score aggregates against a full recompute after append, replay and import."""
+from datetime import datetime, timedelta
+
+import pytest
+
+import data_transfer
+import score_stats
+from score_stats import OVERALL, STREAK_THRESHOLD, WINDOW_SIZE, build_score_stats
+from user_store import get_user_store
+
+START = datetime(2024, 1, 1, 9, 0, 0)
+KEYS = ('dsa_scores', 'system_design_scores', 'behavioral_scores')
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('USER_DATA_DIR', str(tmp_path / "data"))
+    return tmp_path
+
+
+def scored(count, seed=3):
+    """(score key, score) pairs with interleaved categories and streaks"""
+    return [(KEYS[(index * seed) % 7 % 3], (index * 7 + seed) % 11) for index in range(count)]
+
+
+def score_records(pairs, offset=0):
+    return [('score', {'key': key, 'score': score, 'timestamp': START + timedelta(minutes=offset + index)})
+            for index, (key, score) in enumerate(pairs)]
+
+
+def recompute(scores):
+    """Aggregates of one category computed directly from its full score list"""
+    if not scores:
+        return score_stats.empty_stats()
+    ewma = scores[0]
+    for score in scores[1:]:
+        ewma = score_stats.EWMA_ALPHA * score + (1 - score_stats.EWMA_ALPHA) * ewma
+    streak = best_streak = 0
+    for score in scores:
+        streak = streak + 1 if score >= STREAK_THRESHOLD else 0
+        best_streak = max(best_streak, streak)
+    return {'count': len(scores), 'sum': sum(scores), 'min': min(scores), 'max': max(scores), 'ewma': ewma,
+            'window': scores[-WINDOW_SIZE:], 'streak': streak, 'best_streak': best_streak, 'last': scores[-1]}
+
+
+def assert_matches_recompute(stats, pairs):
+    expected = {key: recompute([score for k, score in pairs if k == key]) for key in KEYS}
+    expected[OVERALL] = recompute([score for _, score in pairs])
+    for key, aggregates in expected.items():
+        actual = stats.get(key, score_stats.empty_stats())
+        assert actual['ewma'] == pytest.approx(aggregates['ewma']), key
+        assert dict(actual, ewma=None) == dict(aggregates, ewma=None), key
+        assert score_stats.mean(actual) == pytest.approx(
+            aggregates['sum'] / aggregates['count'] if aggregates['count'] else 0.0)
+        window = aggregates['window']
+        assert score_stats.window_mean(actual) == pytest.approx(sum(window) / len(window) if window else 0.0)
+
+
+def test_incremental_updates_match_recompute():
+    pairs = scored(57)
+    stats = build_score_stats({})
+    for key, score in pairs:
+        score_stats.record_score_stats(stats, key, score)
+    assert_matches_recompute(stats, pairs)
+
+
+def test_build_score_stats_follows_recorded_order():
+    pairs = scored(40)
+    performance_data = {key: [score for k, score in pairs if k == key] for key in KEYS}
+    performance_data['timestamps'] = [START + timedelta(minutes=index) for index in range(len(pairs))]
+    stats = build_score_stats(performance_data, [key for key, _ in pairs])
+    assert_matches_recompute(stats, pairs)
+
+
+def test_append_then_load_matches_recompute(data_dir):
+    store = get_user_store('alice')
+    first, second = scored(30), scored(25, seed=5)
+    store.append(score_records(first))
+    store.append(score_records(second, offset=len(first)))
+    assert_matches_recompute(store.load()['score_stats'], first + second)
+
+
+def test_replay_after_compaction_matches_recompute(data_dir):
+    store = get_user_store('alice')
+    store.events.max_bytes = 300
+    pairs = scored(80)
+    for index in range(0, len(pairs), 8):
+        store.append(score_records(pairs[index:index + 8], offset=index))
+    store.compact()
+    assert store.events.segments()
+    assert_matches_recompute(store.load()['score_stats'], pairs)
+
+
+def test_import_state_matches_recompute(data_dir):
+    pairs = scored(35)
+    performance_data = {key: [score for k, score in pairs if k == key] for key in KEYS}
+    performance_data['timestamps'] = [(START + timedelta(minutes=index)).isoformat() for index in range(len(pairs))]
+    store = get_user_store('alice')
+    # Aggregates in an imported file are not trusted; they are rebuilt from the scores
+    store.import_state({'performance_data': performance_data, 'score_keys': [key for key, _ in pairs],
+                        'score_stats': build_score_stats({}), 'session_count': 0, 'total_study_time': 0})
+    assert_matches_recompute(store.load()['score_stats'], pairs)
+
+
+def test_export_import_keeps_aggregates(data_dir):
+    existing, pairs = scored(5, seed=2), scored(45)
+    get_user_store('alice').append(score_records(pairs))
+    get_user_store('bob').append(score_records(existing, offset=-10))
+    rows = [dict(row, profile='bob') for row in data_transfer.iter_export_rows(['alice'])]
+
+    data_transfer.import_rows(rows)
+
+    bob = get_user_store('bob').load()
+    assert_matches_recompute(bob['score_stats'], existing + pairs)
+    assert bob['score_stats'] == build_score_stats(bob['performance_data'], bob['score_keys'])
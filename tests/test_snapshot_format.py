@@ -0,0 +1,114 @@
+"""Round trips through the snapshot container and tagged log lines."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import snapshot_format
+from snapshot_format import (CODEC_JSON, MAGIC, SNAPSHOT_VERSION, SnapshotFormatError, decode_line,
+                             decode_snapshot, encode_line, encode_snapshot)
+
+
+START = datetime(2024, 1, 1, 9, 0, 0)
+
+
+def sample_state():
+    return {
+        'chat_history': [{'role': 'user', 'content': "hi", 'timestamp': START}],
+        'interview_sessions': [
+            {'timestamp': START + timedelta(hours=index, microseconds=index), 'type': 'DSA',
+             'duration': index, 'questions_asked': 1, 'responses': 2}
+            for index in range(5)
+        ],
+        'performance_data': {
+            'dsa_scores': [7, 8],
+            'system_design_scores': [],
+            'behavioral_scores': [5],
+            'timestamps': [START + timedelta(minutes=index) for index in range(3)],
+        },
+        'session_count': 5,
+        'total_study_time': 0,
+    }
+
+
+@pytest.fixture(params=['msgpack', 'json'])
+def codec(request, monkeypatch):
+    if request.param == 'msgpack':
+        if snapshot_format.msgpack is None:
+            pytest.skip("msgpack is not installed")
+    else:
+        monkeypatch.setattr(snapshot_format, 'msgpack', None)
+    return request.param
+
+
+def test_snapshot_round_trip_restores_datetimes(codec):
+    state = sample_state()
+    payload = encode_snapshot({'state': state, 'through_segment': 4})
+
+    snapshot, version = decode_snapshot(payload)
+
+    assert version == SNAPSHOT_VERSION
+    assert snapshot['through_segment'] == 4
+    assert snapshot['state'] == sample_state()
+    assert isinstance(snapshot['state']['interview_sessions'][0]['timestamp'], datetime)
+    assert isinstance(snapshot['state']['performance_data']['timestamps'][0], datetime)
+
+
+def test_encoding_does_not_modify_the_state(codec):
+    state = sample_state()
+    encode_snapshot({'state': state, 'through_segment': 0})
+    assert state == sample_state()
+
+
+def test_non_uniform_sessions_are_stored_by_row(codec):
+    state = sample_state()
+    state['interview_sessions'][2]['notes'] = "extra field"
+    snapshot, _ = decode_snapshot(encode_snapshot({'state': state, 'through_segment': 0}))
+    assert snapshot['state']['interview_sessions'] == state['interview_sessions']
+
+
+def test_empty_columns_round_trip(codec):
+    state = sample_state()
+    state['interview_sessions'] = []
+    state['performance_data']['timestamps'] = []
+    snapshot, _ = decode_snapshot(encode_snapshot({'state': state, 'through_segment': 0}))
+    assert snapshot['state'] == state
+
+
+def test_json_codec_is_used_without_msgpack(monkeypatch):
+    monkeypatch.setattr(snapshot_format, 'msgpack', None)
+    payload = encode_snapshot({'state': sample_state(), 'through_segment': 0})
+    assert payload[len(MAGIC) + 1:len(MAGIC) + 2] == CODEC_JSON
+
+
+def test_msgpack_snapshot_without_msgpack_is_reported(monkeypatch):
+    if snapshot_format.msgpack is None:
+        pytest.skip("msgpack is not installed")
+    payload = encode_snapshot({'state': sample_state(), 'through_segment': 0})
+    monkeypatch.setattr(snapshot_format, 'msgpack', None)
+    with pytest.raises(SnapshotFormatError):
+        decode_snapshot(payload)
+
+
+def test_legacy_json_snapshot_is_upgraded():
+    payload = json.dumps({'state': sample_state(), 'through_segment': 2}, default=str).encode('utf-8')
+
+    snapshot, version = decode_snapshot(payload)
+
+    assert version == 1
+    assert snapshot['state']['interview_sessions'] == sample_state()['interview_sessions']
+    assert snapshot['state']['performance_data']['timestamps'] == sample_state()['performance_data']['timestamps']
+
+
+def test_newer_or_unknown_snapshots_are_rejected():
+    with pytest.raises(SnapshotFormatError):
+        decode_snapshot(MAGIC + bytes([SNAPSHOT_VERSION + 1]) + CODEC_JSON + b"{}")
+    with pytest.raises(SnapshotFormatError):
+        decode_snapshot(MAGIC + bytes([SNAPSHOT_VERSION]) + b"x" + b"{}")
+    with pytest.raises(SnapshotFormatError):
+        decode_snapshot(b"not a snapshot")
+
+
+def test_log_lines_round_trip_datetimes():
+    record = {'kind': 'message', 'data': {'role': 'user', 'content': "hi", 'timestamp': START}}
+    assert decode_line(encode_line(record)) == record
@@ -0,0 +1,191 @@
+"""Append, paging, compaction, archive and locking behavior of the append-only user store."""
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from archive import RetentionPolicy
+from file_utils import atomic_write_bytes
+from user_store import AppendError, UserStore, get_user_store, list_user_ids, validate_user_id
+
+
+START = datetime(2024, 1, 1, 9, 0, 0)
+
+
+def message(index):
+    return {'role': 'user' if index % 2 == 0 else 'assistant', 'content': f"message {index}",
+            'timestamp': START + timedelta(minutes=index)}
+
+
+def score(index, key='dsa_scores'):
+    return {'key': key, 'score': index % 11, 'timestamp': START + timedelta(hours=index)}
+
+
+def session(index):
+    return {'type': 'DSA', 'duration': index, 'questions_asked': 1, 'responses': 2,
+            'timestamp': START + timedelta(days=index)}
+
+
+def small_store(directory, segment_bytes=400, hot_segments=100, hot_sessions=500):
+    store = UserStore(str(directory), RetentionPolicy(hot_segments, hot_sessions))
+    store.messages.max_bytes = segment_bytes
+    store.events.max_bytes = segment_bytes
+    return store
+
+
+def test_append_and_load_round_trip(tmp_path):
+    store = small_store(tmp_path)
+    store.append([('message', message(0)), ('score', score(7)), ('session', session(1)),
+                  ('counters', {'session_count': 3, 'total_study_time': 40})])
+
+    state = UserStore(str(tmp_path)).load()
+    assert state['chat_history'] == [message(0)]
+    assert state['performance_data']['dsa_scores'] == [7]
+    assert state['performance_data']['timestamps'] == [score(7)['timestamp']]
+    assert state['interview_sessions'] == [session(1)]
+    assert state['session_count'] == 3
+    assert state['total_study_time'] == 40
+    # Timestamps come back typed
+    assert isinstance(state['chat_history'][0]['timestamp'], datetime)
+
+
+def test_paging_walks_back_through_segments(tmp_path):
+    store = small_store(tmp_path)
+    for index in range(50):
+        store.append([('message', message(index))])
+    assert len(store.messages.segments()) > 1
+
+    state = store.load(message_limit=8)
+    assert [m['content'] for m in state['chat_history']] == [f"message {i}" for i in range(42, 50)]
+
+    seen = list(state['chat_history'])
+    cursor = state['chat_history_cursor']
+    while cursor is not None:
+        page, cursor = store.read_messages(8, cursor)
+        assert page
+        seen[:0] = page
+    assert seen == [message(i) for i in range(50)]
+
+
+def test_compaction_preserves_state(tmp_path):
+    store = small_store(tmp_path)
+    for index in range(60):
+        store.append([('score', score(index)), ('session', session(index))])
+    store.compact()
+    assert len(store.events.segments()) == 1
+    assert os.path.exists(store.snapshot_path)
+
+    state = UserStore(str(tmp_path)).load()
+    assert state['performance_data']['dsa_scores'] == [i % 11 for i in range(60)]
+    assert state['interview_sessions'] == [session(i) for i in range(60)]
+    assert state['score_keys'] == ['dsa_scores'] * 60
+
+
+def test_old_sessions_and_messages_move_to_the_archive(tmp_path):
+    store = small_store(tmp_path, hot_segments=2, hot_sessions=10)
+    for index in range(60):
+        store.append([('message', message(index)), ('session', session(index))])
+    store.compact()
+
+    assert len(store.messages.segments()) <= 2
+    assert store.archive.message_files()
+    assert list(store.iter_messages()) == [message(i) for i in range(60)]
+
+    # Compaction keeps hot_sessions in the snapshot; the open event segment adds the newest ones
+    state = store.load()
+    archived = [s for name in store.archive.session_files() for s in store.archive.read_file(name)]
+    assert state['archived_sessions'] == len(archived) >= 40
+    assert archived + state['interview_sessions'] == [session(i) for i in range(60)]
+
+
+def test_paging_continues_into_archived_messages(tmp_path):
+    store = small_store(tmp_path, hot_segments=2)
+    for index in range(60):
+        store.append([('message', message(index))])
+    assert store.archive.message_files()
+
+    state = store.load(message_limit=7)
+    seen = list(state['chat_history'])
+    cursor = state['chat_history_cursor']
+    while cursor is not None:
+        page, cursor = store.read_messages(7, cursor)
+        assert page
+        seen[:0] = page
+    assert seen == [message(i) for i in range(60)]
+
+
+def test_torn_final_line_is_ignored_and_repaired(tmp_path):
+    store = small_store(tmp_path, segment_bytes=1024 * 1024)
+    store.append([('message', message(0))])
+    path = store.messages._path(store.messages.segments()[-1])
+    with open(path, 'ab') as f:
+        f.write(b'{"kind": "message", "data": {"role": "us')
+
+    assert store.load()['chat_history'] == [message(0)]
+    store.append([('message', message(1))])
+    assert store.load()['chat_history'] == [message(0), message(1)]
+
+
+def test_torn_append_reports_only_unwritten_records(tmp_path):
+    store = small_store(tmp_path, segment_bytes=1024 * 1024)
+    store.append([('message', message(0))])
+
+    def torn_write(path, size, chunk, fsync):
+        # Two whole lines and part of the third reach the file
+        with open(path, 'ab') as f:
+            f.write(b"".join(chunk[:2]) + chunk[2][:10])
+        raise OSError("disk full")
+
+    store.messages._write = torn_write
+    records = [('message', message(index)) for index in range(1, 5)] + [('score', score(7))]
+    with pytest.raises(AppendError) as failure:
+        store.append(records)
+    assert failure.value.remaining == records[2:]
+
+    del store.messages._write
+    store.append(failure.value.remaining)
+    state = store.load()
+    assert state['chat_history'] == [message(index) for index in range(5)]
+    assert state['performance_data']['dsa_scores'] == [7]
+
+
+def test_profiles_are_separate_and_names_are_validated(tmp_path):
+    alice = get_user_store('alice', root=str(tmp_path))
+    bob = get_user_store('bob', root=str(tmp_path))
+    assert get_user_store('alice', root=str(tmp_path)) is alice
+    alice.append([('score', score(9))])
+
+    assert bob.load()['performance_data']['dsa_scores'] == []
+    assert list_user_ids(root=str(tmp_path)) == ['alice', 'bob']
+    for bad_name in ('../escape', '', '.hidden', 'a/b'):
+        with pytest.raises(ValueError):
+            validate_user_id(bad_name)
+
+
+def test_concurrent_writers_do_not_lose_records(tmp_path):
+    # Separate store objects on one directory behave like separate processes (flock)
+    stores = [small_store(tmp_path) for _ in range(4)]
+
+    def write(worker, store):
+        for index in range(30):
+            store.append([('message', message(worker * 100 + index)), ('score', score(index))])
+
+    threads = [threading.Thread(target=write, args=(worker, store)) for worker, store in enumerate(stores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = UserStore(str(tmp_path)).load()
+    contents = sorted(m['content'] for m in state['chat_history'])
+    assert contents == sorted(f"message {worker * 100 + index}" for worker in range(4) for index in range(30))
+    assert len(state['performance_data']['dsa_scores']) == 120
+
+
+def test_atomic_write_replaces_whole_file(tmp_path):
+    path = tmp_path / "snapshot.bin"
+    atomic_write_bytes(str(path), b"first")
+    atomic_write_bytes(str(path), b"second")
+    assert path.read_bytes() == b"second"
+    assert [p.name for p in tmp_path.iterdir()] == ["snapshot.bin"]
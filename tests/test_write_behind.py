@@ -0,0 +1,101 @@
+"""Coalescing, flushing and error retry of the write-behind writer."""
+import pytest
+
+from user_store import UserStore
+from write_behind import WriteBehindWriter
+
+
+def message(index):
+    return ('message', {'role': 'user', 'content': f"message {index}", 'timestamp': None})
+
+
+class FailingOnce:
+    """Store stand-in whose first append fails"""
+
+    def __init__(self, store):
+        self.store = store
+        self.directory = store.directory
+        self.failures = 1
+
+    def append(self, records, fsync=True):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        self.store.append(records, fsync)
+
+    def sync(self):
+        self.store.sync()
+
+
+def test_close_flushes_pending_records(tmp_path):
+    store = UserStore(str(tmp_path))
+    # A long debounce: only close() can get these written
+    writer = WriteBehindWriter(flush_interval_ms=60000, fsync_interval_ms=60000)
+    writer.submit(store, [message(0), message(1)])
+    writer.submit(store, [message(2)])
+    writer.close()
+
+    assert [m['content'] for m in store.load()['chat_history']] == ["message 0", "message 1", "message 2"]
+    stats = writer.stats()
+    assert stats['queue_depth'] == 0
+    assert stats['fsyncs'] >= 1
+    with pytest.raises(RuntimeError):
+        writer.submit(store, [message(3)])
+
+
+def test_submits_within_the_window_are_coalesced(tmp_path):
+    store = UserStore(str(tmp_path))
+    writer = WriteBehindWriter(flush_interval_ms=60000, fsync_interval_ms=0)
+    try:
+        for index in range(10):
+            writer.submit(store, [message(index)])
+        assert writer.stats()['queue_depth'] == 10
+        assert writer.flush(timeout=5)
+        stats = writer.stats()
+        assert stats['flushes'] == 1
+        assert stats['records_written'] == 10
+        assert len(store.load()['chat_history']) == 10
+    finally:
+        writer.close()
+
+
+def test_failed_write_is_retried_in_order(tmp_path):
+    flaky = FailingOnce(UserStore(str(tmp_path)))
+    writer = WriteBehindWriter(flush_interval_ms=0, fsync_interval_ms=0, retry_delay=0.05)
+    try:
+        writer.submit(flaky, [message(0)])
+        assert writer.flush(timeout=5)
+        writer.submit(flaky, [message(1)])
+        assert writer.flush(timeout=5)
+        assert writer.last_error(flaky) is None
+        assert writer.stats()['errors'] == 1
+        assert [m['content'] for m in flaky.store.load()['chat_history']] == ["message 0", "message 1"]
+    finally:
+        writer.close()
+
+
+def test_partial_append_retries_only_unwritten_records(tmp_path):
+    store = UserStore(str(tmp_path))
+    write = store.events._write
+    failures = [OSError("disk full")]
+
+    def events_write_fails_once(*args):
+        if failures:
+            raise failures.pop()
+        write(*args)
+
+    store.events._write = events_write_fails_once
+    writer = WriteBehindWriter(flush_interval_ms=0, fsync_interval_ms=0, retry_delay=0.05)
+    try:
+        writer.submit(store, [message(0), ('counters', {'session_count': 3, 'total_study_time': 0}), message(1)])
+        assert writer.flush(timeout=5)
+        assert writer.last_error(store) is None
+        stats = writer.stats()
+        assert stats['errors'] == 1
+        assert stats['records_written'] == 3
+        state = store.load()
+        # The messages were written before the events append failed, so the retry must not repeat them
+        assert [m['content'] for m in state['chat_history']] == ["message 0", "message 1"]
+        assert state['session_count'] == 3
+    finally:
+        writer.close()
@@ -0,0 +1,71 @@
+"""Delivery of the global stylesheet (static/theme.css).
+
+The theme used to be a ~250 line <style> block passed to st.markdown, so
+every rerun of every session sent it to the browser again. It now lives in
+static/theme.css, served by Streamlit's static file serving
+(server.enableStaticServing) under a content-hashed URL. Each rerun only
+sends a small loader that puts one <style id="app-theme"> into the page
+head; the loader does nothing once the current version is in place, so the
+stylesheet itself crosses the wire once per browser session.
+
+Streamlit serves .css files as text/plain, which browsers refuse to apply
+through <link rel="stylesheet">, so the loader fetches the text and fills
+the <style> element itself. Without static serving the app falls back to
+the inline <style> block.
+"""
+import hashlib
+import json
+import os
+from typing import Optional, Tuple
+
+THEME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "theme.css")
+STYLE_ELEMENT_ID = "app-theme"
+
+_cached: Optional[Tuple[Tuple[int, int], str, str]] = None
+
+
+def load_theme(path: str = THEME_PATH) -> Tuple[str, str]:
+    """(css, version) for the stylesheet; version is a content hash, re-read when the file changes"""
+    global _cached
+    stat = os.stat(path)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+    if _cached is None or _cached[0] != file_version:
+        with open(path, 'r', encoding='utf-8') as f:
+            css = f.read()
+        _cached = (file_version, css, hashlib.sha256(css.encode('utf-8')).hexdigest()[:12])
+    return _cached[1], _cached[2]
+
+
+def theme_url(version: str, base_url_path: str = "") -> str:
+    """Absolute URL path of the served stylesheet, valid from any page of the app"""
+    prefix = "/" + base_url_path.strip("/") if base_url_path.strip("/") else ""
+    return f"{prefix}/app/static/{os.path.basename(THEME_PATH)}?v={version}"
+
+
+def loader_html(url: str, version: str) -> str:
+    """Script for a components.html iframe that installs the stylesheet in the parent page"""
+    return f"""<script>
+(function () {{
+    const doc = window.parent.document;
+    let style = doc.getElementById({json.dumps(STYLE_ELEMENT_ID)});
+    if (style && style.dataset.version === {json.dumps(version)}) return;
+    if (!style) {{
+        style = doc.createElement("style");
+        style.id = {json.dumps(STYLE_ELEMENT_ID)};
+        doc.head.appendChild(style);
+    }}
+    style.dataset.version = {json.dumps(version)};
+    fetch({json.dumps(url)}).then(function (response) {{
+        if (!response.ok) throw new Error("theme: HTTP " + response.status);
+        return response.text();
+    }}).then(function (css) {{ style.textContent = css; }}).catch(function (error) {{
+        delete style.dataset.version;
+        console.error(error);
+    }});
+}})();
+</script>"""
+
+
+def inline_style(css: str) -> str:
+    """The stylesheet as a <style> block for st.markdown (fallback without static serving)"""
+    return f"<style>\n{css}</style>"
@@ -0,0 +1,522 @@
+"""Append-only storage for user practice data.
+
+Data lives in two segmented JSONL logs under one directory:
+
+- messages: every chat_history entry, one line each, never rewritten
+- events: interview sessions, scores and counter updates, periodically
+  compacted into snapshot.bin (see snapshot_format)
+
+Message segments and interview sessions older than the profile's
+RetentionPolicy move to a compressed, indexed archive tier (see archive).
+
+Saving appends only the records created since the last save, so save cost
+depends on how much changed rather than on the length of the history.
+
+Each user gets their own directory, sharded by a hash of the user id
+(users/<shard>/<user_id>/), so sessions for different users never touch the
+same files. Writes to one user's directory take an exclusive fcntl lock on
+its .lock file, so several server processes can share USER_DATA_DIR; whole
+files (snapshots) are written to a temp file, fsynced and renamed into place.
+"""
+import glob
+import hashlib
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from archive import Archive, RetentionPolicy
+from file_utils import atomic_write_bytes, fsync_directory
+from score_stats import build_score_stats, record_score_stats
+from snapshot_format import (decode_line, decode_snapshot, encode_line, encode_snapshot, upgrade_state,
+                             upgrade_timestamps)
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+SEGMENT_MAX_BYTES = 1024 * 1024
+# Compact once this many closed event segments have accumulated
+COMPACT_AFTER_SEGMENTS = 2
+SHARD_COUNT = 256
+DEFAULT_USER_ID = "default"
+# performance_data score list for each answer category
+SCORE_KEYS = {
+    "DSA": 'dsa_scores',
+    "System Design": 'system_design_scores',
+    "Behavioral": 'behavioral_scores'
+}
+USER_ID_PATTERN = re.compile(r'^[A-Za-z0-9_@-][A-Za-z0-9_.@-]{0,63}$')
+
+
+class AppendError(Exception):
+    """An append that failed part way; remaining holds what was not written
+
+    Everything before remaining reached the log, so a retry appends only
+    remaining and never duplicates a record.
+    """
+
+    def __init__(self, message: str, remaining: List[Any]):
+        super().__init__(message)
+        self.remaining = remaining
+
+
+def validate_user_id(user_id: str) -> str:
+    """Return user_id if it is safe to use as a directory name, else raise ValueError"""
+    if not USER_ID_PATTERN.match(user_id or ""):
+        raise ValueError(
+            "Profile names must be 1-64 characters of letters, digits, '_', '-', '.' or '@'"
+        )
+    return user_id
+
+
+def shard_for(user_id: str) -> str:
+    """Two-hex-digit shard directory for a user id"""
+    digest = hashlib.sha256(user_id.encode("utf-8")).digest()
+    return f"{digest[0] % SHARD_COUNT:02x}"
+
+
+def empty_state() -> Dict[str, Any]:
+    """State of a user with no saved data"""
+    return {
+        'chat_history': [],
+        'interview_sessions': [],
+        'performance_data': {
+            'dsa_scores': [],
+            'system_design_scores': [],
+            'behavioral_scores': [],
+            'timestamps': []
+        },
+        'score_stats': build_score_stats({}),
+        # Score key of each entry in performance_data['timestamps'] (missing for legacy data)
+        'score_keys': [],
+        'session_count': 0,
+        'total_study_time': 0
+    }
+
+
+def apply_record(state: Dict[str, Any], kind: str, data: Any):
+    """Replay one stored record onto a state dict"""
+    if kind == 'message':
+        state['chat_history'].append(data)
+    elif kind == 'session':
+        state['interview_sessions'].append(data)
+    elif kind == 'score':
+        state['performance_data'].setdefault(data['key'], []).append(data['score'])
+        state['performance_data']['timestamps'].append(data['timestamp'])
+        state.setdefault('score_keys', []).append(data['key'])
+        record_score_stats(state['score_stats'], data['key'], data['score'])
+    elif kind == 'counters':
+        state['session_count'] = data.get('session_count', state['session_count'])
+        state['total_study_time'] = data.get('total_study_time', state['total_study_time'])
+
+
+class SegmentedLog:
+    """Numbered JSONL segment files that are only ever appended to"""
+
+    def __init__(self, directory: str, prefix: str, max_bytes: int = SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        # Segments written without fsync since the last sync()
+        self._unsynced = set()
+
+    def _path(self, number: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{number:06d}.jsonl")
+
+    def segments(self) -> List[int]:
+        """Segment numbers in ascending order"""
+        numbers = []
+        for path in glob.glob(os.path.join(self.directory, f"{self.prefix}-*.jsonl")):
+            stem = os.path.basename(path)[len(self.prefix) + 1:-len(".jsonl")]
+            if stem.isdigit():
+                numbers.append(int(stem))
+        return sorted(numbers)
+
+    def append(self, lines: List[str], fsync: bool = True):
+        """Append serialized records to the newest segment, rolling over when it is full
+
+        With fsync=False the data reaches the OS but durability waits for sync().
+        A failed write raises AppendError with the lines that did not reach the log.
+        """
+        if not lines:
+            return
+        numbers = self.segments()
+        number = numbers[-1] if numbers else 1
+        path = self._path(number)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        chunk: List[bytes] = []
+        chunk_bytes = 0
+        written = 0
+        try:
+            for line in lines:
+                if size + chunk_bytes >= self.max_bytes and (size or chunk):
+                    # Large batches (e.g. an import) are spread over several segments
+                    self._write(path, size, chunk, fsync)
+                    written += len(chunk)
+                    number += 1
+                    path, size, chunk, chunk_bytes = self._path(number), 0, [], 0
+                encoded = (line + "\n").encode('utf-8')
+                chunk.append(encoded)
+                chunk_bytes += len(encoded)
+            self._write(path, size, chunk, fsync)
+        except Exception as e:
+            written += self._complete_lines(path, size, chunk)
+            raise AppendError(str(e), lines[written:]) from e
+
+    def _write(self, path: str, size: int, chunk: List[bytes], fsync: bool):
+        payload = b"".join(chunk)
+        with open(path, 'ab') as f:
+            if size and not self._ends_with_newline(path):
+                # Terminate a line torn by a crash so it cannot swallow this record
+                payload = b"\n" + payload
+            f.write(payload)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+            else:
+                self._unsynced.add(path)
+        if not size:
+            fsync_directory(self.directory)
+
+    def _complete_lines(self, path: str, size: int, chunk: List[bytes]) -> int:
+        """How many lines of a failed chunk reached the file whole"""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(size)
+                appended = f.read()
+        except OSError:
+            return 0
+        # Skip the newline that terminates a torn line before the chunk
+        if appended[:1] == b"\n":
+            appended = appended[1:]
+        complete, offset = 0, 0
+        for encoded in chunk:
+            if appended[offset:offset + len(encoded)] != encoded:
+                break
+            complete += 1
+            offset += len(encoded)
+        return complete
+
+    def sync(self):
+        """fsync segments appended to with fsync=False"""
+        while self._unsynced:
+            path = self._unsynced.pop()
+            if os.path.exists(path):
+                with open(path, 'ab') as f:
+                    os.fsync(f.fileno())
+
+    def _ends_with_newline(self, path: str) -> bool:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def read_lines(self, number: int) -> List[str]:
+        """Complete raw lines of one segment (a torn final line is dropped)"""
+        with open(self._path(number), 'r', encoding='utf-8') as f:
+            lines = f.read().split("\n")
+        # The text after the last newline is empty or a torn write
+        return lines[:-1]
+
+    @staticmethod
+    def decode(lines: List[str]) -> Iterator[Tuple[str, Any]]:
+        """Yield (kind, data) for raw lines, skipping undecodable ones"""
+        for line in lines:
+            try:
+                record = decode_line(line)
+            except ValueError:
+                continue
+            yield record['kind'], upgrade_timestamps(record['kind'], record['data'])
+
+    def read(self, number: int) -> Iterator[Tuple[str, Any]]:
+        """Yield (kind, data) from one segment, skipping torn or partial lines"""
+        return self.decode(self.read_lines(number))
+
+    def remove(self, number: int):
+        os.remove(self._path(number))
+
+
+class UserStore:
+    """Append-only store for one user's data directory"""
+
+    def __init__(self, directory: str, policy: Optional[RetentionPolicy] = None):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.policy = policy or RetentionPolicy.from_env()
+        self.archive = Archive(directory)
+        self.messages = SegmentedLog(directory, "messages")
+        self.events = SegmentedLog(directory, "events")
+        self.snapshot_path = os.path.join(directory, "snapshot.bin")
+        self.legacy_snapshot_path = os.path.join(directory, "snapshot.json")
+        self.lock_path = os.path.join(directory, ".lock")
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self, exclusive: bool = True):
+        """Hold the in-process lock and, where available, a cross-process flock"""
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_snapshot(self) -> Tuple[Dict[str, Any], int]:
+        """Return the compacted state and the last event segment folded into it"""
+        path = self.snapshot_path
+        if not os.path.exists(path):
+            path = self.legacy_snapshot_path
+            if not os.path.exists(path):
+                return empty_state(), 0
+        with open(path, 'rb') as f:
+            snapshot, _ = decode_snapshot(f.read())
+        state = snapshot['state']
+        if 'score_stats' not in state:
+            # Snapshots written before aggregates were stored
+            state['score_stats'] = build_score_stats(state['performance_data'], state.get('score_keys', []))
+        state.setdefault('score_keys', [])
+        return state, snapshot['through_segment']
+
+    def _write_snapshot(self, state: Dict[str, Any], through_segment: int):
+        atomic_write_bytes(self.snapshot_path, encode_snapshot({'state': state, 'through_segment': through_segment}))
+        if os.path.exists(self.legacy_snapshot_path):
+            os.remove(self.legacy_snapshot_path)
+
+    def migrate(self):
+        """Rewrite a snapshot.json from older versions in the current binary format"""
+        with self._locked():
+            if os.path.exists(self.legacy_snapshot_path) and not os.path.exists(self.snapshot_path):
+                state, through = self._read_snapshot()
+                self._write_snapshot(state, through)
+
+    def is_empty(self) -> bool:
+        return not (
+            os.path.exists(self.snapshot_path) or os.path.exists(self.legacy_snapshot_path)
+            or self.messages.segments() or self.events.segments()
+        )
+
+    def append(self, records: List[Tuple[str, Any]], fsync: bool = True):
+        """Append (kind, data) records; messages and events go to their own logs
+
+        If a write fails part way, AppendError.remaining lists the records that
+        were not written (empty when only compaction or archiving failed).
+        """
+        message_records, event_records = [], []
+        message_lines, event_lines = [], []
+        for kind, data in records:
+            line = encode_line({'kind': kind, 'data': data})
+            if kind == 'message':
+                message_records.append((kind, data))
+                message_lines.append(line)
+            else:
+                event_records.append((kind, data))
+                event_lines.append(line)
+        with self._locked():
+            try:
+                self.messages.append(message_lines, fsync)
+            except AppendError as e:
+                raise AppendError(str(e), message_records[len(message_records) - len(e.remaining):]
+                                  + event_records) from e
+            try:
+                self.events.append(event_lines, fsync)
+            except AppendError as e:
+                raise AppendError(str(e), event_records[len(event_records) - len(e.remaining):]) from e
+            try:
+                if len(self.events.segments()) > COMPACT_AFTER_SEGMENTS:
+                    self._compact()
+                self._archive_messages()
+            except Exception as e:
+                # The records are in the logs; the next append retries the housekeeping
+                raise AppendError(str(e), []) from e
+
+    def _archive_messages(self):
+        """Move message segments older than the hot window into the archive"""
+        numbers = self.messages.segments()
+        # The newest segment is always kept so segment numbers keep increasing
+        hot = max(self.policy.hot_message_segments, 1)
+        for number in numbers[:max(len(numbers) - hot, 0)]:
+            name = f"messages-{number:06d}"
+            if not self.archive.has(name):
+                lines = self.messages.read_lines(number)
+                self.archive.add_messages(name, lines, [data for _, data in self.messages.decode(lines)])
+            self.messages.remove(number)
+
+    def _archive_sessions(self, state: Dict[str, Any]):
+        """Move interview sessions older than the hot window into the archive"""
+        sessions = state['interview_sessions']
+        excess = len(sessions) - self.policy.hot_sessions
+        if excess > 0:
+            # Archive first: a crash in between duplicates sessions rather than losing them
+            self.archive.add_sessions(self.archive.next_session_file(), sessions[:excess])
+            state['interview_sessions'] = sessions[excess:]
+
+    def sync(self):
+        """Make appends written with fsync=False durable"""
+        with self._locked():
+            self.messages.sync()
+            self.events.sync()
+
+    def load(self, message_limit: Optional[int] = None) -> Dict[str, Any]:
+        """Rebuild the state from the snapshot and both logs
+
+        With message_limit only the latest messages are read; the returned
+        'chat_history_cursor' is passed to read_messages for earlier pages
+        (None when the whole history is loaded).
+        """
+        with self._locked(exclusive=False):
+            state, through = self._read_snapshot()
+            state['chat_history'] = []
+            state['chat_history_cursor'] = None
+            for number in self.events.segments():
+                if number > through:
+                    for kind, data in self.events.read(number):
+                        apply_record(state, kind, data)
+            if message_limit is None:
+                for number in self.messages.segments():
+                    for kind, data in self.messages.read(number):
+                        apply_record(state, kind, data)
+            else:
+                state['chat_history'], state['chat_history_cursor'] = self._read_messages(message_limit, None)
+            state['archived_sessions'] = self.archive.session_count()
+        return state
+
+    def read_messages(self, limit: int, before: Optional[Tuple[int, int]] = None) -> Tuple[List[Any], Optional[Tuple[int, int]]]:
+        """Return up to limit messages ending just before cursor, oldest first
+
+        Also returns the cursor for the page before them, or None once the
+        start of the history is reached. Only the segments the page spans are
+        read; paging continues into the archive once the hot segments run out.
+        """
+        with self._locked(exclusive=False):
+            return self._read_messages(limit, before)
+
+    def _message_segments(self) -> List[Tuple[int, Optional[str]]]:
+        """(segment number, archive file or None while hot) for every message segment, oldest first"""
+        segments: Dict[int, Optional[str]] = {}
+        for file_name in self.archive.message_files():
+            # Archived segments keep their hot name, messages-<number>
+            segments[int(os.path.splitext(file_name)[0].rsplit("-", 1)[1])] = file_name
+        for number in self.messages.segments():
+            # A segment archived but not yet removed is still read from the hot tier
+            segments[number] = None
+        return sorted(segments.items())
+
+    def _read_messages(self, limit: int, before: Optional[Tuple[int, int]]) -> Tuple[List[Any], Optional[Tuple[int, int]]]:
+        segments = self._message_segments()
+        if before is not None:
+            segments = [segment for segment in segments if segment[0] <= before[0]]
+        page: List[Any] = []
+        for position in range(len(segments) - 1, -1, -1):
+            number, file_name = segments[position]
+            if file_name is None:
+                # Only the lines that end up on the page are decoded
+                lines = self.messages.read_lines(number)
+                end = before[1] if before is not None and number == before[0] else len(lines)
+                start = max(0, end - (limit - len(page)))
+                page[:0] = [data for _, data in self.messages.decode(lines[start:end])]
+            else:
+                records = self.archive.read_file(file_name)
+                end = before[1] if before is not None and number == before[0] else len(records)
+                start = max(0, end - (limit - len(page)))
+                page[:0] = records[start:end]
+            if len(page) >= limit:
+                if start == 0 and position == 0:
+                    return page, None
+                # A cursor at the start of a segment makes the next read continue with the one before
+                return page, (number, start)
+        return page, None
+
+    def import_state(self, state: Dict[str, Any]):
+        """Seed an empty store from a full state dict (e.g. the legacy user_data.json)"""
+        with self._locked():
+            numbers = self.events.segments()
+            snapshot_state = empty_state()
+            snapshot_state.update({key: value for key, value in state.items() if key != 'chat_history'})
+            snapshot_state['chat_history'] = []
+            snapshot_state['score_stats'] = build_score_stats(snapshot_state['performance_data'],
+                                                          snapshot_state.get('score_keys', []))
+            upgrade_state(snapshot_state)
+            self._archive_sessions(snapshot_state)
+            self._write_snapshot(snapshot_state, numbers[-1] if numbers else 0)
+            self.messages.append([
+                encode_line({'kind': 'message', 'data': upgrade_timestamps('message', message)})
+                for message in state.get('chat_history', [])
+            ])
+            self._archive_messages()
+
+    def iter_messages(self) -> Iterator[Dict[str, Any]]:
+        """Every message, archived ones first, one segment in memory at a time"""
+        with self._locked(exclusive=False):
+            files = self.archive.message_files()
+            numbers = self.messages.segments()
+        for file_name in files:
+            yield from self.archive.read_file(file_name)
+        for number in numbers:
+            try:
+                lines = self.messages.read_lines(number)
+            except FileNotFoundError:
+                # Archived after the listing was taken
+                yield from self.archive.read_segment(f"messages-{number:06d}")
+                continue
+            for _, data in self.messages.decode(lines):
+                yield data
+
+    def compact(self):
+        """Fold all closed event segments into the snapshot"""
+        with self._locked():
+            self._compact()
+
+    def _compact(self):
+        numbers = self.events.segments()
+        closed = numbers[:-1]
+        if not closed:
+            return
+        state, through = self._read_snapshot()
+        state['chat_history'] = []
+        for number in closed:
+            if number > through:
+                for kind, data in self.events.read(number):
+                    apply_record(state, kind, data)
+
+        self._archive_sessions(state)
+        self._write_snapshot(state, closed[-1])
+
+        # The snapshot now covers these segments, so they can go
+        for number in closed:
+            self.events.remove(number)
+
+
+def list_user_ids(root: Optional[str] = None) -> List[str]:
+    """Profiles that have a data directory under root"""
+    root = os.path.abspath(root or os.getenv('USER_DATA_DIR', 'user_data'))
+    return sorted(
+        os.path.basename(path) for path in glob.glob(os.path.join(root, "users", "*", "*"))
+        if os.path.isdir(path)
+    )
+
+
+_stores: Dict[str, UserStore] = {}
+_stores_lock = threading.Lock()
+
+
+def user_directory(user_id: str, root: Optional[str] = None) -> str:
+    """Sharded data directory for a user under root (USER_DATA_DIR by default)"""
+    root = os.path.abspath(root or os.getenv('USER_DATA_DIR', 'user_data'))
+    user_id = validate_user_id(user_id)
+    return os.path.join(root, "users", shard_for(user_id), user_id)
+
+
+def get_user_store(user_id: str = DEFAULT_USER_ID, root: Optional[str] = None) -> UserStore:
+    """Return the shared store for one user's data"""
+    directory = user_directory(user_id, root)
+    with _stores_lock:
+        if directory not in _stores:
+            _stores[directory] = UserStore(directory)
+            _stores[directory].migrate()
+        return _stores[directory]
@@ -0,0 +1,50 @@
+"""Memoized DataFrames and Plotly figures for the analytics pages.
+
+Streamlit reruns the whole script on every widget interaction, and the
+dashboard, progress and live interview pages used to rebuild their pandas
+DataFrames and Plotly figures from the full score and session history each
+time. ViewCache keeps every derived value together with the data version it
+was built from. The app bumps that version only when scores or interview
+sessions change, so other reruns reuse the cached objects.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class ViewCache:
+    """Derived values by name, rebuilt when their data version changes"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        # name -> (version, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Hashable, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, version: Hashable, build: Callable[[], Any]) -> Any:
+        """Cached value for name if it was built at version, otherwise build() and cache it"""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = build()
+        self._entries[name] = (version, value)
+        self._entries.move_to_end(name)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,200 @@
+"""Background write-behind persistence for the user store.
+
+save_user_data hands its records to a single writer thread instead of
+writing on the script thread. Records submitted within the debounce window
+are coalesced into one append per user store, and logs are fsynced at most
+every fsync_interval_ms (0 fsyncs every write). Pending records are flushed
+when the process exits.
+"""
+import atexit
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from user_store import AppendError, UserStore
+
+
+class WriteBehindWriter:
+    """Debounced, coalescing background writer with flush-lag and queue-depth metrics"""
+
+    def __init__(self, flush_interval_ms: float = 250, fsync_interval_ms: float = 1000,
+                 retry_delay: float = 1.0):
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.fsync_interval = fsync_interval_ms / 1000.0
+        self.retry_delay = retry_delay
+        self._condition = threading.Condition()
+        # directory -> (store, records, first queued at)
+        self._pending: Dict[str, Tuple[UserStore, List[Tuple[str, Any]], float]] = {}
+        # Stores written since their last fsync
+        self._unsynced: Dict[str, UserStore] = {}
+        self._last_fsync = time.monotonic()
+        self._writing = 0
+        self._errors: Dict[str, str] = {}
+        self._closed = False
+        self._counters = {
+            'submits': 0,
+            'flushes': 0,
+            'records_written': 0,
+            'fsyncs': 0,
+            'errors': 0,
+            'last_flush_lag_ms': 0.0,
+            'max_flush_lag_ms': 0.0
+        }
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, store: UserStore, records: List[Tuple[str, Any]]):
+        """Queue records for store; returns immediately"""
+        if not records:
+            return
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Write-behind writer is closed")
+            entry = self._pending.get(store.directory)
+            if entry is None:
+                self._pending[store.directory] = (store, list(records), time.monotonic())
+            else:
+                entry[1].extend(records)
+            self._counters['submits'] += 1
+            self._condition.notify_all()
+
+    def last_error(self, store: UserStore) -> Optional[str]:
+        """Most recent write error for store, cleared once a write succeeds"""
+        with self._condition:
+            return self._errors.get(store.directory)
+
+    def _due(self, now: float) -> Tuple[List[str], float]:
+        """Directories ready to write and seconds until the next one is"""
+        ready, wait = [], None
+        for directory, (_, _, queued_at) in self._pending.items():
+            remaining = queued_at + self.flush_interval - now
+            if remaining <= 0 or self._closed:
+                ready.append(directory)
+            else:
+                wait = remaining if wait is None else min(wait, remaining)
+        if self._unsynced:
+            remaining = self._last_fsync + self.fsync_interval - now
+            wait = remaining if wait is None else min(wait, remaining)
+        return ready, wait
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    ready, wait = self._due(time.monotonic())
+                    if ready or (self._unsynced and (self._closed or wait <= 0)):
+                        break
+                    if self._closed and not self._pending and not self._unsynced:
+                        return
+                    self._condition.wait(timeout=wait)
+                batches = [self._pending.pop(directory) for directory in ready]
+                self._writing += len(batches)
+
+            for store, records, queued_at in batches:
+                self._write(store, records, queued_at)
+
+            with self._condition:
+                self._writing -= len(batches)
+                self._condition.notify_all()
+            self._maybe_fsync()
+
+    def _write(self, store: UserStore, records: List[Tuple[str, Any]], queued_at: float):
+        try:
+            store.append(records, fsync=self.fsync_interval <= 0)
+        except Exception as e:
+            # Records an append wrote before failing must not be written again
+            remaining = e.remaining if isinstance(e, AppendError) else records
+            with self._condition:
+                self._counters['errors'] += 1
+                self._counters['records_written'] += len(records) - len(remaining)
+                self._errors[store.directory] = str(e)
+                if self._closed or not remaining:
+                    return
+                # Put the rest back ahead of anything queued since, and retry later
+                entry = self._pending.get(store.directory)
+                newer = entry[1] if entry else []
+                retry_at = time.monotonic() + self.retry_delay - self.flush_interval
+                self._pending[store.directory] = (store, remaining + newer, retry_at)
+            return
+
+        lag_ms = (time.monotonic() - queued_at) * 1000
+        with self._condition:
+            self._errors.pop(store.directory, None)
+            if self.fsync_interval > 0:
+                self._unsynced[store.directory] = store
+            self._counters['flushes'] += 1
+            self._counters['records_written'] += len(records)
+            self._counters['last_flush_lag_ms'] = round(lag_ms, 1)
+            self._counters['max_flush_lag_ms'] = round(max(self._counters['max_flush_lag_ms'], lag_ms), 1)
+
+    def _maybe_fsync(self):
+        with self._condition:
+            if not self._unsynced:
+                return
+            if not self._closed and time.monotonic() - self._last_fsync < self.fsync_interval:
+                return
+            stores = list(self._unsynced.values())
+            self._unsynced.clear()
+            self._last_fsync = time.monotonic()
+        for store in stores:
+            try:
+                store.sync()
+                with self._condition:
+                    self._counters['fsyncs'] += 1
+            except Exception as e:
+                with self._condition:
+                    self._counters['errors'] += 1
+                    self._errors[store.directory] = str(e)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything queued now and wait for it; False if timeout expired first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            # Make pending batches due immediately
+            self._pending = {
+                directory: (store, records, queued_at - self.flush_interval)
+                for directory, (store, records, queued_at) in self._pending.items()
+            }
+            self._condition.notify_all()
+            while self._pending or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Flush and fsync everything, then stop the writer thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return write counters plus current queue depth and flush lag"""
+        now = time.monotonic()
+        with self._condition:
+            stats = dict(self._counters)
+            stats['queue_depth'] = sum(len(records) for _, records, _ in self._pending.values())
+            stats['pending_stores'] = len(self._pending)
+            oldest = min((queued_at for _, _, queued_at in self._pending.values()), default=None)
+        stats['current_lag_ms'] = round(max(now - oldest, 0) * 1000, 1) if oldest is not None else 0.0
+        return stats
+
+
+_default_writer = None
+_default_writer_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehindWriter:
+    """Return the process-wide writer, configured from the environment and flushed at exit"""
+    global _default_writer
+    with _default_writer_lock:
+        if _default_writer is None:
+            _default_writer = WriteBehindWriter(
+                flush_interval_ms=float(os.getenv('USER_DATA_FLUSH_MS', '250')),
+                fsync_interval_ms=float(os.getenv('USER_DATA_FSYNC_MS', '1000'))
+            )
+            atexit.register(_default_writer.close)
+        return _default_writer